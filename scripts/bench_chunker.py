@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chunker Benchmark - 번역 요청 분할 방식 비교
+===========================================
+Pangea 원문 코퍼스를 korean_patch가 번역 요청으로 나누는 방식 두 가지로 분할하여
+요청 수와 청크 채움률(청크 길이 / max_length)을 비교합니다. 번역 API는 호출하지 않습니다.
+chunker의 청크(와 iter_sentences의 문장 조각)와 구분자를 이어 붙이면 원문과 같은지도 코퍼스와 경계 사례로 확인하며,
+다르면 종료 코드 1로 실패합니다.
+
+- legacy:  기존 방식 ('\\n'을 ' [NEWLINE] '로 바꾼 뒤 '. '로 나눠 이어 붙임)
+- chunker: text_chunker.iter_chunks (문단 -> 문장 -> 단어 순으로 max_length에 맞춰 채움)
+
+사용법:
+-------
+    python bench_chunker.py                           # src/constants/pangea_data.json
+    python bench_chunker.py ../src/constants/reptifiles_data.json --max-length 4500
+"""
+
+import argparse
+import json
+import statistics
+from pathlib import Path
+
+from text_chunker import iter_chunks, iter_sentences
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+DEFAULT_CORPUS = SCRIPT_DIR.parent / "src" / "constants" / "pangea_data.json"
+DEFAULT_MAX_LENGTH = 4500
+
+# 원문 복원 확인용 경계 사례 (문단 끝 공백, 연속 공백, 줄바꿈만 있는 텍스트 등)
+ROUND_TRIP_CASES = [
+    "", " ", "\n", "a. ", "a.  ", " a. b. ", "a.\n\n", "\n\na. b.\n", "One. Two!  Three?\n\nFour.  \n",
+    "word " * 30, "x" * 25, "Long sentence without end " * 5 + "\n  \n" + "Next. " * 8,
+]
+ROUND_TRIP_LENGTHS = (1, 2, 3, 7, 20, 100)
+
+
+def legacy_chunks(text: str, max_length: int) -> list[str]:
+    """기존 translate_text의 긴 텍스트 분할 (비교용)."""
+    sentences = text.replace('\n', ' [NEWLINE] ').split('. ')
+    chunks = []
+    current_chunk = ""
+    for sentence in sentences:
+        if len(current_chunk) + len(sentence) < max_length:
+            current_chunk += sentence + ". "
+        else:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+            current_chunk = sentence + ". "
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def split(text: str, max_length: int, method: str) -> list[str]:
+    """translate_text와 같이 max_length 이하의 텍스트는 한 요청으로 보냄."""
+    if len(text) <= max_length:
+        return [text]
+    if method == "legacy":
+        return legacy_chunks(text, max_length)
+    return [chunk for chunk, _ in iter_chunks(text, max_length)]
+
+
+def round_trip_failures(texts: list[str], max_lengths) -> list[tuple[str, int]]:
+    """청크(또는 문장 조각) + 구분자를 이어 붙인 결과가 원문과 다른 (텍스트, max_length) 목록."""
+    return [
+        (text, max_length)
+        for text in texts
+        for max_length in max_lengths
+        for split_text in (iter_chunks, iter_sentences)
+        if "".join(piece + separator for piece, separator in split_text(text, max_length)) != text
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="번역 요청 분할 방식 비교 (요청 수 / 채움률)")
+    parser.add_argument("corpus", nargs="?", type=Path, default=DEFAULT_CORPUS,
+                        help=f"원문 JSON (기본: {DEFAULT_CORPUS.name})")
+    parser.add_argument("--max-length", type=int, default=DEFAULT_MAX_LENGTH, help="요청당 최대 글자 수")
+    args = parser.parse_args()
+
+    if not args.corpus.exists():
+        print(f"[ERROR] 파일을 찾을 수 없습니다: {args.corpus}")
+        return 2
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    items = data.get("articles", []) + data.get("chapters", []) + data.get("morphs", [])
+    texts = [item.get("content") or item.get("description") or "" for item in items]
+    texts = [text for text in texts if text.strip()]
+    long_texts = [text for text in texts if len(text) > args.max_length]
+
+    print("=" * 60)
+    print("✂️  번역 요청 분할 비교")
+    print(f"   코퍼스 {args.corpus.name}: 본문 {len(texts)}개 (max_length 초과 {len(long_texts)}개), "
+          f"{sum(map(len, texts)):,}자")
+    print("=" * 60)
+
+    counts = {}
+    print(f"\n{'방식':<8} {'요청 수':>8} {'분할 본문 요청':>12} {'채움률 p50':>10} {'최대 청크':>8} {'초과':>4}")
+    for method in ("legacy", "chunker"):
+        chunks = [split(text, args.max_length, method) for text in texts]
+        split_chunks = [chunk for text_chunks in chunks if len(text_chunks) > 1 for chunk in text_chunks]
+        fill = [len(chunk) / args.max_length for chunk in split_chunks] or [0.0]
+        longest = max((len(chunk) for text_chunks in chunks for chunk in text_chunks), default=0)
+        over = sum(len(chunk) > args.max_length for text_chunks in chunks for chunk in text_chunks)
+        counts[method] = sum(map(len, chunks))
+        print(f"{method:<8} {counts[method]:>8} {len(split_chunks):>12} {statistics.median(fill):>9.0%} "
+              f"{longest:>8} {over:>4}")
+
+    saved = counts["legacy"] - counts["chunker"]
+    print(f"\n요청 {saved}회 절약 ({saved / counts['legacy']:.0%})" if counts["legacy"] else "")
+
+    failures = (round_trip_failures(texts, (args.max_length,))
+                + round_trip_failures(ROUND_TRIP_CASES, ROUND_TRIP_LENGTHS))
+    if failures:
+        text, max_length = failures[0]
+        print(f"❌ 원문 복원 실패 {len(failures)}건 (예: {text[:40]!r}, max_length={max_length})")
+        return 1
+    print(f"✅ 원문 복원 확인: 코퍼스 {len(texts)}개 + 경계 사례 {len(ROUND_TRIP_CASES)}개 x {len(ROUND_TRIP_LENGTHS)}가지 길이")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
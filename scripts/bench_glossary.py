@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Glossary Benchmark - 용어 사전 치환 방식 비교
+============================================
+korean_patch의 용어 사전(REPTILE_GLOSSARY)으로 번역된 Pangea 코퍼스를 치환하며
+두 방식을 비교합니다.
+
+- sequential: 기존 방식 (용어마다 str.replace로 전체 텍스트 복사)
+- single-pass: glossary_replacer (트라이 정규식 한 번 훑기, 가장 긴 용어 우선)
+
+결과가 달라진 텍스트 수와 첫 번째 차이도 함께 출력합니다
+(기존 방식은 짧은 용어가 먼저 바뀌어 "incomplete dominant" 같은 긴 용어를 놓칠 수 있음).
+
+사용법:
+-------
+    python bench_glossary.py                          # src/constants/pangea_data_ko.json
+    python bench_glossary.py path/to/data.json --repeat 20
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+DEFAULT_CORPUS = SCRIPT_DIR.parent / "src" / "constants" / "pangea_data_ko.json"
+
+
+def load_corpus(path: Path) -> list[str]:
+    """번역 결과 JSON의 게시글 제목 / 요약 / 본문 (또는 모프 설명)을 텍스트 목록으로 반환."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    texts = []
+    for item in data.get("articles", []) + data.get("morphs", []):
+        texts.extend(item.get(field) or "" for field in ("title", "summary", "content", "description"))
+    return [text for text in texts if text]
+
+
+def measure(replace, texts: list[str], repeat: int) -> list[float]:
+    """코퍼스 전체 치환 시간(초)을 repeat회 측정."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            replace(text)
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def first_difference(a: str, b: str, context: int = 30) -> tuple[str, str]:
+    index = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+    start = max(0, index - context)
+    return a[start:index + context], b[start:index + context]
+
+
+def main():
+    from korean_patch import REPTILE_GLOSSARY
+    from glossary_replacer import GlossaryReplacer
+
+    parser = argparse.ArgumentParser(description="용어 사전 치환 방식 벤치마크")
+    parser.add_argument("corpus", nargs="?", type=Path, default=DEFAULT_CORPUS,
+                        help=f"번역 결과 JSON (기본: {DEFAULT_CORPUS.name})")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    args = parser.parse_args()
+
+    if not args.corpus.exists():
+        print(f"[ERROR] 파일을 찾을 수 없습니다: {args.corpus}")
+        return
+    texts = load_corpus(args.corpus)
+
+    started = time.perf_counter()
+    replacer = GlossaryReplacer(REPTILE_GLOSSARY)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    total_chars = sum(map(len, texts))
+    print("=" * 60)
+    print("📖 용어 사전 치환 벤치마크")
+    print(f"   코퍼스 {args.corpus.name}: 텍스트 {len(texts)}개, {total_chars:,}자 x {args.repeat}회")
+    print(f"   용어 {len(REPTILE_GLOSSARY)}개 (대소문자 형태 포함 {len(replacer.table)}개), "
+          f"컴파일 {build_ms:.2f}ms")
+    print("=" * 60)
+
+    results = {
+        "sequential": measure(replacer.sequential_replace, texts, args.repeat),
+        "single-pass": measure(replacer.replace, texts, args.repeat),
+    }
+    baseline = statistics.median(results["sequential"])
+
+    print(f"\n{'방식':<12} {'p50':>10} {'최소':>10} {'처리량':>12} {'배속':>6}")
+    for name, times in results.items():
+        median = statistics.median(times)
+        print(f"{name:<12} {median * 1000:>8.2f}ms {min(times) * 1000:>8.2f}ms "
+              f"{total_chars / median / 1024 / 1024:>8.1f}MB/s {baseline / median:>5.1f}x")
+
+    changed = [(replacer.sequential_replace(text), replacer.replace(text)) for text in texts]
+    changed = [pair for pair in changed if pair[0] != pair[1]]
+    print(f"\n결과가 달라진 텍스트: {len(changed)}/{len(texts)}개")
+    if changed:
+        before, after = first_difference(*changed[0])
+        print(f"   sequential : ...{before}...")
+        print(f"   single-pass: ...{after}...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML Parser Benchmark - 파서 백엔드별 파싱 속도 / 메모리 비교
+============================================================
+저장된 Pangea / MorphMarket 페이지로 html_parser 백엔드들을 비교합니다.
+
+- parse: HTML 문자열 -> 문서 트리 생성 시간
+- query: 스크래퍼가 사용하는 셀렉터 캐스케이드(select_one / select / get_text) 실행 시간
+- 최대 메모리: 백엔드마다 별도 프로세스에서 측정 (tracemalloc 최대치, 가능하면 RSS 증가량)
+
+selectolax가 설치되어 있으면 CSS 셀렉터 기반 파서(selectolax, BeautifulSoup 비호환)도
+참고용으로 함께 측정합니다.
+
+사용법:
+-------
+    python bench_html_parsers.py                     # scripts/.http_cache/*.body 사용
+    python bench_html_parsers.py pages/ a.html ...   # 지정한 HTML 파일/폴더 사용
+    python bench_html_parsers.py --repeat 5
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+DEFAULT_PAGE_DIR = SCRIPT_DIR / ".http_cache"
+
+# pangea_scraper / morph_scraper의 셀렉터 캐스케이드
+QUERY_SELECTORS = [
+    # Pangea 목록 / 본문
+    "article.article", ".blog-post", ".article-item", ".blog-article",
+    ".article__content", ".blog-content", ".rte", ".article-content", "article .content", ".post-content",
+    # MorphMarket 목록 / 상세
+    "a[href*='/morphpedia/crested-geckos/']", ".trait-card a", "[class*='TraitCard'] a",
+    ".trait-description", ".description", "[class*='Description']", ".content p", "article p", "main p",
+    ".trait-type", ".inheritance", "[class*='Type']", ".badge", ".tag",
+]
+
+
+def load_pages(paths: list[str]) -> list[str]:
+    """HTML 파일(또는 폴더 안의 *.html, *.htm, *.body)을 읽어 문자열 목록으로 반환."""
+    files = []
+    for path in map(Path, paths or [DEFAULT_PAGE_DIR]):
+        if path.is_dir():
+            for pattern in ("*.html", "*.htm", "*.body"):
+                files.extend(sorted(path.glob(pattern)))
+        elif path.exists():
+            files.append(path)
+    return [file.read_bytes().decode("utf-8", errors="replace") for file in files]
+
+
+def run_soup_backend(backend: str, pages: list[str], repeat: int) -> tuple[list[float], list[float]]:
+    """BeautifulSoup 백엔드로 (parse 시간 목록, query 시간 목록) 측정."""
+    import html_parser
+
+    html_parser.set_backend(backend)
+    parse_times, query_times = [], []
+
+    for _ in range(repeat):
+        for html in pages:
+            started = time.perf_counter()
+            soup = html_parser.make_soup(html)
+            parse_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for selector in QUERY_SELECTORS:
+                elem = soup.select_one(selector)
+                if elem is not None:
+                    elem.get_text()
+            soup.select("a[href]")
+            soup.find_all(["h1", "h2", "h3", "h4"])
+            query_times.append(time.perf_counter() - started)
+
+    return parse_times, query_times
+
+
+def run_selectolax(pages: list[str], repeat: int) -> tuple[list[float], list[float]]:
+    """selectolax(Lexbor) 파서로 같은 작업을 측정 (참고용)."""
+    from selectolax.lexbor import LexborHTMLParser
+
+    parse_times, query_times = [], []
+
+    for _ in range(repeat):
+        for html in pages:
+            started = time.perf_counter()
+            tree = LexborHTMLParser(html)
+            parse_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for selector in QUERY_SELECTORS:
+                node = tree.css_first(selector)
+                if node is not None:
+                    node.text()
+            tree.css("a[href]")
+            tree.css("h1, h2, h3, h4")
+            query_times.append(time.perf_counter() - started)
+
+    return parse_times, query_times
+
+
+def measure(backend: str, pages: list[str], repeat: int, queue) -> None:
+    """별도 프로세스에서 실행: 시간과 최대 메모리를 측정하여 queue로 전달."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        resource = None
+
+    if backend == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser  # noqa: F401
+    else:
+        import bs4  # noqa: F401
+        import html_parser  # noqa: F401
+        if backend == "lxml":
+            import lxml.etree  # noqa: F401
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    tracemalloc.start()
+
+    if backend == "selectolax":
+        parse_times, query_times = run_selectolax(pages, repeat)
+    else:
+        parse_times, query_times = run_soup_backend(backend, pages, repeat)
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+
+    queue.put({
+        "backend": backend,
+        "parse": parse_times,
+        "query": query_times,
+        "tracemalloc_peak_kb": peak / 1024,
+        # Linux의 ru_maxrss 단위는 KB
+        "rss_growth_kb": (rss_after - rss_before) if resource else None,
+    })
+
+
+def available_backends() -> list[str]:
+    backends = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        backends.insert(0, "lxml")
+    except ImportError:
+        print("[INFO] lxml 미설치 - lxml 측정 생략 (pip install lxml)")
+    try:
+        import selectolax  # noqa: F401
+        backends.append("selectolax")
+    except ImportError:
+        print("[INFO] selectolax 미설치 - CSS 네이티브 파서 측정 생략 (pip install selectolax)")
+    return backends
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument("paths", nargs="*", help="HTML 파일 또는 폴더 (기본: scripts/.http_cache)")
+    parser.add_argument("--repeat", type=int, default=3, help="페이지 묶음 반복 횟수")
+    args = parser.parse_args()
+
+    pages = load_pages(args.paths)
+    if not pages:
+        print("[ERROR] 측정할 HTML 페이지가 없습니다. 스크래퍼를 한 번 실행하거나 경로를 지정하세요.")
+        return
+
+    total_mb = sum(len(page) for page in pages) / 1024 / 1024
+    print("=" * 60)
+    print("🧪 HTML 파서 벤치마크")
+    print(f"   페이지 {len(pages)}개 ({total_mb:.1f}MB) x {args.repeat}회")
+    print("=" * 60)
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for backend in available_backends():
+        queue = context.Queue()
+        process = context.Process(target=measure, args=(backend, pages, args.repeat, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+
+    baseline = next((r for r in results if r["backend"] == "html.parser"), results[0])
+    baseline_total = sum(baseline["parse"])
+
+    print(f"\n{'백엔드':<12} {'parse 합계':>10} {'parse p50':>10} {'query 합계':>10} "
+          f"{'배속':>6} {'tracemalloc':>12} {'RSS 증가':>10}")
+    for r in results:
+        parse_total = sum(r["parse"])
+        rss = f"{r['rss_growth_kb'] / 1024:.1f}MB" if r["rss_growth_kb"] is not None else "-"
+        print(f"{r['backend']:<12} {parse_total:>9.3f}s {statistics.median(r['parse']) * 1000:>8.2f}ms "
+              f"{sum(r['query']):>9.3f}s {baseline_total / parse_total:>5.1f}x "
+              f"{r['tracemalloc_peak_kb'] / 1024:>10.1f}MB {rss:>10}")
+
+    print("\n※ selectolax는 BeautifulSoup API와 호환되지 않아 참고용입니다 (스크래퍼는 lxml / html.parser 사용).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scraper Benchmark - 스크래퍼 단계별 처리량 벤치마크
+===================================================
+fixture_server로 보관된 페이지를 재생하면서 세 스크래퍼(pangea, morph, reptifiles)의
+HTTP 수집 경로를 단계별로 측정합니다. 실제 사이트에는 접속하지 않습니다.
+
+- listing: 상세 URL 발견 (스크래퍼와 같은 순서: pangea는 목록 페이지 + sitemap lastmod, reptifiles는 메인 페이지 우선)
+- fetch:   상세 페이지 HTTP 요청 (http_client.get_text)
+- parse:   HTML -> BeautifulSoup (html_parser.make_soup)
+- clean_text: 텍스트 정리 (pangea/morph의 clean_text, reptifiles의 visible_text)
+- extract: 셀렉터 캐스케이드 등 나머지 추출 (clean_text 시간 제외)
+- save:    결과 JSON 저장 (crawl_journal.write_json_stream)
+
+사이트마다 별도 프로세스에서 실행하여 최대 RSS를 따로 측정하고, 결과는
+scripts/.bench/에 JSON으로 저장합니다. 기준 결과(baseline)보다 pages/sec가
+--threshold % 넘게 떨어진 사이트가 있으면 종료 코드 1로 실패합니다.
+측정 프로세스가 예외로 실패하거나 결과 없이 종료되거나 --timeout을 넘기면 해당 사이트는
+오류로 기록되고, 역시 종료 코드 1로 실패합니다.
+
+사용법:
+-------
+    python bench_scrapers.py                          # 전체 사이트, 기준 결과와 비교
+    python bench_scrapers.py --site pangea --repeat 5
+    python bench_scrapers.py --latency 0.05 --threshold 15
+    python bench_scrapers.py --update-baseline        # 이번 결과를 기준으로 저장
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import queue as queue_module
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BENCH_DIR = SCRIPT_DIR / ".bench"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+DEFAULT_THRESHOLD = 10.0  # pages/sec 허용 하락폭 (%)
+DEFAULT_TIMEOUT = 600.0  # 사이트별 측정 제한 시간 (초)
+POLL_INTERVAL = 1.0  # 측정 프로세스 생존 확인 간격 (초)
+
+STAGES = ("listing", "fetch", "parse", "clean_text", "extract", "save")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def site_pipeline(site: str):
+    """
+    사이트별 (스크래퍼 모듈, 목록 함수, 추출 함수, 텍스트 정리 함수 이름, 결과 목록 키)를 반환.
+    목록 함수: soup 로더 -> [{url, ...}], 추출 함수: (항목, soup) -> 레코드
+    """
+    if site == "pangea":
+        import requests
+
+        import pangea_scraper as scraper
+
+        def discover(load_soup):
+            # 스크래퍼와 같이 목록 페이지 순서에 sitemap lastmod를 붙임 (목록 페이지가 없으면 sitemap만)
+            try:
+                first_soup = load_soup(scraper.BLOG_URL)
+            except requests.RequestException:
+                first_soup = None
+            return scraper.discover_articles(first_soup, fetch_page=load_soup)
+
+        def extract(article, soup):
+            content = scraper.extract_article_content(soup, article["url"])
+            return {"title": scraper.article_title(article, soup), "url": article["url"], "content": content}
+
+        return scraper, discover, extract, "clean_text", "articles"
+
+    if site == "morph":
+        import morph_scraper as scraper
+
+        def discover(load_soup):
+            return scraper.extract_morph_links(load_soup(scraper.MORPHPEDIA_URL))
+
+        def extract(morph, soup):
+            description, morph_type = scraper.parse_morph_detail(soup, morph["url"])
+            return scraper.morph_record(morph, morph_type, description)
+
+        return scraper, discover, extract, "clean_text", "morphs"
+
+    import requests
+
+    import reptifiles_scraper as scraper
+
+    def discover(load_soup):
+        # 스크래퍼와 같이 메인 페이지 우선, 챕터를 못 찾으면 sitemap
+        try:
+            links = scraper.extract_chapter_links(load_soup(scraper.MAIN_URL))
+        except requests.RequestException:
+            links = []
+        if not links and scraper.USE_SITEMAP:
+            links = scraper.get_chapter_links_from_sitemap()
+        return links
+
+    def extract(item, soup):
+        title = scraper.chapter_title(soup)
+        return scraper.chapter_record(item, scraper.format_blocks(scraper.blocks_from_soup(soup)), title)
+
+    return scraper, discover, extract, "visible_text", "chapters"
+
+
+def run_site(site: str, base_url: str, repeat: int) -> dict:
+    """한 사이트의 단계별 소요 시간(초) 목록과 처리한 페이지 수를 측정."""
+    import http_client
+    from crawl_journal import write_json_stream
+    from html_parser import make_soup
+
+    scraper, discover, extract, text_func_name, list_key = site_pipeline(site)
+    scraper.use_base_url(base_url)
+    times = {stage: [] for stage in STAGES}
+
+    # 텍스트 정리 함수를 감싸 호출 시간을 따로 누적 (추출 시간에서 제외)
+    text_func = getattr(scraper, text_func_name)
+    text_time = [0.0]
+
+    def timed_text_func(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return text_func(*args, **kwargs)
+        finally:
+            text_time[0] += time.perf_counter() - started
+
+    setattr(scraper, text_func_name, timed_text_func)
+
+    def load_soup(url):
+        return make_soup(http_client.get_text(url))
+
+    pages = 0
+    started_all = time.perf_counter()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        items = discover(load_soup)
+        times["listing"].append(time.perf_counter() - started)
+
+        records = []
+        for item in items:
+            started = time.perf_counter()
+            try:
+                html = http_client.get_text(item["url"])
+            except Exception as e:
+                print(f"   [{site}] 요청 실패: {item['url']} ({type(e).__name__})")
+                continue
+            times["fetch"].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            soup = make_soup(html)
+            times["parse"].append(time.perf_counter() - started)
+
+            text_time[0] = 0.0
+            started = time.perf_counter()
+            records.append(extract(item, soup))
+            elapsed = time.perf_counter() - started
+            times["clean_text"].append(text_time[0])
+            times["extract"].append(elapsed - text_time[0])
+            pages += 1
+
+        started = time.perf_counter()
+        output = BENCH_DIR / f"{site}_output.json"
+        write_json_stream(output, {"source": site}, list_key, iter(records), len(records))
+        times["save"].append(time.perf_counter() - started)
+        output.unlink()
+
+    return {"pages": pages, "elapsed": time.perf_counter() - started_all, "times": times}
+
+
+def measure(site: str, base_url: str, repeat: int, queue) -> None:
+    """별도 프로세스에서 실행: 단계별 시간과 최대 RSS를 queue로 전달."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        resource = None
+
+    try:
+        result = run_site(site, base_url, repeat)
+    except Exception as e:
+        traceback.print_exc()
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+        return
+    # Linux의 ru_maxrss 단위는 KB
+    result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource else None
+    queue.put(result)
+
+
+def wait_result(process, queue, timeout: float) -> dict:
+    """
+    측정 프로세스의 결과를 기다림. 프로세스가 결과 없이 종료되거나
+    timeout(초)을 넘기면 {"error": ...}를 반환 (넘긴 경우 프로세스를 종료).
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return queue.get(timeout=POLL_INTERVAL)
+        except queue_module.Empty:
+            pass
+        if not process.is_alive():
+            # 종료 직전에 넣은 결과가 아직 전달 중일 수 있음
+            try:
+                return queue.get(timeout=POLL_INTERVAL)
+            except queue_module.Empty:
+                return {"error": f"측정 프로세스가 결과 없이 종료됨 (exitcode {process.exitcode})"}
+        if time.monotonic() > deadline:
+            process.terminate()
+            return {"error": f"제한 시간 {timeout:g}초 초과"}
+
+
+def summarize(result: dict) -> dict:
+    """단계별 시간 목록을 합계 / p50 / p95 (ms)로 요약."""
+    stages = {}
+    for stage, values in result["times"].items():
+        if not values:
+            continue
+        stages[stage] = {
+            "count": len(values),
+            "total_s": round(sum(values), 4),
+            "p50_ms": round(percentile(values, 50) * 1000, 3),
+            "p95_ms": round(percentile(values, 95) * 1000, 3),
+        }
+    elapsed = result["elapsed"]
+    return {
+        "pages": result["pages"],
+        "elapsed_s": round(elapsed, 3),
+        "pages_per_sec": round(result["pages"] / elapsed, 2) if elapsed else 0.0,
+        "peak_rss_mb": round(result["peak_rss_mb"], 1) if result["peak_rss_mb"] is not None else None,
+        "stages": stages,
+    }
+
+
+def print_site(site: str, summary: dict) -> None:
+    rss = f"{summary['peak_rss_mb']:.1f}MB" if summary["peak_rss_mb"] is not None else "-"
+    print(f"\n🦎 {site}: {summary['pages']}페이지, {summary['pages_per_sec']:.2f} pages/sec, 최대 RSS {rss}")
+    print(f"   {'단계':<11} {'횟수':>6} {'합계':>9} {'p50':>10} {'p95':>10}")
+    for stage in STAGES:
+        stats = summary["stages"].get(stage)
+        if stats:
+            print(f"   {stage:<11} {stats['count']:>6} {stats['total_s']:>8.3f}s "
+                  f"{stats['p50_ms']:>8.2f}ms {stats['p95_ms']:>8.2f}ms")
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준 결과와 비교하여 pages/sec가 threshold % 넘게 떨어진 사이트 목록을 반환."""
+    regressed = []
+    print(f"\n📈 기준 결과와 비교 (허용 하락폭 {threshold:.0f}%, 기준: {baseline.get('created_at', '?')})")
+    for site, summary in current["sites"].items():
+        base = baseline.get("sites", {}).get(site)
+        if not base or not base.get("pages_per_sec"):
+            print(f"   {site:<11} 기준 없음")
+            continue
+        change = (summary["pages_per_sec"] - base["pages_per_sec"]) / base["pages_per_sec"] * 100
+        failed = change < -threshold
+        mark = "❌ 회귀" if failed else "✅"
+        print(f"   {site:<11} {base['pages_per_sec']:.2f} -> {summary['pages_per_sec']:.2f} pages/sec "
+              f"({change:+.1f}%) {mark}")
+        if failed:
+            regressed.append(site)
+    return regressed
+
+
+def main() -> int:
+    import fixture_server
+    import html_parser
+    import page_archive
+
+    parser = argparse.ArgumentParser(description="스크래퍼 단계별 처리량 벤치마크 (오프라인)")
+    parser.add_argument("--site", choices=list(fixture_server.SITES), action="append",
+                        help="측정할 사이트 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--repeat", type=int, default=3, help="사이트별 반복 횟수")
+    parser.add_argument("--latency", type=float, default=0.0, help="fixture 서버 응답 지연 (초)")
+    parser.add_argument("--archive", type=Path, help=f"보관소 경로 (기본: {page_archive.ARCHIVE_DIR})")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="pages/sec 허용 하락폭 (%%), 넘으면 실패")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="사이트별 측정 제한 시간 (초), 넘으면 실패")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준 결과로 저장")
+    args = parser.parse_args()
+
+    if args.archive:
+        page_archive.ARCHIVE_DIR = args.archive
+    if not page_archive.size():
+        print(f"[ERROR] 보관된 페이지가 없습니다: {page_archive.ARCHIVE_DIR} (스크래퍼를 먼저 실행하세요)")
+        return 2
+
+    sites = args.site or list(fixture_server.SITES)
+    faults = fixture_server.FaultConfig(latency=args.latency)
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 60)
+    print("⏱️  스크래퍼 벤치마크")
+    print(f"   사이트 {', '.join(sites)} x {args.repeat}회, 응답 지연 {args.latency}s, "
+          f"파서 {html_parser.get_backend()}")
+    print("=" * 60)
+
+    context = multiprocessing.get_context("spawn")
+    current = {
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "html_parser": html_parser.get_backend(),
+        "repeat": args.repeat,
+        "latency": args.latency,
+        "sites": {},
+        "errors": {},
+    }
+    for site in sites:
+        server = fixture_server.start(site, faults=faults)
+        queue = context.Queue()
+        process = context.Process(target=measure, args=(site, server.base_url, args.repeat, queue))
+        process.start()
+        result = wait_result(process, queue, args.timeout)
+        process.join()
+        server.shutdown()
+
+        if "error" in result:
+            print(f"\n❌ {site}: 측정 실패 - {result['error']}")
+            current["errors"][site] = result["error"]
+            continue
+        if not result["pages"]:
+            print(f"\n⚠️ {site}: 재생할 상세 페이지가 없습니다 (보관소 확인)")
+            continue
+        current["sites"][site] = summarize(result)
+        print_site(site, current["sites"][site])
+
+    result_file = BENCH_DIR / f"scrapers-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(result_file, "w", encoding="utf-8") as f:
+        json.dump(current, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {result_file}")
+
+    if current["errors"]:
+        print(f"\n❌ 측정 실패: {', '.join(current['errors'])} (기준 결과는 갱신하지 않음)")
+        return 1
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"📌 기준 결과 갱신: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"[INFO] 기준 결과 없음: {args.baseline} (--update-baseline으로 저장)")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressed = compare(current, baseline, args.threshold)
+    if regressed:
+        print(f"\n❌ 처리량 회귀: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
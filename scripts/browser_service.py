@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Browser Service - 여러 스크래퍼가 함께 쓰는 상주 헤드리스 Chrome
+=================================================================
+스크래퍼를 실행할 때마다 chromedriver를 설치 확인하고 Chrome을 새로 띄우는 대신,
+Chrome 하나를 원격 디버깅 포트로 띄워 두고 스크래퍼가 탭 단위로 빌려 씁니다.
+
+- driver_path(): chromedriver 경로를 scripts/.browser/chromedriver.json에 캐시
+  (DRIVER_CACHE_DAYS 동안 ChromeDriverManager의 버전 확인 요청 없이 재사용)
+- python browser_service.py: Chrome을 한 번 띄워 두는 서비스 (종료: Ctrl+C)
+- BrowserServicePool: DriverPool과 같은 방식으로 lease() 하면 서비스 Chrome의 전용 탭을 빌려줌
+  - 빌려줄 때마다 상태 확인, 응답하지 않는 탭 세션은 새로 연결
+  - TAB_MAX_PAGES번 사용했거나 JS 힙이 TAB_MAX_HEAP_MB를 넘은 탭은 닫고 새 탭으로 교체 (메모리 상한)
+- service_pool(): 서비스가 실행 중이면 BrowserServicePool, 아니면 기존처럼 Chrome을 직접 띄우는 DriverPool
+
+사용법:
+-------
+    python browser_service.py                      # 127.0.0.1:9222에서 Chrome 상주
+    python browser_service.py --port 9333
+
+    # 다른 터미널에서 스크래퍼가 서비스 Chrome을 사용
+    python morph_scraper.py --browser-service
+    python reptifiles_scraper.py --browser-service 127.0.0.1:9333
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+import requests
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from browser_utils import block_heavy_resources, build_chrome_options
+from driver_pool import DriverPool
+
+# ============ 설정 ============
+SCRIPT_DIR = Path(__file__).parent.resolve()
+BROWSER_DIR = SCRIPT_DIR / ".browser"
+DRIVER_CACHE_FILE = BROWSER_DIR / "chromedriver.json"
+PROFILE_DIR = BROWSER_DIR / "profile"
+DRIVER_CACHE_DAYS = 7          # chromedriver 경로 재확인 주기 (일)
+
+DEFAULT_ADDRESS = "127.0.0.1:9222"
+HEALTH_CHECK_TIMEOUT = 2.0     # 서비스 상태 확인 요청 제한 시간 (초)
+STARTUP_TIMEOUT = 15.0         # Chrome 시작 대기 시간 (초)
+TAB_MAX_PAGES = 50             # 탭 하나로 방문할 최대 페이지 수 (넘으면 새 탭으로 교체)
+TAB_MAX_HEAP_MB = 512          # 탭 JS 힙 상한 (MB, 넘으면 새 탭으로 교체)
+
+# Chrome 실행 파일 후보 (CHROME_BINARY 환경 변수가 우선)
+CHROME_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+_driver_path: str | None = None
+_driver_path_lock = threading.Lock()
+
+
+def driver_path() -> str:
+    """
+    chromedriver 실행 파일 경로.
+    프로세스 안에서는 한 번만 확인하고, 파일 캐시가 DRIVER_CACHE_DAYS보다 오래됐거나
+    가리키는 파일이 없어졌을 때만 ChromeDriverManager().install()을 다시 호출한다.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path:
+            return _driver_path
+
+        try:
+            with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            fresh = datetime.now() - datetime.fromisoformat(cached["checked_at"]) < timedelta(days=DRIVER_CACHE_DAYS)
+            if fresh and Path(cached["path"]).exists():
+                _driver_path = cached["path"]
+                return _driver_path
+        except (OSError, ValueError, KeyError):
+            pass
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        print("[INIT] chromedriver 확인 중...")
+        _driver_path = ChromeDriverManager().install()
+        BROWSER_DIR.mkdir(parents=True, exist_ok=True)
+        with open(DRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"path": _driver_path, "checked_at": datetime.now().isoformat()}, f)
+        return _driver_path
+
+
+def chrome_binary() -> str | None:
+    """Chrome 실행 파일 경로 (찾지 못하면 None)."""
+    candidates = [os.environ.get("CHROME_BINARY")] + CHROME_CANDIDATES
+    for candidate in filter(None, candidates):
+        found = shutil.which(candidate) or (candidate if Path(candidate).is_file() else None)
+        if found:
+            return found
+    return None
+
+
+def is_running(address: str = DEFAULT_ADDRESS) -> bool:
+    """address의 Chrome 원격 디버깅 엔드포인트가 응답하면 True."""
+    try:
+        response = requests.get(f"http://{address}/json/version", timeout=HEALTH_CHECK_TIMEOUT)
+        return response.ok
+    except requests.RequestException:
+        return False
+
+
+def start_chrome(port: int) -> subprocess.Popen:
+    """스크래퍼와 같은 경량 프로필의 헤드리스 Chrome을 원격 디버깅 포트로 실행."""
+    binary = chrome_binary()
+    if not binary:
+        raise RuntimeError("Chrome 실행 파일을 찾을 수 없습니다 (CHROME_BINARY 환경 변수로 지정)")
+
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    args = [
+        binary,
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={PROFILE_DIR}",
+        "--no-first-run",
+        "--no-default-browser-check",
+        *build_chrome_options().arguments,
+        "about:blank",
+    ]
+    process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_running(f"127.0.0.1:{port}"):
+            return process
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"Chrome이 {STARTUP_TIMEOUT:.0f}초 안에 시작되지 않았습니다 (포트 {port})")
+
+
+def connect(address: str = DEFAULT_ADDRESS):
+    """
+    서비스 Chrome에 연결한 드라이버를 만들고 전용 새 탭으로 전환하여 반환.
+    이 드라이버를 quit()해도 서비스 Chrome은 종료되지 않는다 (탭만 먼저 닫을 것).
+    """
+    options = build_chrome_options()
+    options.debugger_address = address
+    driver = webdriver.Chrome(service=Service(driver_path()), options=options)
+    driver.switch_to.new_window("tab")
+    prepare_tab(driver)
+    return driver
+
+
+def prepare_tab(driver) -> None:
+    """새 탭에 리소스 차단과 메모리 측정을 설정 (CDP 설정은 탭마다 적용됨)."""
+    block_heavy_resources(driver)
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+    except Exception:
+        pass
+
+
+def tab_heap_mb(driver) -> float:
+    """현재 탭의 JS 힙 사용량 (MB, 확인할 수 없으면 0)."""
+    try:
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        used = next(metric["value"] for metric in metrics if metric["name"] == "JSHeapUsedSize")
+        return used / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+
+def recycle_tab(driver) -> None:
+    """새 탭을 열어 전환한 뒤 이전 탭을 닫음 (렌더러 메모리 회수)."""
+    old_handle = driver.current_window_handle
+    driver.switch_to.new_window("tab")
+    new_handle = driver.current_window_handle
+    driver.switch_to.window(old_handle)
+    driver.close()
+    driver.switch_to.window(new_handle)
+    prepare_tab(driver)
+
+
+def close_tab(driver) -> None:
+    """드라이버의 전용 탭을 닫고 연결만 종료 (서비스 Chrome은 유지)."""
+    try:
+        driver.close()
+    except Exception:
+        pass
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class BrowserServicePool(DriverPool):
+    """
+    서비스 Chrome의 탭을 빌려주는 드라이버 풀.
+    드라이버(연결)마다 전용 탭 하나를 가지며, 빌려줄 때 상태를 확인하고 필요하면 탭을 교체한다.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, size: int = 1):
+        super().__init__(lambda: connect(address), size)
+        self.address = address
+        self._pages: dict[int, int] = {}   # id(driver) -> 현재 탭으로 방문한 횟수
+        self.recycled = 0
+        self.reconnected = 0
+
+    def _healthy(self, driver) -> bool:
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def _replace(self, driver):
+        """응답하지 않는 연결을 버리고 새 연결(새 탭)로 교체. 연결에 실패하면 풀에서 제거하고 예외를 전달."""
+        close_tab(driver)
+        self._pages.pop(id(driver), None)
+        try:
+            new_driver = connect(self.address)
+        except Exception:
+            self._discard(driver)
+            raise
+        with self._lock:
+            self._drivers[self._drivers.index(driver)] = new_driver
+        self.reconnected += 1
+        return new_driver
+
+    def _discard(self, driver) -> None:
+        """드라이버를 풀에서 빼서 다음 lease가 새로 연결하도록 함."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._created -= 1
+        self._pages.pop(id(driver), None)
+        self._idle.put(None)  # 반납을 기다리는 스레드를 깨워 새 연결을 만들게 함
+
+    def _acquire(self):
+        driver = super()._acquire()
+        while driver is None:  # _discard가 넣은 자리 표시
+            driver = super()._acquire()
+        return driver
+
+    @contextmanager
+    def lease(self):
+        """상태를 확인한 탭을 빌려주고, 반납할 때 사용 횟수·메모리 기준으로 탭을 교체."""
+        driver = self._acquire()
+        if not self._healthy(driver):
+            print("[BROWSER] 응답하지 않는 탭을 새로 연결합니다.")
+            driver = self._replace(driver)  # 실패하면 풀에서 제거된 상태로 예외 전달
+        try:
+            yield driver
+        finally:
+            pages = self._pages.get(id(driver), 0) + 1
+            if pages >= TAB_MAX_PAGES or tab_heap_mb(driver) > TAB_MAX_HEAP_MB:
+                try:
+                    recycle_tab(driver)
+                    self.recycled += 1
+                    pages = 0
+                except Exception:
+                    pass  # 다음 lease의 상태 확인에서 다시 연결
+            self._pages[id(driver)] = pages
+            self._idle.put(driver)
+
+    def close(self) -> None:
+        """빌린 탭만 닫고 연결 종료 (서비스 Chrome은 계속 실행)."""
+        for driver in self._drivers:
+            close_tab(driver)
+        if self.recycled or self.reconnected:
+            print(f"[BROWSER] 탭 교체 {self.recycled}회, 재연결 {self.reconnected}회")
+        self._drivers.clear()
+        self._pages.clear()
+        self._created = 0
+
+
+def service_pool(factory: Callable, size: int, address: str | None = None) -> DriverPool:
+    """
+    address의 브라우저 서비스가 실행 중이면 그 Chrome의 탭을 빌려주는 풀을,
+    address가 없거나 서비스가 응답하지 않으면 factory로 Chrome을 직접 띄우는 풀을 반환.
+    """
+    if address:
+        if is_running(address):
+            print(f"[BROWSER] 브라우저 서비스 사용: {address} (탭 최대 {size}개)")
+            return BrowserServicePool(address, size)
+        print(f"[WARNING] 브라우저 서비스({address})에 연결할 수 없어 Chrome을 직접 실행합니다.")
+    return DriverPool(factory, size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크래퍼 공용 상주 헤드리스 Chrome")
+    parser.add_argument("--port", type=int, default=int(DEFAULT_ADDRESS.rsplit(":", 1)[1]),
+                        help="원격 디버깅 포트")
+    args = parser.parse_args()
+
+    address = f"127.0.0.1:{args.port}"
+    if is_running(address):
+        print(f"[INFO] 이미 실행 중인 브라우저 서비스가 있습니다: {address}")
+        return
+
+    path = driver_path()
+    process = start_chrome(args.port)
+
+    print("=" * 60)
+    print("🌐 Browser Service")
+    print(f"   Chrome       {address} (PID {process.pid})")
+    print(f"   chromedriver {path}")
+    print(f"   탭 교체 기준: {TAB_MAX_PAGES}페이지 또는 JS 힙 {TAB_MAX_HEAP_MB}MB")
+    print(f"   스크래퍼:    python morph_scraper.py --browser-service {address}")
+    print("   종료: Ctrl+C")
+    print("=" * 60)
+
+    try:
+        while process.poll() is None:
+            time.sleep(1)
+        print(f"[ERROR] Chrome이 종료되었습니다 (종료 코드 {process.returncode})")
+    except KeyboardInterrupt:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        print("[CLEANUP] Chrome 종료됨")
+
+
+if __name__ == "__main__":
+    main()
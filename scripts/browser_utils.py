@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Browser Utils - Selenium 스크래퍼 공용 Chrome 설정
+=================================================
+morph_scraper / reptifiles_scraper가 공유하는 경량 Chrome 드라이버 프로필입니다.
+
+- 헤드리스 + eager 페이지 로드 전략 (DOMContentLoaded 시점에 driver.get 반환)
+- 이미지 로딩 비활성화 (Chrome 환경설정)
+- Chrome DevTools Protocol(CDP) URL 차단으로 이미지/미디어/폰트와
+  광고·분석 호스트 요청을 네트워크 단계에서 차단
+- 고정 sleep 대신 조건 기반 대기 (값이 더 이상 변하지 않을 때까지 짧은 간격으로 확인)
+
+사용 예:
+--------
+    options = build_chrome_options()
+    driver = webdriver.Chrome(service=service, options=options)
+    block_heavy_resources(driver)
+
+    driver.get(url)
+    wait_for_network_idle(driver)
+    scroll_until_stable(driver, "document.querySelectorAll('.card').length")
+"""
+
+import time
+
+from selenium.webdriver.chrome.options import Options
+
+# ============ 설정 ============
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+LIGHTWEIGHT_PAGES = True  # False면 모든 리소스를 로드하고 normal 페이지 로드 전략 사용
+
+# 조건 기반 대기 설정
+WAIT_POLL_INTERVAL = 0.2   # 조건 확인 간격 (초)
+WAIT_SETTLE_TIME = 1.0     # 값이 이 시간 동안 변하지 않으면 안정된 것으로 판단 (초)
+WAIT_TIMEOUT = 10.0        # 최대 대기 시간 (초)
+
+# 텍스트 추출에 필요 없는 리소스 (CDP Network.setBlockedURLs 와일드카드 패턴)
+BLOCKED_RESOURCE_PATTERNS = [
+    # 이미지
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp",
+    # 미디어
+    "*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg", "*.wav", "*.mov",
+    # 폰트
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+
+# 광고 / 분석 / 트래커 호스트
+BLOCKED_HOST_PATTERNS = [
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googletagmanager.com*",
+    "*googletagservices.com*",
+    "*google-analytics.com*",
+    "*adservice.google.com*",
+    "*amazon-adsystem.com*",
+    "*adthrive.com*",
+    "*adsafeprotected.com*",
+    "*moatads.com*",
+    "*pubmatic.com*",
+    "*rubiconproject.com*",
+    "*criteo.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*scorecardresearch.com*",
+    "*quantserve.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+]
+
+
+def build_chrome_options(user_agent: str = USER_AGENT) -> Options:
+    """헤드리스 Chrome 옵션 (LIGHTWEIGHT_PAGES면 eager 로드 + 이미지 비활성화)."""
+    options = Options()
+    options.add_argument("--headless=new")  # 헤드리스 모드
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"--user-agent={user_agent}")
+
+    if LIGHTWEIGHT_PAGES:
+        # DOMContentLoaded 시점에 반환 (이미지·광고 스크립트 완료를 기다리지 않음)
+        options.page_load_strategy = "eager"
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+
+    return options
+
+
+def block_heavy_resources(driver) -> None:
+    """CDP로 이미지/미디어/폰트 및 광고·분석 호스트 요청을 차단."""
+    if not LIGHTWEIGHT_PAGES:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {
+            "urls": BLOCKED_RESOURCE_PATTERNS + BLOCKED_HOST_PATTERNS,
+        })
+    except Exception as e:
+        # CDP를 지원하지 않는 드라이버에서는 차단 없이 계속 진행
+        print(f"[WARNING] 리소스 차단 설정 실패: {type(e).__name__}: {e}")
+
+
+# 문서 로딩 상태와 지금까지 시작된 리소스 요청 수 (둘 다 변하지 않으면 네트워크 유휴)
+NETWORK_ACTIVITY_SCRIPT = """
+    return [document.readyState, performance.getEntriesByType('resource').length];
+"""
+
+
+def wait_for_stable_value(driver, script: str, timeout: float = WAIT_TIMEOUT,
+                          poll: float = WAIT_POLL_INTERVAL, settle: float = WAIT_SETTLE_TIME):
+    """
+    script(JavaScript) 결과가 settle초 동안 변하지 않을 때까지 poll 간격으로 확인.
+    timeout이 지나면 그 시점의 값으로 포기하며, 마지막으로 읽은 값을 반환.
+    """
+    started = time.monotonic()
+    value = driver.execute_script(script)
+    changed_at = started
+
+    while time.monotonic() - started < timeout:
+        time.sleep(poll)
+        new_value = driver.execute_script(script)
+        now = time.monotonic()
+        if new_value != value:
+            value = new_value
+            changed_at = now
+        elif now - changed_at >= settle:
+            break
+
+    return value
+
+
+def wait_for_network_idle(driver, timeout: float = WAIT_TIMEOUT,
+                          settle: float = WAIT_SETTLE_TIME) -> None:
+    """새 리소스 요청이 settle초 동안 없고 문서 상태가 바뀌지 않을 때까지 대기."""
+    wait_for_stable_value(driver, NETWORK_ACTIVITY_SCRIPT, timeout=timeout, settle=settle)
+
+
+def scroll_until_stable(driver, count_expression: str, max_scrolls: int = 10,
+                        timeout: float = WAIT_TIMEOUT, settle: float = WAIT_SETTLE_TIME) -> int:
+    """
+    페이지 끝까지 스크롤하면서, 스크롤 후 항목 수(count_expression)와 페이지 높이가
+    더 이상 늘어나지 않으면 중단. 마지막 항목 수를 반환.
+    """
+    script = f"return [{count_expression}, document.body.scrollHeight];"
+    last = wait_for_stable_value(driver, script, timeout=timeout, settle=settle)
+
+    for scroll_count in range(1, max_scrolls + 1):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        current = wait_for_stable_value(driver, script, timeout=timeout, settle=settle)
+        if current == last:
+            break
+        last = current
+        print(f"  스크롤 {scroll_count}회... (항목 {current[0]}개)")
+
+    return last[0]
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Crawl Frontier - URL 정규화 / 중복 제거 / 우선순위 수집 대기열
+=============================================================
+세 스크래퍼가 발견한 URL을 같은 방식으로 정규화하고 중복을 걸러내는 공용 대기열입니다.
+
+- canonicalize(): 스킴/호스트 소문자화, 기본 포트 제거, 프래그먼트(#...) 제거,
+  추적용 쿼리(utm_*, fbclid, gclid 등) 제거 (나머지 쿼리는 원래 인코딩 그대로), 끝 슬래시 정책 적용
+- 중복 판단 키는 스킴, 끝 슬래시, 쿼리 순서 차이를 무시 (set 기반 O(1) 확인)
+- pop()/drain(): priority 값이 작은 것부터, 같은 값이면 발견 순서대로
+- items(): 발견 순서대로의 전체 항목 (결과 파일 순서 유지용)
+- save()/load(): 발견한 URL 목록을 파일로 저장해 두고 --resume 시 목록 수집을 건너뜀
+
+사용 예:
+--------
+    frontier = CrawlFrontier(trailing_slash=True)
+    frontier.add("/morphpedia/crested-geckos/lilly-white?utm_source=x#top",
+                 base="https://www.morphmarket.com", name="Lilly White")
+    for item in frontier.drain():
+        item["url"]   # https://www.morphmarket.com/morphpedia/crested-geckos/lilly-white/
+"""
+
+import heapq
+import itertools
+import json
+import os
+from pathlib import Path
+from urllib.parse import unquote_plus, urljoin, urlsplit, urlunsplit
+
+# 추적용 쿼리 파라미터 (제거해도 같은 페이지)
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "ref_src", "srsltid",
+}
+TRACKING_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize(url: str, base: str | None = None, trailing_slash: bool | None = None) -> str:
+    """
+    URL을 정규화하여 반환.
+    trailing_slash: True면 끝 슬래시 추가(파일 확장자가 있는 경로 제외), False면 제거, None이면 유지.
+    """
+    if base:
+        url = urljoin(base, url)
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if trailing_slash is True and not path.endswith("/") and "." not in path.rsplit("/", 1)[-1]:
+        path += "/"
+    elif trailing_slash is False and path != "/":
+        path = path.rstrip("/") or "/"
+
+    # 추적용 파라미터만 빼고 나머지 "이름=값"은 원래 문자열 그대로 유지 (%20 -> + 같은 재인코딩 방지)
+    query = "&".join(pair for pair in parts.query.split("&")
+                     if pair and not _is_tracking(unquote_plus(pair.split("=", 1)[0])))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def dedupe_key(url: str) -> str:
+    """정규화된 URL의 중복 판단 키 (스킴, 끝 슬래시, 쿼리 순서 무시)."""
+    parts = urlsplit(url)
+    query = "&".join(sorted(parts.query.split("&"))) if parts.query else ""
+    return f"{parts.netloc}{parts.path.rstrip('/') or '/'}?{query}"
+
+
+class CrawlFrontier:
+    """정규화된 URL을 중복 없이 모으고 우선순위대로 꺼내는 수집 대기열."""
+
+    def __init__(self, trailing_slash: bool | None = None):
+        self.trailing_slash = trailing_slash
+        self._items: dict[str, dict] = {}   # 중복 판단 키 -> 항목 (발견 순서 유지)
+        self._heap: list[tuple[int, int, str]] = []
+        self._counter = itertools.count()
+
+    @classmethod
+    def of(cls, items: list[dict], trailing_slash: bool | None = None) -> "CrawlFrontier":
+        """{url, ...} 항목 목록으로 대기열 생성 (중복 제거, 순서 유지)."""
+        frontier = cls(trailing_slash)
+        for item in items:
+            frontier.add(**item)
+        return frontier
+
+    def canonical(self, url: str, base: str | None = None) -> str:
+        return canonicalize(url, base, self.trailing_slash)
+
+    def __contains__(self, url: str) -> bool:
+        return dedupe_key(self.canonical(url)) in self._items
+
+    def __len__(self) -> int:
+        """아직 꺼내지 않은 항목 수."""
+        return len(self._heap)
+
+    def add(self, url: str, priority: int = 0, base: str | None = None, **data) -> dict | None:
+        """
+        URL을 정규화하여 추가하고 항목({...data, url})을 반환.
+        이미 발견한 URL이면 None (처음 발견한 항목 유지).
+        """
+        canonical = self.canonical(url, base)
+        key = dedupe_key(canonical)
+        if key in self._items:
+            return None
+        item = {**data, "url": canonical}
+        self._items[key] = item
+        heapq.heappush(self._heap, (priority, next(self._counter), key))
+        return item
+
+    def pop(self) -> dict | None:
+        """priority가 가장 작은 (같으면 먼저 발견된) 항목을 꺼냄. 비어 있으면 None."""
+        if not self._heap:
+            return None
+        _, _, key = heapq.heappop(self._heap)
+        return self._items[key]
+
+    def drain(self) -> list[dict]:
+        """남은 항목을 모두 우선순위 순서대로 꺼냄."""
+        return [self.pop() for _ in range(len(self._heap))]
+
+    def items(self) -> list[dict]:
+        """지금까지 발견한 전체 항목 (발견 순서)."""
+        return list(self._items.values())
+
+    def save(self, path: Path) -> None:
+        """발견한 항목과 남은 대기열을 파일에 저장 (임시 파일에 쓴 뒤 교체)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "trailing_slash": self.trailing_slash,
+            "items": list(self._items.values()),
+            "pending": [[priority, key] for priority, _, key in sorted(self._heap)],
+        }
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "CrawlFrontier | None":
+        """save()로 저장한 대기열을 복원 (파일이 없거나 읽을 수 없으면 None)."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        frontier = cls(state.get("trailing_slash"))
+        for item in state["items"]:
+            frontier._items[dedupe_key(item["url"])] = item
+        for priority, key in state["pending"]:
+            if key in frontier._items:
+                heapq.heappush(frontier._heap, (priority, next(frontier._counter), key))
+        return frontier
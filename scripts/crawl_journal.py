@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Crawl Journal - 스크래퍼 중단 복구용 JSONL 기록
+==============================================
+긴 수집 도중 스크래퍼가 죽거나 차단되어도 그때까지의 결과를 잃지 않도록,
+레코드를 추출하는 즉시 JSONL 파일에 한 줄씩 추가(flush + fsync)합니다.
+--resume으로 다시 실행하면 이미 기록된 URL은 건너뛰고, 마지막에
+write_json_stream()으로 기존과 같은 형식의 결과 JSON을 만듭니다 (compaction).
+
+- 위치: scripts/.journal/<이름>.jsonl (결과 파일 저장에 성공하면 삭제)
+- 메모리: URL -> 파일 오프셋만 유지하고 레코드는 필요할 때 파일에서 읽으므로
+  수집량과 무관하게 일정합니다.
+- 중단된 쓰기로 잘린 마지막 줄은 다시 열 때 잘라냅니다.
+- 같은 URL이 여러 번 기록되면 마지막 줄이 유효합니다.
+
+사용 예:
+--------
+    journal = CrawlJournal("pangea_data", resume=args.resume)
+    if url not in journal:
+        journal.append(record)
+    write_json_stream(OUTPUT_FILE, header, "articles",
+                      (journal.get(url) for url in urls if url in journal), total)
+    journal.remove()
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Iterable
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+JOURNAL_DIR = SCRIPT_DIR / ".journal"
+FSYNC = True  # 레코드마다 디스크에 동기화 (전원 차단에도 안전, 약간 느림)
+
+
+class CrawlJournal:
+    """URL 키를 가진 레코드를 추가 전용 JSONL 파일에 기록하는 수집 일지."""
+
+    def __init__(self, name: str, key: str = "url", resume: bool = False,
+                 directory: Path | None = None):
+        self.key = key
+        self.resumed = resume
+        self.path = (directory or JOURNAL_DIR) / f"{name}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._offsets: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if resume:
+            self._scan()
+            print(f"[JOURNAL] 이어서 수집: {len(self._offsets)}개 레코드 기록됨 ({self.path})")
+        elif self.path.exists() and self.path.stat().st_size:
+            print(f"[JOURNAL] 이전 실행의 기록을 비우고 새로 시작 ({self.path}, 이어서 하려면 --resume)")
+
+        self._file = open(self.path, "a+b" if resume else "w+b")
+
+    def _scan(self) -> None:
+        """기존 기록을 읽어 URL -> 오프셋 색인을 만들고, 잘린 마지막 줄은 제거."""
+        if not self.path.exists():
+            return
+        valid_end = 0
+        with open(self.path, "rb") as f:
+            for line in iter(f.readline, b""):
+                if not line.endswith(b"\n"):
+                    break  # 쓰는 도중 중단된 줄
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                self._offsets[record[self.key]] = valid_end
+                valid_end += len(line)
+        if valid_end < self.path.stat().st_size:
+            print(f"[JOURNAL] 손상된 마지막 기록 제거 ({self.path.stat().st_size - valid_end}바이트)")
+            os.truncate(self.path, valid_end)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._offsets
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._offsets)
+
+    def append(self, record: dict) -> None:
+        """레코드를 한 줄로 추가하고 즉시 디스크에 기록 (스레드 안전)."""
+        line = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(line)
+            self._file.flush()
+            if FSYNC:
+                os.fsync(self._file.fileno())
+            self._offsets[record[self.key]] = offset
+
+    def get(self, url: str) -> dict | None:
+        """URL의 최신 레코드를 파일에서 읽어 반환 (없으면 None)."""
+        with self._lock:
+            offset = self._offsets.get(url)
+            if offset is None:
+                return None
+            self._file.seek(offset)
+            return json.loads(self._file.readline())
+
+    def companion(self, kind: str) -> Path:
+        """기록과 함께 유지/삭제되는 부속 파일 경로 (예: 발견한 URL 목록 -> <이름>.frontier.json)."""
+        return self.path.with_name(f"{self.path.stem}.{kind}.json")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def remove(self) -> None:
+        """결과 파일 저장이 끝난 기록과 부속 파일을 삭제."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        for path in self.path.parent.glob(f"{self.path.stem}.*.json"):
+            path.unlink(missing_ok=True)
+
+
+def write_json_stream(path, header: dict, list_key: str, records: Iterable[dict],
+                      total: int) -> None:
+    """
+    json.dump(..., ensure_ascii=False, indent=2)와 같은 형식으로 결과 파일을 쓰되,
+    레코드를 하나씩 받아 기록하여 전체 목록을 메모리에 올리지 않는다.
+    total은 header 뒤에 "total_<list_key>"로 기록된다.
+    임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 기존 결과 파일은 남는다.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    fields = {**header, f"total_{list_key}": total}
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for name, value in fields.items():
+            f.write(f"  {json.dumps(name, ensure_ascii=False)}: {json.dumps(value, ensure_ascii=False)},\n")
+        f.write(f"  {json.dumps(list_key)}: [")
+
+        first = True
+        for record in records:
+            body = json.dumps(record, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+            f.write(("\n    " if first else ",\n    ") + body)
+            first = False
+
+        f.write("]\n}" if first else "\n  ]\n}")
+
+    os.replace(tmp_path, path)
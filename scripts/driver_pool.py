@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Driver Pool - Selenium 드라이버 풀
+=================================
+여러 개의 헤드리스 Chrome 드라이버를 작업 스레드에 하나씩 빌려주는(lease) 풀입니다.
+상세 페이지를 병렬로 방문할 때 사용합니다.
+
+드라이버는 처음 필요해질 때 만들어지며(최대 size개), 한 번도 빌리지 않으면
+Chrome이 전혀 실행되지 않습니다.
+
+사용 예:
+--------
+    pool = DriverPool(create_driver, size=4)
+    with pool.lease() as driver:
+        driver.get(url)
+    pool.close()
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable
+
+
+class DriverPool:
+    """factory로 만든 드라이버 size개를 스레드 간에 나눠 쓰는 풀."""
+
+    def __init__(self, factory: Callable, size: int, drivers: list | None = None):
+        """
+        factory: 드라이버를 생성하는 함수 (예: create_driver)
+        size: 풀의 최대 드라이버 수
+        drivers: 이미 만들어 둔 드라이버 (풀에 포함되며 size에 포함됨)
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self._drivers = list(drivers or [])
+        self._created = len(self._drivers)
+        self._idle: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+
+        for driver in self._drivers:
+            self._idle.put(driver)
+
+    def _acquire(self):
+        """유휴 드라이버를 꺼내고, 없으면 size 한도 안에서 새로 생성, 한도에 도달했으면 반납을 대기."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+                number = self._created
+
+        if not can_create:
+            return self._idle.get()
+
+        print(f"[INIT] Chrome 드라이버 초기화 중... ({number}/{self.size})")
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    @contextmanager
+    def lease(self):
+        """사용 가능한 드라이버 하나를 빌리고, 블록이 끝나면 반납."""
+        driver = self._acquire()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+    def close(self) -> None:
+        """풀의 모든 드라이버 종료."""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers.clear()
+        self._created = 0
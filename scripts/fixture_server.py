@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixture Server - 녹화된 페이지를 재생하는 로컬 HTTP 서버
+=======================================================
+page_archive(.page_archive)에 보관된 Pangea / MorphMarket / ReptiFiles 페이지를
+사이트별 로컬 포트에서 그대로 재생합니다. 실제 사이트에 접속하지 않고
+처리량(pages/sec), 동시성 제한, 재시도 동작을 측정하거나 회귀 확인할 수 있습니다.
+
+- 요청 경로 + 쿼리를 실제 사이트 URL로 바꿔 보관소에서 찾음 (없으면 404)
+- robots.txt와 sitemap(.xml, .xml.gz)도 보관되어 있으면 재생 (sitemap 우선 URL 발견도 그대로 동작)
+- 응답 본문의 실제 사이트 절대 주소는 로컬 주소로 바꿔서 링크를 따라가도 서버 안에 머묾
+- --latency / --jitter: 응답 지연 (초)
+- --error-rate / --error-status: 일정 비율로 오류 응답 주입 (429, 503은 Retry-After 포함)
+
+사용법:
+-------
+    python fixture_server.py                          # pangea 8001, morph 8002, reptifiles 8003
+    python fixture_server.py --latency 0.2 --jitter 0.1 --error-rate 0.05 --error-status 503
+    python fixture_server.py --site pangea --port 9000 --archive /path/to/.page_archive
+
+    # 다른 터미널에서 스크래퍼를 로컬 서버로 실행 (결과는 scripts/.replay/에 저장)
+    python pangea_scraper.py --base-url http://127.0.0.1:8001
+    python morph_scraper.py --base-url http://127.0.0.1:8002
+    python reptifiles_scraper.py --base-url http://127.0.0.1:8003
+"""
+
+import argparse
+import gzip
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import page_archive
+
+# ============ 설정 ============
+SITES = {
+    "pangea": "https://www.pangeareptile.com",
+    "morph": "https://www.morphmarket.com",
+    "reptifiles": "https://reptifiles.com",
+}
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_BASE_PORT = 8001  # 사이트 순서대로 8001, 8002, 8003
+RETRY_AFTER_SECONDS = 1   # 429 / 503 주입 시 Retry-After 값
+
+
+@dataclass
+class FaultConfig:
+    """응답 지연과 오류 주입 설정."""
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int | None = None
+
+
+def site_pattern(site_url: str) -> re.Pattern:
+    """사이트의 절대 주소(http/https, www 유무, 프로토콜 생략 형태)에 맞는 정규식."""
+    host = site_url.split("://", 1)[1].removeprefix("www.")
+    return re.compile(rf"(?:https?:)?//(?:www\.)?{re.escape(host)}", re.I)
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """한 사이트의 보관 페이지를 재생하는 HTTP 서버 (요청마다 스레드)."""
+
+    daemon_threads = True
+
+    def __init__(self, site_url: str, address: tuple[str, int], faults: FaultConfig):
+        super().__init__(address, FixtureHandler)
+        self.site_url = site_url.rstrip("/")
+        self.base_url = f"http://{address[0]}:{self.server_address[1]}"
+        self.site_pattern = site_pattern(self.site_url)
+        self.faults = faults
+        self.stats: Counter = Counter()
+        self._random = random.Random(faults.seed)
+        self._lock = threading.Lock()
+
+    def roll(self) -> tuple[float, bool]:
+        """이번 요청의 (지연 시간, 오류 주입 여부)를 결정."""
+        faults = self.faults
+        with self._lock:
+            delay = faults.latency + self._random.uniform(0, faults.jitter)
+            inject = self._random.random() < faults.error_rate
+        return delay, inject
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def lookup(self, path: str) -> str | None:
+        """요청 경로에 해당하는 보관 HTML (끝 슬래시 유무 차이는 허용)."""
+        url = f"{self.site_url}{path}"
+        base, sep, query = url.partition("?")
+        alternate = (base[:-1] if base.endswith("/") else base + "/") + sep + query
+        for candidate in (url, alternate):
+            html = page_archive.load(candidate)
+            if html is not None:
+                return html
+        return None
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (스크래퍼의 커넥션 풀링 그대로 측정)
+    disable_nagle_algorithm = True  # 헤더와 본문을 나눠 보낼 때 생기는 지연(~40ms) 방지
+    server: FixtureServer
+
+    def do_GET(self):
+        delay, inject = self.server.roll()
+        if delay > 0:
+            time.sleep(delay)
+
+        if inject:
+            status = self.server.faults.error_status
+            self.server.count(f"injected_{status}")
+            headers = {"Retry-After": str(RETRY_AFTER_SECONDS)} if status in (429, 503) else {}
+            self._send(status, b"injected error", "text/plain", headers)
+            return
+
+        html = self.server.lookup(self.path)
+        if html is None:
+            self.server.count("not_found")
+            self._send(404, b"not in archive", "text/plain")
+            return
+
+        self.server.count("ok")
+        body = self.server.site_pattern.sub(self.server.base_url, html).encode("utf-8")
+        path = self.path.split("?", 1)[0]
+        if path.endswith(".gz"):
+            # sitemap은 압축을 푼 XML로 보관되므로 다시 압축해서 보냄
+            self._send(200, gzip.compress(body), "application/x-gzip")
+        elif path.endswith(".xml"):
+            self._send(200, body, "application/xml; charset=utf-8")
+        elif path == "/robots.txt":
+            self._send(200, body, "text/plain; charset=utf-8")
+        else:
+            self._send(200, body, "text/html; charset=utf-8")
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 출력하면 측정에 영향을 주므로 생략 (통계는 종료 시 출력)
+
+
+def start(site: str, port: int = 0, host: str = DEFAULT_HOST,
+          faults: FaultConfig | None = None) -> FixtureServer:
+    """
+    site("pangea", "morph", "reptifiles")의 재생 서버를 백그라운드 스레드로 시작.
+    port=0이면 빈 포트를 사용하며, 스크래퍼에 넘길 주소는 server.base_url.
+    종료는 server.shutdown().
+    """
+    server = FixtureServer(SITES[site], (host, port), faults or FaultConfig())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화된 페이지 재생 서버 (오프라인 벤치마크용)")
+    parser.add_argument("--site", choices=list(SITES), action="append",
+                        help="재생할 사이트 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_BASE_PORT,
+                        help="첫 사이트의 포트 (이후 사이트는 1씩 증가)")
+    parser.add_argument("--archive", type=Path, help=f"보관소 경로 (기본: {page_archive.ARCHIVE_DIR})")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503, help="주입할 오류 상태 코드")
+    parser.add_argument("--seed", type=int, help="지연/오류 주입 난수 시드 (재현용)")
+    args = parser.parse_args()
+
+    if args.archive:
+        page_archive.ARCHIVE_DIR = args.archive
+    if not page_archive.size():
+        print(f"[ERROR] 보관된 페이지가 없습니다: {page_archive.ARCHIVE_DIR} (스크래퍼를 먼저 실행하세요)")
+        return
+
+    faults = FaultConfig(args.latency, args.jitter, args.error_rate, args.error_status, args.seed)
+    servers = {}
+    for offset, site in enumerate(args.site or list(SITES)):
+        servers[site] = start(site, args.port + offset, args.host, faults)
+
+    print("=" * 60)
+    print(f"🎞️  Fixture Server ({page_archive.size()}개 URL 보관됨)")
+    for site, server in servers.items():
+        print(f"   {site:<11} {server.base_url}  ->  {server.site_url}")
+    print(f"   지연 {faults.latency}s + 최대 {faults.jitter}s, "
+          f"오류 주입 {faults.error_rate:.0%} (HTTP {faults.error_status})")
+    print("   종료: Ctrl+C")
+    print("=" * 60)
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+
+    for site, server in servers.items():
+        server.shutdown()
+        print(f"📊 {site}: {dict(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML Parser - 스크래퍼 공용 HTML 파싱 백엔드
+===========================================
+모든 스크래퍼는 BeautifulSoup 객체를 make_soup()으로 만듭니다.
+백엔드는 HTML_PARSER 설정 하나로 바꿀 수 있습니다.
+
+- "auto": lxml이 설치되어 있으면 lxml, 없으면 html.parser (기본값)
+- "lxml": C로 구현된 lxml 파서 (html.parser보다 수 배 빠름)
+- "html.parser": 파이썬 표준 라이브러리 파서 (추가 의존성 없음)
+
+select / select_one / find_all 등 BeautifulSoup API는 백엔드와 무관하게 동일합니다.
+백엔드별 파싱 속도와 메모리는 bench_html_parsers.py로 비교할 수 있습니다.
+
+사용 예:
+--------
+    from html_parser import make_soup
+    soup = make_soup(response_text)
+"""
+
+from bs4 import BeautifulSoup
+
+# ============ 설정 ============
+HTML_PARSER = "auto"
+SUPPORTED_BACKENDS = ("lxml", "html.parser")
+
+_resolved: str | None = None
+
+
+def lxml_available() -> bool:
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_backend() -> str:
+    """실제로 사용할 BeautifulSoup 파서 이름."""
+    global _resolved
+    if _resolved is None:
+        if HTML_PARSER == "auto":
+            _resolved = "lxml" if lxml_available() else "html.parser"
+        elif HTML_PARSER in SUPPORTED_BACKENDS:
+            _resolved = HTML_PARSER
+        else:
+            raise ValueError(f"지원하지 않는 HTML 파서: {HTML_PARSER} (가능: auto, {', '.join(SUPPORTED_BACKENDS)})")
+    return _resolved
+
+
+def set_backend(name: str) -> None:
+    """파서 백엔드를 변경 (벤치마크 등에서 사용)."""
+    global HTML_PARSER, _resolved
+    HTML_PARSER = name
+    _resolved = None
+    get_backend()
+
+
+def make_soup(markup: str | bytes) -> BeautifulSoup:
+    """설정된 백엔드로 HTML을 파싱하여 BeautifulSoup 객체를 반환."""
+    return BeautifulSoup(markup, get_backend())
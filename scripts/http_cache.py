@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP Cache - 조건부 GET(ETag / Last-Modified) 디스크 캐시
+=========================================================
+URL별로 응답 본문과 검증자(ETag, Last-Modified)를 디스크에 저장해 두고,
+다음 실행에서 If-None-Match / If-Modified-Since 헤더를 보냅니다.
+서버가 304 Not Modified로 응답하면 캐시된 본문을 그대로 재사용합니다.
+
+- 저장 위치: scripts/.http_cache/ (URL의 SHA-256 해시를 파일 이름으로 사용)
+- 항목당 파일 2개: <key>.json (메타데이터), <key>.body (원본 바이트)
+- 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+
+사용 예:
+--------
+    cache = ResponseCache(SCRIPT_DIR / ".http_cache")
+    text = http_client.get_text(url, cache=cache)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+
+
+class CacheEntry:
+    """캐시된 응답 하나 (본문 + 검증자)."""
+
+    def __init__(self, url: str, body: bytes, encoding: str | None,
+                 etag: str | None, last_modified: str | None, stored_at: float):
+        self.url = url
+        self.body = body
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+    def conditional_headers(self) -> dict:
+        """재검증 요청에 붙일 If-None-Match / If-Modified-Since 헤더."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """URL을 키로 하는 조건부 GET 응답 캐시 (크기 기반 LRU 삭제)."""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0      # 304로 재검증되어 캐시 본문을 사용한 횟수
+        self.stores = 0    # 새 본문을 저장한 횟수
+        self._total_bytes: int | None = None  # 첫 저장 시 디렉터리를 스캔하여 계산
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def load(self, url: str) -> CacheEntry | None:
+        """캐시 항목을 읽어 반환 (없거나 손상되었으면 None)."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return CacheEntry(url, body, meta.get("encoding"), meta.get("etag"),
+                          meta.get("last_modified"), meta.get("stored_at", 0.0))
+
+    def touch(self, url: str) -> None:
+        """304 재검증 성공 시 호출 - LRU 순서를 갱신."""
+        _, body_path = self._paths(url)
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """
+        응답을 캐시에 저장.
+        검증자(ETag / Last-Modified)가 없는 응답은 재검증할 수 없으므로 저장하지 않는다.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        meta_path, body_path = self._paths(url)
+        try:
+            old_size = body_path.stat().st_size
+        except OSError:
+            old_size = 0
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": response.encoding or response.apparent_encoding,
+            "stored_at": time.time(),
+            "size": len(response.content),
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체하여, 중간에 중단되어도 반쯤 쓰인 항목이 남지 않도록 함
+        tmp_body = body_path.with_suffix(f".body.{threading.get_ident()}.tmp")
+        tmp_meta = meta_path.with_suffix(f".json.{threading.get_ident()}.tmp")
+        tmp_body.write_bytes(response.content)
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_body, body_path)
+        os.replace(tmp_meta, meta_path)
+
+        with self._lock:
+            self.stores += 1
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._total_bytes += meta["size"] - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan(self) -> list[tuple[float, int, Path]]:
+        """(마지막 사용 시각, 크기, 본문 경로) 목록."""
+        entries = []
+        for body_path in self.directory.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, body_path))
+        return entries
+
+    def _evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목을 삭제 (lock 보유 상태에서 호출)."""
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        for _, size, body_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+
+    def report(self) -> None:
+        """캐시 사용 통계를 출력."""
+        if self.hits or self.stores:
+            print(f"   HTTP 캐시: 304 재사용 {self.hits}건, 새로 저장 {self.stores}건 ({self.directory})")
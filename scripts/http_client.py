@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP Client - 스크래퍼 공용 HTTP 세션
+=====================================
+plain HTTP로 페이지를 가져오는 스크래퍼들이 공유하는 세션 계층입니다.
+
+- keep-alive 커넥션 풀링 (요청마다 TCP/TLS 핸드셰이크를 반복하지 않음)
+- 일시적 오류(429, 5xx, 연결 끊김)에 대한 지수 백오프 재시도 (Retry-After 헤더 존중)
+- 요청별 지연 시간 / 상태 코드 통계 (stats.report()로 출력)
+- 선택적 조건부 GET 디스크 캐시 (http_cache.ResponseCache, get_text의 cache 인자)
+
+사용 예:
+--------
+    import http_client
+
+    response = http_client.get(url)   # 재시도 후에도 실패하면 requests 예외 발생
+    html = http_client.get_text(url, cache=cache)  # 304면 캐시된 본문 반환
+    ...
+    http_client.stats.report()
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import ResponseCache
+
+# ============ 설정 ============
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+REQUEST_TIMEOUT = 30
+POOL_MAXSIZE = 16          # 호스트당 유지할 keep-alive 커넥션 수 (동시 요청 수 이상)
+MAX_RETRIES = 4            # 최초 요청 이후 추가 재시도 횟수
+BACKOFF_BASE = 1.0         # 첫 재시도 대기 시간 (초), 이후 2배씩 증가
+BACKOFF_MAX = 60.0         # 재시도 대기 시간 상한 (초)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class HttpStats:
+    """요청별 지연 시간과 상태 코드를 모으는 스레드 안전 카운터."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: list[float] = []
+        self.status_counts: Counter = Counter()
+        self.retries = 0
+        self.failures = 0
+
+    def record(self, status: int | str, latency: float) -> None:
+        with self._lock:
+            self.latencies.append(latency)
+            self.status_counts[status] += 1
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+
+    @staticmethod
+    def _percentile(values: list[float], pct: float) -> float:
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def report(self) -> None:
+        """수집된 HTTP 통계를 출력."""
+        with self._lock:
+            if not self.latencies:
+                return
+            total = len(self.latencies)
+            print("\n📡 HTTP 요청 통계")
+            print(f"   요청 {total}회 (재시도 {self.retries}회, 최종 실패 {self.failures}건)")
+            print(
+                f"   지연 시간: 평균 {sum(self.latencies) / total:.2f}초, "
+                f"p50 {self._percentile(self.latencies, 50):.2f}초, "
+                f"p95 {self._percentile(self.latencies, 95):.2f}초, "
+                f"최대 {max(self.latencies):.2f}초"
+            )
+            statuses = ", ".join(f"{status}: {count}" for status, count in sorted(
+                self.status_counts.items(), key=lambda item: str(item[0])
+            ))
+            print(f"   상태 코드: {statuses}")
+
+
+stats = HttpStats()
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """커넥션 풀을 공유하는 전역 세션을 반환 (최초 호출 시 생성)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"User-Agent": USER_AGENT})
+            _session = session
+        return _session
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """attempt번째 재시도의 지수 백오프 대기 시간 (full jitter)."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def get(url: str, headers: dict | None = None, timeout: float = REQUEST_TIMEOUT,
+        stream: bool = False) -> requests.Response:
+    """
+    공유 세션으로 GET 요청.
+    일시적 오류는 지수 백오프로 재시도하고, 최종 실패 시 requests 예외를 발생시킨다.
+    stream=True면 본문을 미리 읽지 않는다 (response.raw로 읽고 다 쓰면 close).
+    """
+    session = get_session()
+    attempt = 0
+
+    while True:
+        started = time.perf_counter()
+        try:
+            response = session.get(url, headers=headers, timeout=timeout, stream=stream)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            stats.record(type(e).__name__, time.perf_counter() - started)
+            if attempt >= MAX_RETRIES:
+                stats.record_failure()
+                raise
+            wait = _backoff_seconds(attempt)
+        else:
+            stats.record(response.status_code, time.perf_counter() - started)
+            if response.status_code not in RETRY_STATUS or attempt >= MAX_RETRIES:
+                if response.status_code >= 400:
+                    stats.record_failure()
+                response.raise_for_status()
+                return response
+            retry_after = _retry_after_seconds(response)
+            response.close()
+            wait = min(BACKOFF_MAX, retry_after) if retry_after is not None else _backoff_seconds(attempt)
+
+        attempt += 1
+        stats.record_retry()
+        print(f"[RETRY] {url} ({attempt}/{MAX_RETRIES}, {wait:.1f}초 후 재시도)")
+        time.sleep(wait)
+
+
+def get_text(url: str, cache: ResponseCache | None = None, timeout: float = REQUEST_TIMEOUT) -> str:
+    """
+    GET 요청 후 본문 텍스트를 반환.
+    cache가 주어지면 저장된 검증자로 조건부 요청을 보내고, 304 응답이면 캐시된 본문을 사용한다.
+    """
+    entry = cache.load(url) if cache else None
+    headers = entry.conditional_headers() if entry else None
+
+    response = get(url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and entry:
+        cache.touch(url)
+        return entry.text
+
+    if cache:
+        cache.store(url, response)
+    return response.text
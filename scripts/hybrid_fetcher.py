@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hybrid Fetcher - HTTP 우선, 필요할 때만 브라우저로 수집
+=======================================================
+서버에서 렌더링되는 페이지는 Chrome 없이 plain HTTP(http_client)로 충분합니다.
+HTTP로 받은 HTML은 page_archive에 보관됩니다.
+먼저 HTTP로 받아 기존 셀렉터로 추출해 보고, 결과가 기준에 못 미칠 때만
+(JavaScript 렌더링 콘텐츠) 브라우저 추출 함수로 다시 시도합니다.
+
+사용 예:
+--------
+    result = fetch_with_fallback(
+        url,
+        http_extract=lambda soup: extract(soup),          # BeautifulSoup -> 결과
+        browser_extract=lambda url: render_and_extract(url),  # 브라우저로 URL -> 결과
+        is_sufficient=lambda result: len(result) >= 50,
+    )
+    report()
+"""
+
+import threading
+from collections import Counter
+from typing import Callable
+
+import requests
+
+import http_client
+import page_archive
+from html_parser import make_soup
+
+_stats: Counter = Counter()
+_stats_lock = threading.Lock()
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def fetch_with_fallback(url: str, http_extract: Callable, browser_extract: Callable,
+                        is_sufficient: Callable):
+    """
+    url을 HTTP로 받아 http_extract(soup)로 추출하고, is_sufficient(result)가 거짓이면
+    browser_extract(url) 결과를 반환. HTTP 요청 자체가 실패해도 브라우저로 넘어간다.
+    """
+    try:
+        html = http_client.get_text(url)
+        page_archive.store(url, html)
+        result = http_extract(make_soup(html))
+        if is_sufficient(result):
+            _count("http")
+            return result
+        _count("fallback_insufficient")
+    except requests.RequestException as e:
+        print(f"   [HTTP] 요청 실패, 브라우저로 재시도: {type(e).__name__}: {e}")
+        _count("fallback_http_error")
+
+    return browser_extract(url)
+
+
+def report() -> None:
+    """HTTP로 처리한 페이지 수와 브라우저로 넘어간 페이지 수를 출력."""
+    with _stats_lock:
+        total = sum(_stats.values())
+        if not total:
+            return
+        fallbacks = _stats["fallback_insufficient"] + _stats["fallback_http_error"]
+        print(f"\n🌐 HTTP 우선 수집: {total}페이지 중 HTTP {_stats['http']}개, "
+              f"브라우저 {fallbacks}개 (콘텐츠 부족 {_stats['fallback_insufficient']}, "
+              f"HTTP 실패 {_stats['fallback_http_error']})")
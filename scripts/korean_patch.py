@@ -14,20 +14,37 @@ Korean Patch - 파충류 데이터 한국어 번역 스크립트
 2. 스크립트 실행:
    python korean_patch.py
 
+번역 결과는 scripts/.translation_memory.sqlite3에 저장되어, 원문이 바뀌지 않은
+텍스트는 다음 실행에서 번역 API를 호출하지 않습니다.
+Pangea 본문은 문장 단위로 해시하여, 이전 결과(pangea_data_ko.json)에서 바뀌지 않은 문장은
+그대로 가져오고 바뀌거나 새로 생긴 문장만 번역합니다.
+제목·요약·본문 청크·모프 설명은 TRANSLATE_WORKERS개 스레드로 동시에 번역하며,
+전체 요청 속도는 공유 토큰 버킷(REQUESTS_PER_SECOND)으로 제한합니다.
+짧은 한 줄 텍스트는 줄바꿈으로 이어 MAX_REQUEST_CHARS 이내의 요청 하나로 묶어 번역합니다.
+
 출력:
 -----
 ../src/constants/morph_data_ko.json
 ../src/constants/pangea_data_ko.json
+../src/constants/pangea_data_ko.segments.json (본문 문장 위치 색인, 다음 실행의 재사용용)
 """
 
+import hashlib
 import json
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 from deep_translator import GoogleTranslator
 
+from glossary_replacer import GlossaryReplacer
+from rate_limiter import TokenBucket
+from text_chunker import iter_chunks, iter_sentences, join_chunks
+from translation_memory import TranslationMemory, glossary_version
+
 # ============ 경로 설정 ============
 SCRIPT_DIR = Path(__file__).parent.resolve()
 CONSTANTS_DIR = SCRIPT_DIR.parent / "src" / "constants"
@@ -36,97 +53,72 @@ MORPH_INPUT = CONSTANTS_DIR / "morph_data.json"
 MORPH_OUTPUT = CONSTANTS_DIR / "morph_data_ko.json"
 PANGEA_INPUT = CONSTANTS_DIR / "pangea_data.json"
 PANGEA_OUTPUT = CONSTANTS_DIR / "pangea_data_ko.json"
+# 이전 번역 결과의 본문 문장 위치 색인 (원문 문장 해시 -> pangea_data_ko.json 본문 안의 위치)
+PANGEA_SEGMENTS = CONSTANTS_DIR / "pangea_data_ko.segments.json"
+
+# ============ 번역 설정 ============
+SOURCE_LANG = "en"
+TARGET_LANG = "ko"
+TRANSLATE_WORKERS = 4       # 동시에 번역할 텍스트 수 (긴 텍스트의 청크도 같은 수만큼 동시 요청)
+REQUESTS_PER_SECOND = 2.0   # 전체 번역 API 요청 속도 상한 (캐시 적중은 제외)
+REQUEST_BURST = 2           # 순간적으로 허용하는 최대 연속 요청 수
+PROGRESS_EVERY = 20         # 진행 상황 출력 간격 (번역 완료 텍스트 수)
+MAX_REQUEST_CHARS = 4500    # 번역 요청 1회의 최대 글자 수 (Google Translate 제한)
+BATCH_ITEM_MAX_CHARS = 1000 # 이 길이 이하의 한 줄 텍스트(제목·요약·설명)는 여러 개를 한 요청으로 묶음
+BATCH_SEPARATOR = "\n"      # 묶음 구분자 (번역 후에도 줄 수가 유지되는지 확인하여 사용)
 
 # ============ 파충류 전문 용어 사전 (Glossary) ============
+# 소문자로 한 번만 적으면 첫 글자 대문자 / 단어별 대문자 형태도 함께 치환됨 (glossary_replacer)
 REPTILE_GLOSSARY = {
     # 사육 용어
     "substrate": "바닥재",
-    "Substrate": "바닥재",
     "shedding": "탈피",
-    "Shedding": "탈피",
     "enclosure": "사육장",
-    "Enclosure": "사육장",
     "terrarium": "테라리움",
-    "Terrarium": "테라리움",
     "hatchling": "해칭(베이비)",
-    "Hatchling": "해칭(베이비)",
     "juvenile": "준성체",
-    "Juvenile": "준성체",
     "adult": "성체",
-    "Adult": "성체",
     "gravid": "배란(알을 밴)",
-    "Gravid": "배란(알을 밴)",
     "breeding": "브리딩",
-    "Breeding": "브리딩",
     "clutch": "클러치(한 배 알)",
-    "Clutch": "클러치(한 배 알)",
     
     # 유전 용어
     "morph": "모프",
-    "Morph": "모프",
     "gene": "유전 형질",
-    "Gene": "유전 형질",
     "recessive": "열성",
-    "Recessive": "열성",
     "dominant": "우성",
-    "Dominant": "우성",
     "incomplete dominant": "불완전 우성",
-    "Incomplete Dominant": "불완전 우성",
     "co-dominant": "공우성",
-    "Co-dominant": "공우성",
     "polygenic": "다유전자성",
-    "Polygenic": "다유전자성",
     "heterozygous": "헤테로(이형접합)",
-    "Heterozygous": "헤테로(이형접합)",
     "homozygous": "호모(동형접합)",
-    "Homozygous": "호모(동형접합)",
     "phenotype": "표현형",
-    "Phenotype": "표현형",
     "genotype": "유전형",
-    "Genotype": "유전형",
     "lineage": "혈통",
-    "Lineage": "혈통",
     "trait": "형질",
-    "Trait": "형질",
     
     # 종 이름
     "crested gecko": "크레스티드 게코",
-    "Crested Gecko": "크레스티드 게코",
     "gargoyle gecko": "가고일 게코",
-    "Gargoyle Gecko": "가고일 게코",
     "leopard gecko": "레오파드 게코",
-    "Leopard Gecko": "레오파드 게코",
     "chameleon": "카멜레온",
-    "Chameleon": "카멜레온",
     
     # 사육 환경
     "humidity": "습도",
-    "Humidity": "습도",
     "temperature": "온도",
-    "Temperature": "온도",
     "basking": "바스킹(일광욕)",
-    "Basking": "바스킹(일광욕)",
     "UVB": "UVB",
     "misting": "미스팅(분무)",
-    "Misting": "미스팅(분무)",
     "bioactive": "바이오액티브",
-    "Bioactive": "바이오액티브",
     "isopod": "아이소포드(쥐며느리)",
-    "Isopod": "아이소포드(쥐며느리)",
     "springtail": "톡토기",
-    "Springtail": "톡토기",
     
     # 먹이
     "diet": "사료",
-    "Diet": "사료",
     "feeder": "먹이곤충",
-    "Feeder": "먹이곤충",
     "cricket": "귀뚜라미",
-    "Cricket": "귀뚜라미",
     "dubia": "두비아",
-    "Dubia": "두비아",
     "gut-loading": "거트로딩",
-    "Gut-loading": "거트로딩",
 }
 
 # ============ 모프 이름 한글화 사전 ============
@@ -187,15 +179,27 @@ MORPH_NAME_KO = {
     "Hybrid": "하이브리드",
 }
 
-# 번역기 초기화
-translator = GoogleTranslator(source='en', target='ko')
+# 번역기는 요청 파라미터를 인스턴스에 저장하므로 스레드마다 따로 생성
+_thread_local = threading.local()
+
+# 모든 스레드가 공유하는 번역 API 속도 제한 (고정 sleep 대체)
+request_limiter = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+
+# 긴 텍스트의 청크 번역용 (텍스트 단위 작업과 분리하여 서로 기다리다 멈추지 않도록)
+chunk_executor = ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS, thread_name_prefix="chunk")
+
+# 용어 사전 치환기 (import 시 한 번만 컴파일)
+glossary_replacer = GlossaryReplacer(REPTILE_GLOSSARY)
+
+# 번역 메모리 (용어 사전이 바뀌면 버전이 달라져 다시 번역)
+# import만으로 SQLite 파일을 만들지 않도록 처음 사용할 때 연다 (get_translation_memory)
+_translation_memory: TranslationMemory | None = None
+_translation_memory_lock = threading.Lock()
 
 
 def apply_glossary(text: str) -> str:
-    """전문 용어 사전을 적용하여 번역 품질 향상."""
-    for eng, kor in REPTILE_GLOSSARY.items():
-        text = text.replace(eng, kor)
-    return text
+    """전문 용어 사전을 적용하여 번역 품질 향상 (텍스트를 한 번만 훑어 가장 긴 용어 우선 치환)."""
+    return glossary_replacer.replace(text)
 
 
 def get_korean_morph_name(eng_name: str) -> str:
@@ -232,52 +236,175 @@ def get_korean_morph_name(eng_name: str) -> str:
         return f"{clean_name}"
 
 
-def translate_text(text: str, max_length: int = 4500) -> str:
+def get_translator() -> GoogleTranslator:
+    """현재 스레드의 번역기 (없으면 생성)."""
+    translator = getattr(_thread_local, "translator", None)
+    if translator is None:
+        translator = GoogleTranslator(source=SOURCE_LANG, target=TARGET_LANG)
+        _thread_local.translator = translator
+    return translator
+
+
+def get_translation_memory() -> TranslationMemory:
+    """번역 메모리 (처음 호출할 때 열고, 이후에는 같은 연결을 사용)."""
+    global _translation_memory
+    with _translation_memory_lock:
+        if _translation_memory is None:
+            _translation_memory = TranslationMemory(glossary_version=glossary_version(REPTILE_GLOSSARY))
+        return _translation_memory
+
+
+def close_translation_memory() -> None:
+    """번역 메모리를 정리하고 닫음 (열린 적이 없으면 아무것도 하지 않음)."""
+    global _translation_memory
+    with _translation_memory_lock:
+        memory, _translation_memory = _translation_memory, None
+    if memory is not None:
+        memory.evict()  # 원문이 바뀌어 더 이상 쓰이지 않는 번역 정리
+        memory.report()
+        memory.close()
+
+
+def request_translation(text: str) -> str:
+    """번역 API 요청 1회 (전체 공유 토큰 버킷으로 요청 속도 제한)."""
+    request_limiter.acquire()
+    return get_translator().translate(text)
+
+
+def is_batchable(text: str) -> bool:
+    """여러 개를 한 요청으로 묶어 번역할 수 있는 짧은 한 줄 텍스트인지."""
+    return len(text) <= BATCH_ITEM_MAX_CHARS and BATCH_SEPARATOR not in text
+
+
+def pack_batches(texts: list[str], max_chars: int = MAX_REQUEST_CHARS) -> list[list[str]]:
+    """구분자를 포함한 길이가 max_chars를 넘지 않도록 texts를 순서대로 묶음."""
+    batches = []
+    current = []
+    size = 0
+    for text in texts:
+        added = len(text) + (len(BATCH_SEPARATOR) if current else 0)
+        if current and size + added > max_chars:
+            batches.append(current)
+            current, added = [], len(text)
+            size = 0
+        current.append(text)
+        size += added
+    if current:
+        batches.append(current)
+    return batches
+
+
+def translate_batch(texts: list[str], failed: set | None = None) -> list[str]:
+    """
+    짧은 한 줄 텍스트 여러 개를 줄바꿈으로 이어 한 요청으로 번역하고 다시 나눠 반환.
+    번역 결과의 줄 수가 맞지 않으면(줄이 합쳐지거나 나뉨) 절반씩 나눠 다시 시도하고,
+    하나만 남으면 단독으로 번역한다. 번역에 실패한 원문은 failed에 모은다.
+    """
+    if len(texts) == 1:
+        return [translate_uncached(texts[0], failed=failed)]
+    
+    try:
+        lines = request_translation(BATCH_SEPARATOR.join(texts)).split(BATCH_SEPARATOR)
+        lines = [line.strip() for line in lines if line.strip()]
+    except Exception as e:
+        print(f"[WARNING] 묶음 번역 실패 ({len(texts)}개): {str(e)[:50]}")
+        lines = []
+    
+    if len(lines) != len(texts):
+        middle = len(texts) // 2
+        return translate_batch(texts[:middle], failed) + translate_batch(texts[middle:], failed)
+    
+    results = [apply_glossary(line) for line in lines]
+    for text, translated in zip(texts, results):
+        get_translation_memory().put(text, translated, SOURCE_LANG, TARGET_LANG)
+    return results
+
+
+def translate_all(texts: list[str], label: str = "번역", failed: set | None = None) -> list[str]:
+    """
+    texts를 TRANSLATE_WORKERS개 스레드로 동시에 번역하여 같은 순서로 반환.
+    같은 원문은 한 번만 번역하고, 빈 텍스트는 그대로 둔다.
+    번역 메모리에 없는 짧은 한 줄 텍스트는 MAX_REQUEST_CHARS 이내로 묶어 한 요청으로 번역한다.
+    failed를 넘기면 번역에 실패하여 원문 그대로 반환한 텍스트를 모은다.
+    """
+    results = {text: text for text in texts}
+    pending = []
+    for text in dict.fromkeys(texts):
+        if not text or not text.strip():
+            continue
+        cached = get_translation_memory().get(text, SOURCE_LANG, TARGET_LANG)
+        if cached is not None:
+            results[text] = cached
+        else:
+            pending.append(text)
+    
+    short_texts = [text for text in pending if is_batchable(text)]
+    batches = pack_batches(short_texts)
+    jobs = batches + [[text] for text in pending if not is_batchable(text)]
+    if len(short_texts) > len(batches):
+        print(f"  [{label}] 짧은 텍스트 {len(short_texts)}개를 {len(batches)}개 요청으로 묶어 번역")
+    
+    with ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS) as executor:
+        # 긴 텍스트는 하나짜리 묶음으로 (translate_batch가 단독 번역)
+        futures = {executor.submit(translate_batch, job, failed): job for job in jobs}
+        done = 0
+        next_report = PROGRESS_EVERY
+        for future in as_completed(futures):
+            for text, translated in zip(futures[future], future.result()):
+                results[text] = translated
+            done += len(futures[future])
+            if done >= next_report or done == len(pending):
+                print(f"  [{label}] {done}/{len(pending)}개 번역 완료")
+                next_report = done + PROGRESS_EVERY
+    return [results[text] for text in texts]
+
+
+def translate_text(text: str, max_length: int = MAX_REQUEST_CHARS) -> str:
     """
     텍스트를 한국어로 번역.
     긴 텍스트는 청크로 나누어 번역.
+    번역 메모리에 있는 텍스트는 API를 호출하지 않고, 새로 번역한 결과는 저장한다
+    (번역에 실패하여 원문을 반환할 때는 저장하지 않음).
     """
     if not text or len(text.strip()) == 0:
         return text
     
+    cached = get_translation_memory().get(text, SOURCE_LANG, TARGET_LANG)
+    if cached is not None:
+        return cached
+    return translate_uncached(text, max_length)
+
+
+def translate_uncached(text: str, max_length: int = MAX_REQUEST_CHARS, failed: set | None = None) -> str:
+    """번역 메모리를 확인하지 않고 번역하여 저장 (실패 시 원문을 반환하고 failed에 추가)."""
     try:
         # Google Translate 제한으로 긴 텍스트는 분할
         if len(text) <= max_length:
-            translated = translator.translate(text)
+            translated = request_translation(text)
         else:
-            # 문장 단위로 분할
-            sentences = text.replace('\n', ' [NEWLINE] ').split('. ')
-            chunks = []
-            current_chunk = ""
-            
-            for sentence in sentences:
-                if len(current_chunk) + len(sentence) < max_length:
-                    current_chunk += sentence + ". "
-                else:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = sentence + ". "
-            
-            if current_chunk:
-                chunks.append(current_chunk.strip())
+            # 문단·문장을 max_length에 가깝게 채운 청크로 나눠 동시에 번역하고 (순서 유지),
+            # 청크 경계에 있던 원래 줄바꿈/공백으로 다시 이어 붙임
+            # (청크 목록을 따로 만들지 않고 제너레이터를 그대로 넘김. 구분자만 따로 모아 둠)
+            separators = []
             
-            # 각 청크 번역
-            translated_chunks = []
-            for chunk in chunks:
-                time.sleep(0.5)  # API 제한 방지
-                translated_chunk = translator.translate(chunk)
-                translated_chunks.append(translated_chunk)
+            def chunks():
+                for chunk, separator in iter_chunks(text, max_length):
+                    separators.append(separator)
+                    yield chunk
             
-            translated = ' '.join(translated_chunks)
-            translated = translated.replace('[NEWLINE]', '\n')
+            translated_chunks = chunk_executor.map(request_translation, chunks())
+            translated = join_chunks(translated_chunks, separators)
         
         # 전문 용어 사전 적용
         translated = apply_glossary(translated)
         
+        get_translation_memory().put(text, translated, SOURCE_LANG, TARGET_LANG)
         return translated
         
     except Exception as e:
         print(f"[WARNING] 번역 실패: {str(e)[:50]}")
+        if failed is not None:
+            failed.add(text)
         return text
 
 
@@ -294,24 +421,17 @@ def process_morph_data():
     with open(MORPH_INPUT, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
-    total = len(data['morphs'])
-    translated_morphs = []
+    morphs = data['morphs']
+    print(f"[INFO] 모프 {len(morphs)}개 설명 번역 중...")
     
-    for i, morph in enumerate(data['morphs'], 1):
-        print(f"[{i}/{total}] {morph['name'][:40]}...")
-        
-        # 이름 한글화
-        ko_name = get_korean_morph_name(morph['name'])
-        
-        # 설명 번역 (있는 경우)
-        ko_description = ""
-        if morph.get('description'):
-            ko_description = translate_text(morph['description'])
-            time.sleep(0.3)
-        
+    # 설명 번역 (있는 경우, 동시에 번역하고 원래 순서로 받음)
+    ko_descriptions = translate_all([morph.get('description') or "" for morph in morphs], "설명")
+    
+    translated_morphs = []
+    for morph, ko_description in zip(morphs, ko_descriptions):
         translated_morphs.append({
             "id": morph['id'],
-            "name": ko_name,
+            "name": get_korean_morph_name(morph['name']),  # 이름 한글화
             "nameEn": morph['name'],
             "type": morph.get('type', ''),
             "description": ko_description,
@@ -336,6 +456,63 @@ def process_morph_data():
     return True
 
 
+def segment_hash(text: str) -> str:
+    """원문 문장의 해시 (앞뒤 공백 무시)."""
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()[:16]
+
+
+def segment_settings() -> dict:
+    """문장 색인이 유효한 번역 설정 (언어 쌍, 용어 사전 버전). 하나라도 다르면 색인을 버림."""
+    return {
+        "source": SOURCE_LANG,
+        "target": TARGET_LANG,
+        "glossary": glossary_version(REPTILE_GLOSSARY),
+    }
+
+
+def load_previous_segments() -> dict[str, str]:
+    """
+    이전 번역 결과에서 {원문 문장 해시: 번역된 문장}을 만듦.
+    pangea_data_ko.json의 본문을 PANGEA_SEGMENTS 색인의 위치로 잘라 얻으며,
+    둘 중 하나가 없거나 읽을 수 없으면 빈 사전 (전체 번역).
+    색인을 만든 언어 쌍이나 용어 사전이 지금과 다르면 (번역 메모리와 같은 기준) 역시 빈 사전.
+    """
+    try:
+        with open(PANGEA_OUTPUT, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        with open(PANGEA_SEGMENTS, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    settings = segment_settings()
+    if any(saved.get(key) != value for key, value in settings.items()):
+        print("[INFO] 언어 쌍 또는 용어 사전이 바뀌어 이전 문장 번역을 재사용하지 않습니다.")
+        return {}
+    
+    index = saved.get('articles', {})
+    segments = {}
+    for article in previous.get('articles', []):
+        content = article.get('content', '')
+        for digest, start, end in index.get(article.get('url'), []):
+            if 0 <= start <= end <= len(content):
+                segments[digest] = content[start:end]
+    return segments
+
+
+def splice_segments(translations: list[str], separators: list[str]) -> tuple[str, list[tuple[int, int]]]:
+    """번역된 문장을 원래 구분자로 이어 붙이고, 각 문장의 (시작, 끝) 위치를 함께 반환."""
+    parts = []
+    spans = []
+    position = 0
+    for translated, separator in zip(translations, separators):
+        translated = translated.strip()
+        spans.append((position, position + len(translated)))
+        parts.append(translated + separator)
+        position += len(translated) + len(separator)
+    return "".join(parts), spans
+
+
 def process_pangea_data():
     """Pangea 블로그 데이터 한국어 변환."""
     print("\n" + "=" * 60)
@@ -349,42 +526,55 @@ def process_pangea_data():
     with open(PANGEA_INPUT, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
-    total = len(data['articles'])
-    translated_articles = []
+    articles = data['articles']
+    total = len(articles)
+    
+    # 본문을 문장 단위로 나누고 (수집한 본문은 공백이 정리되어 문단 구분이 없으므로 문단보다 작은 단위),
+    # 이전 결과에 같은 원문 문장이 있으면 그 번역을 재사용. 문장들은 translate_all에서 요청 단위로 묶임
+    previous_segments = load_previous_segments()
+    article_segments = [list(iter_sentences(article['content'], MAX_REQUEST_CHARS)) for article in articles]
+    changed = list(dict.fromkeys(
+        segment for segments in article_segments for segment, _ in segments
+        if segment.strip() and segment_hash(segment) not in previous_segments
+    ))
+    segment_total = sum(len(segments) for segments in article_segments)
+    reused = sum(segment_hash(segment) in previous_segments
+                 for segments in article_segments for segment, _ in segments)
+    print(f"[INFO] 게시글 {total}개 제목·요약 번역, 본문 문장 {segment_total}개 중 "
+          f"{reused}개 재사용 / {len(changed)}개 번역")
+    
+    # 제목, 요약, 바뀐 본문 문장을 한 번에 동시 번역 (원래 순서로 받음)
+    texts = [article['title'] for article in articles] + [article['summary'] for article in articles] + changed
+    failed_texts = set()
+    translated = translate_all(texts, "게시글", failed=failed_texts)
     
-    for i, article in enumerate(data['articles'], 1):
-        print(f"[{i}/{total}] {article['title'][:40]}...")
+    # 번역에 실패한 텍스트는 한 번 더 시도 (그래도 실패하면 원문 그대로 남음)
+    if failed_texts:
+        retry = list(failed_texts)
+        print(f"[INFO] 번역 실패 {len(retry)}개 재시도")
+        failed_texts = set()
+        retried = dict(zip(retry, translate_all(retry, "재시도", failed=failed_texts)))
+        translated = [retried.get(text, ko_text) for text, ko_text in zip(texts, translated)]
+    
+    ko_titles = translated[:total]
+    ko_summaries = translated[total:2 * total]
+    new_segments = dict(zip(changed, translated[2 * total:]))
+    
+    translated_articles = []
+    segment_index = {}
+    failed = 0
+    for article, segments, ko_title, ko_summary in zip(articles, article_segments, ko_titles, ko_summaries):
+        ko_segments = [
+            new_segments[segment] if segment in new_segments
+            else previous_segments.get(segment_hash(segment), segment)
+            for segment, _ in segments
+        ]
+        ko_content, spans = splice_segments(ko_segments, [separator for _, separator in segments])
         
-        try:
-            # 제목 번역
-            ko_title = translate_text(article['title'])
-            time.sleep(0.3)
-            
-            # 요약 번역
-            ko_summary = translate_text(article['summary'])
-            time.sleep(0.3)
-            
-            # 본문 번역 (긴 텍스트)
-            ko_content = translate_text(article['content'])
-            
-            # 출처 문구 추가
-            ko_content += "\n\n---\n> 🔗 출처: Pangea Reptile Blog (크레스티아 번역)"
-            
-            translated_articles.append({
-                "title": f"{ko_title}",
-                "titleEn": article['title'],
-                "url": article['url'],
-                "summary": ko_summary,
-                "content": ko_content,
-                "scraped_at": article['scraped_at']
-            })
-            
-            print(f"        ✓ 번역 완료")
-            time.sleep(1)  # API 제한 방지
-            
-        except Exception as e:
-            print(f"        ✗ 번역 실패: {e}")
-            # 실패 시 원문 유지
+        if any(segment in failed_texts for segment, _ in segments):
+            # 본문 문장 중 하나라도 번역에 실패하면 한국어·영어가 섞이지 않도록 원문 유지
+            # (색인에도 넣지 않으므로 다음 실행에서 다시 번역)
+            failed += 1
             translated_articles.append({
                 "title": article['title'],
                 "titleEn": article['title'],
@@ -393,6 +583,29 @@ def process_pangea_data():
                 "content": article['content'] + "\n\n---\n> 🔗 Source: Pangea Reptile Blog",
                 "scraped_at": article['scraped_at']
             })
+            continue
+        
+        # 다음 실행에서 재사용할 문장 위치
+        segment_index[article['url']] = [
+            [segment_hash(segment), start, end]
+            for (segment, _), (start, end) in zip(segments, spans)
+            if segment.strip()
+        ]
+        
+        # 출처 문구 추가
+        ko_content += "\n\n---\n> 🔗 출처: Pangea Reptile Blog (크레스티아 번역)"
+        
+        translated_articles.append({
+            "title": f"{ko_title}",
+            "titleEn": article['title'],
+            "url": article['url'],
+            "summary": ko_summary,
+            "content": ko_content,
+            "scraped_at": article['scraped_at']
+        })
+    
+    if failed:
+        print(f"[WARNING] 본문 번역 실패 게시글 {failed}개 (원문 유지, 다음 실행에서 다시 번역)")
     
     # 출력 데이터 구성
     output_data = {
@@ -406,6 +619,8 @@ def process_pangea_data():
     
     with open(PANGEA_OUTPUT, 'w', encoding='utf-8') as f:
         json.dump(output_data, f, ensure_ascii=False, indent=2)
+    with open(PANGEA_SEGMENTS, 'w', encoding='utf-8') as f:
+        json.dump({**segment_settings(), "articles": segment_index}, f, ensure_ascii=False, indent=2)
     
     print(f"\n✅ 저장 완료: {PANGEA_OUTPUT}")
     return True
@@ -420,6 +635,8 @@ def main():
     print("=" * 60)
     print("\n[INFO] 라이브러리: deep-translator (Google Translate API)")
     print("[INFO] 전문 용어 사전 적용: 활성화")
+    translation_memory = get_translation_memory()
+    print(f"[INFO] 번역 메모리: {len(translation_memory)}개 항목 ({translation_memory.path.name})")
     
     # 모프 데이터 처리
     process_morph_data()
@@ -427,6 +644,8 @@ def main():
     # Pangea 데이터 처리
     process_pangea_data()
     
+    close_translation_memory()
+    
     elapsed = time.time() - start_time
     print("\n" + "=" * 60)
     print(f"⏱️ 총 소요 시간: {elapsed / 60:.1f}분")
@@ -15,51 +15,89 @@ Selenium을 사용하여 JavaScript로 렌더링되는 콘텐츠도 수집합니
 
 2. 스크립트 실행:
    python morph_scraper.py
+   python morph_scraper.py --reextract   # 브라우저 없이 보관된 HTML로 JSON 재생성
+   python morph_scraper.py --resume      # 중단된 실행을 이어서 (이미 수집한 모프는 건너뜀)
+   python morph_scraper.py --base-url http://127.0.0.1:8002   # fixture_server.py로 오프라인 재생
 
 출력:
 -----
 ../src/constants/morph_data.json
 """
 
-import json
-import random
+import argparse
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
+import browser_service
+import crawl_journal
+import hybrid_fetcher
+import page_archive
+import selector_cache
+from crawl_frontier import CrawlFrontier
+from crawl_journal import CrawlJournal, write_json_stream
+from browser_utils import (
+    block_heavy_resources,
+    build_chrome_options,
+    scroll_until_stable,
+    wait_for_network_idle,
+)
+from driver_pool import DriverPool
+from html_parser import make_soup
+from rate_limiter import TokenBucket
+
 # ============ 설정 ============
 BASE_URL = "https://www.morphmarket.com"
 MORPHPEDIA_URL = f"{BASE_URL}/morphpedia/crested-geckos/"
 DESCRIPTION_MAX_LENGTH = 500
 
+# 상세 페이지 병렬 수집 설정
+DETAIL_WORKERS = 4             # 동시에 처리할 상세 페이지 수 (= 최대 Chrome 드라이버 수)
+MAX_REQUESTS_PER_SECOND = 1.0  # 전체 드라이버 합산 초당 페이지 요청 수 상한 (차단 방지)
+DETAIL_RENDER_TIMEOUT = 10.0   # 상세 페이지 렌더링 최대 대기 (초, 네트워크가 유휴 상태가 되면 바로 진행)
+
+# 스크롤 로딩 완료 판단에 사용할 모프 링크 수 (JavaScript 식)
+MORPH_LINK_COUNT_EXPRESSION = "document.querySelectorAll(\"a[href*='/morphpedia/crested-geckos/']\").length"
+
 # 출력 경로 (스크립트 위치 기준 상대 경로)
 SCRIPT_DIR = Path(__file__).parent.resolve()
 OUTPUT_DIR = SCRIPT_DIR.parent / "src" / "constants"
 OUTPUT_FILE = OUTPUT_DIR / "morph_data.json"
 
+# --base-url로 다른 서버(fixture_server.py)를 대상으로 할 때의 결과 저장 위치
+REPLAY_DIR = SCRIPT_DIR / ".replay"
+
+
+def use_base_url(base_url: str) -> None:
+    """
+    대상 사이트 주소를 바꿈 (fixture_server.py로 녹화된 페이지를 재생할 때).
+    실제 데이터를 덮어쓰지 않도록 결과와 수집 기록은 REPLAY_DIR에 저장하고, 보관소에는 저장하지 않는다.
+    """
+    global BASE_URL, MORPHPEDIA_URL, OUTPUT_DIR, OUTPUT_FILE
+    BASE_URL = base_url.rstrip("/")
+    MORPHPEDIA_URL = f"{BASE_URL}/morphpedia/crested-geckos/"
+    OUTPUT_DIR = REPLAY_DIR
+    OUTPUT_FILE = REPLAY_DIR / OUTPUT_FILE.name
+    crawl_journal.JOURNAL_DIR = REPLAY_DIR / ".journal"
+    page_archive.ARCHIVE_ENABLED = False
+
 
 def create_driver():
-    """Selenium Chrome 드라이버 생성."""
-    options = Options()
-    options.add_argument("--headless=new")  # 헤드리스 모드
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    """Selenium Chrome 드라이버 생성 (이미지·폰트·광고를 차단한 경량 프로필)."""
+    options = build_chrome_options()
     
-    service = Service(ChromeDriverManager().install())
+    service = Service(browser_service.driver_path())  # 경로 캐시 (매번 설치 확인 안 함)
     driver = webdriver.Chrome(service=service, options=options)
+    block_heavy_resources(driver)
     return driver
 
 
@@ -80,15 +118,44 @@ def slugify(name: str) -> str:
     return slug.strip('-')
 
 
-def scrape_morphmarket(driver):
-    """MorphMarket Morphpedia를 스크래핑."""
-    results = []
-    
+def scrape_morphmarket(pool: DriverPool, journal: CrawlJournal) -> list[dict]:
+    """
+    MorphMarket Morphpedia를 스크래핑.
+    목록 페이지는 pool에서 빌린 드라이버로 읽고, 상세 페이지는 HTTP 우선으로 병렬 수집하며
+    JavaScript 렌더링이 필요한 페이지만 pool의 드라이버로 다시 수집.
+    수집한 레코드는 즉시 journal에 기록하고 (이미 기록된 모프는 건너뜀),
+    결과 파일에 들어갈 모프 목록({name, url})을 반환한다.
+    --resume이면 저장해 둔 모프 목록을 사용하여 목록 페이지 로딩을 건너뛴다.
+    """
     print("=" * 60)
     print("🦎 MorphMarket Morphpedia Scraper 시작 (Selenium)")
     print(f"   대상: {MORPHPEDIA_URL}")
     print("=" * 60)
     
+    frontier_file = journal.companion("frontier")
+    saved = CrawlFrontier.load(frontier_file) if journal.resumed else None
+    if saved:
+        unique_morphs = saved.items()
+        print(f"\n[1/3] 저장된 모프 목록 사용 ({len(unique_morphs)}개, 목록 페이지 로딩 생략)")
+    else:
+        with pool.lease() as driver:
+            soup = load_morphpedia(driver)
+        if soup is None:
+            return []
+        unique_morphs = extract_morph_links(soup)
+        CrawlFrontier.of(unique_morphs, trailing_slash=True).save(frontier_file)
+    
+    pending = [morph for morph in unique_morphs if morph["url"] not in journal]
+    if len(pending) < len(unique_morphs):
+        print(f"[INFO] 이어서 수집: {len(unique_morphs) - len(pending)}개는 이미 기록되어 건너뜀")
+    
+    # 4. 각 모프 상세 페이지 방문 (HTTP 우선, 필요할 때만 브라우저)
+    scrape_morph_details(pending, pool, journal)
+    return unique_morphs
+
+
+def load_morphpedia(driver) -> BeautifulSoup | None:
+    """Morphpedia 목록 페이지를 끝까지 스크롤하여 로드하고 soup로 반환 (실패 시 None)."""
     # 1. Morphpedia 메인 페이지 로드
     print("\n[1/3] Morphpedia 메인 페이지 로딩 중...")
     try:
@@ -97,32 +164,26 @@ def scrape_morphmarket(driver):
         WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        # 추가 대기 (JavaScript 렌더링)
-        time.sleep(3)
+        # JavaScript 렌더링이 끝날 때까지 (네트워크 유휴) 대기
+        wait_for_network_idle(driver)
     except Exception as e:
         print(f"[ERROR] 페이지 로딩 실패: {e}")
-        return results
+        return None
     
-    # 2. 페이지 스크롤하여 모든 콘텐츠 로드
+    # 2. 페이지 스크롤하여 모든 콘텐츠 로드 (모프 링크 수가 더 이상 늘지 않으면 중단)
     print("[2/3] 페이지 스크롤 중...")
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    scroll_count = 0
-    max_scrolls = 10
-    
-    while scroll_count < max_scrolls:
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            break
-        last_height = new_height
-        scroll_count += 1
-        print(f"  스크롤 {scroll_count}회...")
+    card_count = scroll_until_stable(driver, MORPH_LINK_COUNT_EXPRESSION, max_scrolls=10)
+    print(f"  모프 링크 {card_count}개 로드됨")
     
     # 3. 모프 카드 추출
     print("[3/3] 모프 정보 추출 중...")
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
+    page_source = driver.page_source
+    page_archive.store(MORPHPEDIA_URL, page_source)
+    return make_soup(page_source)
+
+
+def extract_morph_links(soup: BeautifulSoup) -> list[dict]:
+    """Morphpedia 목록 페이지에서 고유 모프 목록({name, url})을 추출."""
     # 다양한 셀렉터로 모프 카드 찾기
     morph_cards = []
     
@@ -149,124 +210,200 @@ def scrape_morphmarket(driver):
         morph_cards = [link for link in all_links if link.get("href") != "/morphpedia/crested-geckos/"]
         print(f"[INFO] 링크 패턴으로 {len(morph_cards)}개 모프 발견")
     
-    # 중복 제거
-    seen_urls = set()
-    unique_morphs = []
+    # URL 정규화 후 중복 제거 (추적 파라미터, #앵커, 끝 슬래시 차이는 같은 모프)
+    frontier = CrawlFrontier(trailing_slash=True)
+    morphpedia_url = frontier.canonical(MORPHPEDIA_URL)
     
     for card in morph_cards:
         href = card.get("href", "")
-        if not href or href in seen_urls:
-            continue
-        if "/morphpedia/crested-geckos/" not in href:
+        if not href or "/morphpedia/crested-geckos/" not in href:
             continue
-        if href == "/morphpedia/crested-geckos/":
+        if frontier.canonical(href, BASE_URL) == morphpedia_url:
             continue
-            
-        seen_urls.add(href)
         
         # 이름 추출
         name = clean_text(card.get_text())
         if not name or len(name) < 2:
             # href에서 이름 추출
-            name_from_url = href.rstrip("/").split("/")[-1]
+            name_from_url = href.split("#")[0].split("?")[0].rstrip("/").split("/")[-1]
             name = name_from_url.replace("-", " ").title()
         
-        full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
-        unique_morphs.append({"name": name, "url": full_url})
+        frontier.add(href, base=BASE_URL, name=name)
     
+    unique_morphs = frontier.items()
     print(f"[INFO] 총 {len(unique_morphs)}개 고유 모프 발견")
+    return unique_morphs
+
+
+def scrape_morph_details(unique_morphs: list[dict], pool: DriverPool, journal: CrawlJournal) -> int:
+    """
+    모프 상세 페이지를 DETAIL_WORKERS개 스레드로 병렬 수집하여 완료되는 대로 journal에 기록.
+    각 페이지는 HTTP로 먼저 시도하고, 설명을 찾지 못했을 때만 pool의 드라이버를 빌린다.
+    성공한 모프 수를 반환한다 (출력 순서는 저장할 때 목록 순서로 맞춘다).
+    """
+    limiter = TokenBucket(MAX_REQUESTS_PER_SECOND)
+    total = len(unique_morphs)
+    
+    def visit(indexed_morph: tuple[int, dict]) -> bool:
+        i, morph = indexed_morph
+        print(f"  [{i}/{total}] {morph['name'][:30]}...")
+        record = scrape_morph_detail(morph, pool, limiter)
+        if record:
+            journal.append(record)
+        return record is not None
+    
+    indexed = list(enumerate(unique_morphs, 1))
+    if DETAIL_WORKERS <= 1:
+        return sum(visit(item) for item in indexed)
+    
+    print(f"[INFO] {DETAIL_WORKERS}개 작업자로 병렬 수집 "
+          f"(드라이버 최대 {pool.size}개, 전체 초당 {MAX_REQUESTS_PER_SECOND}회 제한)")
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+        return sum(executor.map(visit, indexed))
+
+
+def parse_morph_detail(detail_soup: BeautifulSoup, url: str | None = None) -> tuple[str, str]:
+    """
+    모프 상세 페이지에서 (설명, 타입)을 추출.
+    url은 셀렉터 학습 캐시의 페이지 템플릿 키로 사용.
+    """
+    # 설명 추출
+    desc_selectors = [
+        ".trait-description",
+        ".description",
+        "[class*='Description']",
+        ".content p",
+        "article p",
+        "main p"
+    ]
+    
+    def try_desc(selector: str) -> str | None:
+        desc_elem = detail_soup.select_one(selector)
+        if desc_elem:
+            text = clean_text(desc_elem.get_text())
+            if len(text) > 30:
+                description = text[:DESCRIPTION_MAX_LENGTH]
+                if len(text) > DESCRIPTION_MAX_LENGTH:
+                    description += "..."
+                return description
+        return None
+    
+    _, description = selector_cache.run_cascade("morph:description", desc_selectors, try_desc, url=url)
+    
+    # 타입 추출 (Dominant, Recessive 등)
+    type_selectors = [
+        ".trait-type",
+        ".inheritance",
+        "[class*='Type']",
+        ".badge",
+        ".tag"
+    ]
+    
+    def try_type(selector: str) -> str | None:
+        type_elem = detail_soup.select_one(selector)
+        if type_elem:
+            type_text = clean_text(type_elem.get_text())
+            if type_text and len(type_text) < 50:
+                return type_text
+        return None
+    
+    _, morph_type = selector_cache.run_cascade("morph:type", type_selectors, try_type, url=url)
+    
+    return description or "", morph_type or ""
+
+
+def morph_record(morph: dict, morph_type: str = "", description: str = "") -> dict:
+    """모프 결과 레코드 생성 (수집 실패 시 빈 설명/타입)."""
+    return {
+        "id": slugify(morph["name"]),
+        "name": morph["name"],
+        "type": morph_type,
+        "description": description,
+        "originalUrl": morph["url"]
+    }
+
+
+def scrape_morph_detail(morph: dict, pool: DriverPool, limiter: TokenBucket) -> dict | None:
+    """
+    모프 상세 페이지 하나를 수집하여 결과 레코드로 반환 (실패 시 None).
+    HTTP로 받은 HTML에서 설명(30자 초과)을 찾으면 브라우저를 사용하지 않는다.
+    """
+    def render_with_browser(url: str) -> tuple[str, str]:
+        limiter.acquire()
+        with pool.lease() as driver:
+            driver.get(url)
+            wait_for_network_idle(driver, timeout=DETAIL_RENDER_TIMEOUT)
+            page_source = driver.page_source
+        page_archive.store(url, page_source)
+        return parse_morph_detail(make_soup(page_source), url)
     
-    # 4. 각 모프 상세 페이지 방문
-    for i, morph in enumerate(unique_morphs, 1):
-        print(f"  [{i}/{len(unique_morphs)}] {morph['name'][:30]}...")
+    try:
+        limiter.acquire()
+        description, morph_type = hybrid_fetcher.fetch_with_fallback(
+            morph["url"],
+            http_extract=lambda soup: parse_morph_detail(soup, morph["url"]),
+            browser_extract=render_with_browser,
+            is_sufficient=lambda result: bool(result[0]),
+        )
         
-        try:
-            driver.get(morph["url"])
-            time.sleep(random.uniform(1.5, 3))
-            
-            detail_soup = BeautifulSoup(driver.page_source, "html.parser")
-            
-            # 설명 추출
-            description = ""
-            desc_selectors = [
-                ".trait-description",
-                ".description",
-                "[class*='Description']",
-                ".content p",
-                "article p",
-                "main p"
-            ]
-            
-            for selector in desc_selectors:
-                desc_elem = detail_soup.select_one(selector)
-                if desc_elem:
-                    text = clean_text(desc_elem.get_text())
-                    if len(text) > 30:
-                        description = text[:DESCRIPTION_MAX_LENGTH]
-                        if len(text) > DESCRIPTION_MAX_LENGTH:
-                            description += "..."
-                        break
-            
-            # 타입 추출 (Dominant, Recessive 등)
-            morph_type = ""
-            type_selectors = [
-                ".trait-type",
-                ".inheritance",
-                "[class*='Type']",
-                ".badge",
-                ".tag"
-            ]
-            
-            for selector in type_selectors:
-                type_elem = detail_soup.select_one(selector)
-                if type_elem:
-                    type_text = clean_text(type_elem.get_text())
-                    if type_text and len(type_text) < 50:
-                        morph_type = type_text
-                        break
-            
-            results.append({
-                "id": slugify(morph["name"]),
-                "name": morph["name"],
-                "type": morph_type,
-                "description": description,
-                "originalUrl": morph["url"]
-            })
-            
-            print(f"        ✓ 수집 완료 - {morph_type or 'Unknown Type'}")
-            
-        except Exception as e:
-            print(f"        ✗ 에러: {type(e).__name__}: {e}")
-            results.append({
-                "id": slugify(morph["name"]),
-                "name": morph["name"],
-                "type": "",
-                "description": "",
-                "originalUrl": morph["url"]
-            })
-            continue
+        print(f"        ✓ 수집 완료 - {morph['name'][:30]}: {morph_type or 'Unknown Type'}")
+        return morph_record(morph, morph_type, description)
+        
+    except Exception as e:
+        print(f"        ✗ 에러: {morph['name'][:30]}: {type(e).__name__}: {e}")
+        return None
+
+
+def reextract_morph(morph: dict) -> dict:
+    """보관된 모프 상세 HTML에서 결과 레코드를 다시 추출 (작업 프로세스에서 실행)."""
+    html = page_archive.load(morph["url"])
+    description, morph_type = parse_morph_detail(make_soup(html), morph["url"]) if html else ("", "")
+    return morph_record(morph, morph_type, description)
+
+
+def reextract_morphmarket(journal: CrawlJournal) -> list[dict]:
+    """
+    브라우저·네트워크 없이 보관소의 HTML만으로 모프 데이터를 다시 추출.
+    상세 추출은 CPU 코어 수만큼의 프로세스로 병렬 처리하며, 레코드는 journal에 기록하고
+    모프 목록을 반환한다.
+    """
+    print("=" * 60)
+    print("🦎 MorphMarket Morphpedia 재추출 (--reextract)")
+    print(f"   보관소: {page_archive.ARCHIVE_DIR} ({page_archive.size()}개 URL)")
+    print("=" * 60)
+    
+    html = page_archive.load(MORPHPEDIA_URL)
+    if html is None:
+        print("[ERROR] 보관된 Morphpedia 목록 페이지가 없습니다. 먼저 일반 모드로 수집하세요.")
+        return []
+    
+    unique_morphs = extract_morph_links(make_soup(html))
+    pending = [morph for morph in unique_morphs if morph["url"] not in journal]
     
-    return results
+    with ProcessPoolExecutor() as executor:
+        for record in executor.map(reextract_morph, pending, chunksize=8):
+            journal.append(record)
+    return unique_morphs
 
 
-def save_to_json(data: list[dict]) -> bool:
-    """수집된 데이터를 JSON 파일로 저장."""
+def save_to_json(journal: CrawlJournal, morphs: list[dict]) -> bool:
+    """
+    journal에 기록된 레코드를 morphs 순서대로 JSON 파일로 저장 (한 건씩 읽어 기록).
+    수집에 실패한 모프는 빈 설명/타입으로 저장된다.
+    """
     try:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         
-        output_data = {
+        header = {
             "source": "MorphMarket Morphpedia",
             "source_url": MORPHPEDIA_URL,
             "scraped_at": datetime.now().isoformat(),
-            "total_morphs": len(data),
-            "morphs": data
         }
-        
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        records = (journal.get(morph["url"]) or morph_record(morph) for morph in morphs)
+        write_json_stream(OUTPUT_FILE, header, "morphs", records, len(morphs))
         
         print(f"\n✅ 저장 완료: {OUTPUT_FILE}")
-        print(f"   총 {len(data)}개 모프 저장됨")
+        print(f"   총 {len(morphs)}개 모프 저장됨")
         return True
         
     except Exception as e:
@@ -274,29 +411,82 @@ def save_to_json(data: list[dict]) -> bool:
         return False
 
 
+def parse_args() -> argparse.Namespace:
+    """명령행 인자 파싱."""
+    parser = argparse.ArgumentParser(description="MorphMarket Morphpedia Scraper")
+    parser.add_argument(
+        "--reextract",
+        action="store_true",
+        help="브라우저·네트워크 없이 보관된 HTML(.page_archive)로 morph_data.json을 다시 생성",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="중단된 이전 실행의 기록(.journal)을 이어받아 이미 수집한 모프는 건너뜀",
+    )
+    parser.add_argument(
+        "--base-url",
+        help=f"사이트 주소 대신 사용할 서버 (예: fixture_server.py의 http://127.0.0.1:8002, 기본: {BASE_URL})",
+    )
+    parser.add_argument(
+        "--browser-service",
+        nargs="?",
+        const=browser_service.DEFAULT_ADDRESS,
+        metavar="HOST:PORT",
+        help=f"browser_service.py로 띄워 둔 Chrome의 탭을 사용 (주소 생략 시 {browser_service.DEFAULT_ADDRESS})",
+    )
+    return parser.parse_args()
+
+
 def main():
     """메인 실행 함수."""
+    args = parse_args()
     start_time = time.time()
-    driver = None
+    pool = None
+    
+    if args.base_url:
+        use_base_url(args.base_url)
+        print(f"[INFO] 대상 서버: {BASE_URL} (결과 저장: {OUTPUT_FILE})")
+    
+    # 레코드는 추출 즉시 journal에 기록되고, 마지막에 결과 파일로 정리된다
+    journal = CrawlJournal("morph_data", key="originalUrl", resume=args.resume)
+    
+    if args.reextract:
+        morphs = reextract_morphmarket(journal)
+        if morphs:
+            if save_to_json(journal, morphs):
+                journal.remove()
+        else:
+            print("\n⚠️ 재추출된 데이터가 없습니다.")
+        journal.close()
+        print(f"\n⏱️ 총 소요 시간: {time.time() - start_time:.1f}초")
+        return
     
     try:
-        print("[INIT] Chrome 드라이버 초기화 중...")
-        driver = create_driver()
+        # 목록 페이지와 상세 페이지가 함께 쓰는 드라이버 풀 (드라이버는 필요할 때만 생성,
+        # --browser-service면 상주 Chrome의 탭을 빌림)
+        pool = browser_service.service_pool(create_driver, DETAIL_WORKERS, args.browser_service)
         
         # 스크래핑 실행
-        data = scrape_morphmarket(driver)
+        morphs = scrape_morphmarket(pool, journal)
         
-        if data:
-            save_to_json(data)
+        if morphs:
+            if save_to_json(journal, morphs):
+                journal.remove()
         else:
             print("\n⚠️ 수집된 데이터가 없습니다.")
             
     except Exception as e:
         print(f"\n[FATAL] 치명적 오류: {e}")
     finally:
-        if driver:
-            driver.quit()
-            print("[CLEANUP] 드라이버 종료됨")
+        journal.close()
+        if pool:
+            pool.close()
+            print("[CLEANUP] 드라이버 풀 종료됨")
+    
+    selector_cache.save()
+    hybrid_fetcher.report()
+    selector_cache.report()
     
     elapsed = time.time() - start_time
     print(f"\n⏱️ 총 소요 시간: {elapsed:.1f}초")
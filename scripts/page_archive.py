@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Page Archive - 수집한 원본 HTML 압축 보관소
+==========================================
+스크래퍼가 가져온 HTML을 그대로 보관해 두면, 추출 로직(셀렉터 등)을 고친 뒤
+사이트를 다시 크롤링하지 않고 --reextract 모드로 결과 JSON을 다시 만들 수 있습니다.
+URL 발견에 쓴 robots.txt와 sitemap XML도 같은 방식으로 보관됩니다 (fixture_server 재생용).
+
+- 본문: gzip 압축, 내용 주소 지정 (SHA-256) -> 같은 HTML은 한 번만 저장
+    .page_archive/objects/ab/abcdef....html.gz
+- 색인: URL -> (해시, 수집 시각) 을 한 줄씩 추가하는 JSONL
+    .page_archive/index.jsonl  (같은 URL은 마지막 줄이 최신, 내용이 같아도 다시 수집하면 수집 시각 갱신)
+
+사용 예:
+--------
+    page_archive.store(url, html)
+    html = page_archive.load(url)      # 보관된 최신 HTML (없으면 None)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+ARCHIVE_DIR = SCRIPT_DIR / ".page_archive"
+ARCHIVE_ENABLED = True  # False면 store()가 아무것도 저장하지 않음
+
+_lock = threading.Lock()
+_index: dict[str, dict] | None = None
+
+
+def _objects_dir() -> Path:
+    return ARCHIVE_DIR / "objects"
+
+
+def _index_file() -> Path:
+    return ARCHIVE_DIR / "index.jsonl"
+
+
+def _object_path(digest: str) -> Path:
+    return _objects_dir() / digest[:2] / f"{digest}.html.gz"
+
+
+def _load_index() -> dict[str, dict]:
+    """색인 파일을 읽어 URL -> 최신 항목 dict로 반환 (최초 1회, lock 보유 상태에서 호출)."""
+    global _index
+    if _index is None:
+        _index = {}
+        try:
+            with open(_index_file(), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # 중단된 쓰기로 깨진 줄은 무시
+                    _index[entry["url"]] = entry
+        except OSError:
+            pass
+    return _index
+
+
+def store(url: str, html: str) -> None:
+    """
+    HTML을 압축하여 보관하고 색인에 (URL, 해시, 수집 시각)을 추가.
+    내용이 이전과 같으면 본문은 다시 쓰지 않지만, 수집 시각은 이번 시각으로 갱신한다.
+    """
+    if not ARCHIVE_ENABLED or not html:
+        return
+
+    data = html.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    path = _object_path(digest)
+
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    entry = {"url": url, "sha256": digest, "fetched_at": datetime.now().isoformat()}
+    with _lock:
+        index = _load_index()
+        with open(_index_file(), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        index[url] = entry
+
+
+def entry(url: str) -> dict | None:
+    """URL의 최신 색인 항목 ({url, sha256, fetched_at})."""
+    with _lock:
+        return _load_index().get(url)
+
+
+def load(url: str) -> str | None:
+    """URL의 최신 보관 HTML (없으면 None)."""
+    item = entry(url)
+    if not item:
+        return None
+    try:
+        with gzip.open(_object_path(item["sha256"]), "rb") as f:
+            return f.read().decode("utf-8")
+    except OSError:
+        return None
+
+
+def size() -> int:
+    """보관된 URL 수."""
+    with _lock:
+        return len(_load_index())
+
+
+def urls(prefix: str = "") -> list[str]:
+    """prefix로 시작하는 보관 URL 목록 (처음 보관된 순서)."""
+    with _lock:
+        return [url for url in _load_index() if url.startswith(prefix)]
@@ -12,48 +12,105 @@ JSON 파일로 저장하는 자동화 스크립트입니다.
    pip install -r requirements.txt
 
 2. 스크립트 실행:
-   python pangea_scraper.py
+   python pangea_scraper.py                 # 전체 수집
+   python pangea_scraper.py --incremental   # 새 게시글 + 일부 재검증만 수집 후 병합
+   python pangea_scraper.py --reextract     # 네트워크 없이 보관된 HTML로 JSON 재생성
+   python pangea_scraper.py --resume        # 중단된 실행을 이어서 (이미 수집한 게시글은 건너뜀)
+   python pangea_scraper.py --base-url http://127.0.0.1:8001   # fixture_server.py로 오프라인 재생
 
 출력:
 -----
 ../src/constants/pangea_data.json
 """
 
+import argparse
+import asyncio
 import json
 import os
 import random
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import requests
 from bs4 import BeautifulSoup
 
+import crawl_journal
+import http_client
+import page_archive
+import selector_cache
+import sitemap
+from crawl_frontier import CrawlFrontier, canonicalize
+from crawl_journal import CrawlJournal, write_json_stream
+from html_parser import make_soup
+from http_cache import ResponseCache
+from rate_limiter import HostRateLimiter
+
 # ============ 설정 ============
 BASE_URL = "https://www.pangeareptile.com"
 BLOG_URL = f"{BASE_URL}/blogs/blog"
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 REQUEST_TIMEOUT = 30
 SUMMARY_LENGTH = 200
 
+# 동시 수집 설정 (MAX_CONCURRENCY <= 1 이면 기존 순차 수집 + 랜덤 딜레이)
+MAX_CONCURRENCY = 8        # 동시에 진행할 최대 요청 수
+REQUESTS_PER_SECOND = 2.0  # 호스트당 초당 요청 수 (차단 방지)
+RATE_BURST = 2             # 호스트당 순간 허용 요청 수
+
+# 목록 페이지네이션 설정
+MAX_LIST_PAGES = 100       # 따라갈 최대 목록 페이지 수 (무한 루프 방지)
+PAGE_PARAM_PATTERN = re.compile(r"[?&]page=(\d+)")
+
+# URL 발견 설정 (순서·제목은 목록 페이지, sitemap.xml은 URL 보충과 lastmod에 사용)
+USE_SITEMAP = True
+SITEMAP_FOLLOW = "sitemap_blogs"  # Shopify sitemap 색인 중 블로그 sitemap만 따라감
+
+# 증분 수집 설정 (--incremental)
+REVALIDATE_SAMPLE = 5      # 변경 여부를 확인하기 위해 다시 수집할 기존 게시글 수
+
 # 출력 경로 (스크립트 위치 기준 상대 경로)
 SCRIPT_DIR = Path(__file__).parent.resolve()
 OUTPUT_DIR = SCRIPT_DIR.parent / "src" / "constants"
 OUTPUT_FILE = OUTPUT_DIR / "pangea_data.json"
 
+# --base-url로 다른 서버(fixture_server.py)를 대상으로 할 때의 결과 저장 위치
+REPLAY_DIR = SCRIPT_DIR / ".replay"
+
+# 조건부 GET 캐시 (변경되지 않은 페이지는 304로 받아 캐시 본문을 재사용)
+HTTP_CACHE_DIR = SCRIPT_DIR / ".http_cache"
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+response_cache = ResponseCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES)
+
+# 목록/상세 페이지 요청이 공유하는 호스트별 속도 제한기
+rate_limiter = HostRateLimiter(REQUESTS_PER_SECOND, RATE_BURST)
+
+
+def use_base_url(base_url: str) -> None:
+    """
+    대상 사이트 주소를 바꿈 (fixture_server.py로 녹화된 페이지를 재생할 때).
+    실제 데이터를 덮어쓰지 않도록 결과와 수집 기록은 REPLAY_DIR에 저장하고, 보관소에는 저장하지 않는다.
+    """
+    global BASE_URL, BLOG_URL, OUTPUT_DIR, OUTPUT_FILE
+    BASE_URL = base_url.rstrip("/")
+    BLOG_URL = f"{BASE_URL}/blogs/blog"
+    OUTPUT_DIR = REPLAY_DIR
+    OUTPUT_FILE = REPLAY_DIR / OUTPUT_FILE.name
+    crawl_journal.JOURNAL_DIR = REPLAY_DIR / ".journal"
+    page_archive.ARCHIVE_ENABLED = False
+
 
 def get_soup(url: str) -> BeautifulSoup | None:
     """
     URL에서 HTML을 가져와 BeautifulSoup 객체로 반환.
-    네트워크 에러 시 None 반환.
+    공유 세션(keep-alive, 재시도 포함)과 조건부 GET 캐시를 사용하며,
+    재시도 후에도 실패하면 None 반환.
     """
-    headers = {"User-Agent": USER_AGENT}
-    
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, "html.parser")
+        html = http_client.get_text(url, cache=response_cache, timeout=REQUEST_TIMEOUT)
+        page_archive.store(url, html)
+        return make_soup(html)
     except requests.RequestException as e:
         print(f"[ERROR] 페이지 요청 실패: {url}")
         print(f"        {type(e).__name__}: {e}")
@@ -70,9 +127,10 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
-def extract_blog_list(soup: BeautifulSoup) -> list[dict]:
+def extract_blog_list(soup: BeautifulSoup, url: str | None = None) -> list[dict]:
     """
     블로그 목록 페이지에서 게시글 링크와 제목 추출.
+    url은 셀렉터 학습 캐시의 페이지 템플릿 키로 사용 (기본값: BLOG_URL).
     """
     articles = []
     
@@ -87,25 +145,22 @@ def extract_blog_list(soup: BeautifulSoup) -> list[dict]:
         ".article"
     ]
     
-    for selector in selectors:
-        items = soup.select(selector)
-        if items:
-            print(f"[INFO] '{selector}' 셀렉터로 {len(items)}개 게시글 발견")
-            break
+    selector, items = selector_cache.run_cascade(
+        "pangea:list", selectors, lambda selector: soup.select(selector) or None,
+        url=url or BLOG_URL,
+    )
+    if items:
+        print(f"[INFO] '{selector}' 셀렉터로 {len(items)}개 게시글 발견")
     else:
         # 대체: 모든 링크에서 /blogs/blog/ 패턴 찾기
         print("[INFO] 기본 셀렉터로 게시글을 찾지 못함. 링크 패턴으로 검색 중...")
         all_links = soup.find_all("a", href=re.compile(r"/blogs/blog/[^/]+"))
-        seen_urls = set()
+        found = CrawlFrontier(trailing_slash=False)
         
         for link in all_links:
-            href = link.get("href", "")
-            if href and href not in seen_urls:
-                seen_urls.add(href)
-                title = clean_text(link.get_text()) or "Untitled"
-                full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
-                articles.append({"title": title, "url": full_url})
+            found.add(link["href"], base=BASE_URL, title=clean_text(link.get_text()) or "Untitled")
         
+        articles = found.items()
         print(f"[INFO] 링크 패턴으로 {len(articles)}개 게시글 발견")
         return articles
     
@@ -122,15 +177,101 @@ def extract_blog_list(soup: BeautifulSoup) -> list[dict]:
         title_tag = item.find(["h1", "h2", "h3", "h4"]) or link_tag
         title = clean_text(title_tag.get_text()) if title_tag else "Untitled"
         
-        full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
-        articles.append({"title": title, "url": full_url})
+        articles.append({"title": title, "url": canonicalize(href, BASE_URL, trailing_slash=False)})
+    
+    return articles
+
+
+def page_url(page: int) -> str:
+    """블로그 목록의 N번째 페이지 URL."""
+    return BLOG_URL if page <= 1 else f"{BLOG_URL}?page={page}"
+
+
+def discover_page_count(soup: BeautifulSoup) -> int:
+    """목록 페이지의 페이지네이션 링크(?page=N)에서 가장 큰 페이지 번호를 반환."""
+    pages = [
+        int(match.group(1))
+        for link in soup.find_all("a", href=True)
+        if "/blogs/blog" in link["href"] and (match := PAGE_PARAM_PATTERN.search(link["href"]))
+    ]
+    return max(pages, default=1)
+
+
+def find_next_page_url(soup: BeautifulSoup) -> str | None:
+    """목록 페이지의 '다음 페이지' 링크 URL (없으면 None)."""
+    next_selectors = [
+        "link[rel='next']",
+        "a[rel='next']",
+        ".pagination__next a",
+        "a.pagination__next",
+        "a[aria-label='Next page']",
+        ".pagination .next a",
+    ]
+    
+    for selector in next_selectors:
+        link = soup.select_one(selector)
+        if link and link.get("href"):
+            return canonicalize(link["href"], BASE_URL, trailing_slash=False)
+    
+    return None
+
+
+def collect_blog_list(first_soup: BeautifulSoup, fetch_page=None) -> list[dict]:
+    """
+    첫 목록 페이지부터 페이지네이션을 따라 전체 게시글 목록을 수집.
+    페이지 수를 알 수 있으면 나머지 목록 페이지를 동시에 가져오고,
+    이후 '다음 페이지' 링크가 남아 있으면 순서대로 따라간다.
+    목록 페이지와 게시글 URL은 정규화하여 중복 제거한다 (먼저 나온 항목 유지).
+    fetch_page(url)가 주어지면 (예: 보관소 읽기) 네트워크 대신 그 함수로 순서대로 읽는다.
+    """
+    def fetch_one(url: str) -> BeautifulSoup | None:
+        if fetch_page:
+            return fetch_page(url)
+        rate_limiter.acquire(url)
+        return get_soup(url)
+    
+    soups = [first_soup]
+    fetched_pages = CrawlFrontier(trailing_slash=False)
+    fetched_pages.add(page_url(1))
+    
+    page_count = min(discover_page_count(first_soup), MAX_LIST_PAGES)
+    if page_count > 1:
+        print(f"[INFO] 목록 페이지 {page_count}개 발견")
+        urls = [page_url(page) for page in range(2, page_count + 1)]
+        for url in urls:
+            fetched_pages.add(url)
+        if MAX_CONCURRENCY > 1 and not fetch_page:
+            soups.extend(asyncio.run(run_concurrently(get_soup, urls, lambda url: url)))
+        else:
+            soups.extend(fetch_one(url) for url in urls)
+    
+    # 숫자 페이지네이션이 일부만 노출된 경우를 위해 '다음 페이지' 링크를 끝까지 추적
+    last_soup = next((soup for soup in reversed(soups) if soup), None)
+    next_url = find_next_page_url(last_soup) if last_soup else None
+    while next_url and next_url not in fetched_pages and len(fetched_pages.items()) < MAX_LIST_PAGES:
+        fetched_pages.add(next_url)
+        soup = fetch_one(next_url)
+        if not soup:
+            break
+        soups.append(soup)
+        next_url = find_next_page_url(soup)
+    
+    found = CrawlFrontier(trailing_slash=False)
+    for soup in soups:
+        if not soup:
+            continue
+        for article in extract_blog_list(soup):
+            found.add(**article)
     
+    articles = found.items()
+    print(f"[INFO] 목록 페이지 {len([soup for soup in soups if soup])}개에서 고유 게시글 {len(articles)}개 수집")
     return articles
 
 
-def extract_article_content(soup: BeautifulSoup) -> str:
+def extract_article_content(soup: BeautifulSoup, url: str | None = None) -> str:
     """
     게시글 상세 페이지에서 본문 내용 추출.
+    url은 셀렉터 학습 캐시의 페이지 템플릿 키로 사용.
     """
     # 본문 콘텐츠를 담는 다양한 셀렉터 시도
     content_selectors = [
@@ -143,7 +284,7 @@ def extract_article_content(soup: BeautifulSoup) -> str:
         "article"
     ]
     
-    for selector in content_selectors:
+    def try_selector(selector: str) -> str | None:
         content_elem = soup.select_one(selector)
         if content_elem:
             # 스크립트, 스타일 태그 제거
@@ -153,94 +294,383 @@ def extract_article_content(soup: BeautifulSoup) -> str:
             text = clean_text(content_elem.get_text())
             if len(text) > 50:  # 최소 50자 이상의 내용이 있어야 유효
                 return text
+        return None
     
-    return ""
+    _, text = selector_cache.run_cascade("pangea:content", content_selectors, try_selector, url=url)
+    return text or ""
+
+
+def extract_article_title(soup: BeautifulSoup) -> str | None:
+    """게시글 상세 페이지의 제목 (og:title, 없으면 첫 h1)."""
+    meta = soup.select_one("meta[property='og:title']")
+    if meta and meta.get("content"):
+        return clean_text(meta["content"])
+    heading = soup.find("h1")
+    return clean_text(heading.get_text()) if heading else None
+
 
+def article_title(article: dict, soup: BeautifulSoup) -> str:
+    """레코드에 넣을 제목. 목록 페이지에 없어 sitemap으로만 발견한 게시글은 상세 페이지의 제목을 사용."""
+    if article.get("title_from_page"):
+        return extract_article_title(soup) or article["title"]
+    return article["title"]
 
-def scrape_pangea_blog() -> list[dict]:
+
+def scrape_pangea_blog(journal: CrawlJournal, incremental: bool = False) -> list[str]:
     """
     Pangea Reptile 블로그 전체를 스크래핑.
+    수집한 레코드는 즉시 journal에 기록하고, 결과 파일에 들어갈 게시글 URL을 순서대로 반환한다.
+    journal에 이미 있는 게시글(--resume)은 다시 수집하지 않는다.
+    incremental=True면 기존 pangea_data.json에 없는 게시글과 일부 재검증 대상만 수집하여 병합한다.
     """
     results = []
     
     print("=" * 60)
     print("🦎 Pangea Reptile Blog Scraper 시작")
     print(f"   대상: {BLOG_URL}")
+    if incremental:
+        print("   모드: 증분 수집 (--incremental)")
     print("=" * 60)
     
-    # 1. 블로그 목록 페이지 가져오기
-    print("\n[1/3] 블로그 목록 페이지 수집 중...")
-    soup = get_soup(BLOG_URL)
-    
-    if not soup:
-        print("[ERROR] 블로그 목록 페이지를 가져올 수 없습니다.")
-        return results
-    
-    # 2. 게시글 목록 추출
-    print("[2/3] 게시글 목록 추출 중...")
-    articles = extract_blog_list(soup)
+    # 1~2. 게시글 목록 수집 (--resume이면 저장된 목록, 아니면 목록 페이지 + 페이지네이션에 sitemap lastmod를 붙임)
+    frontier_file = journal.companion("frontier")
+    saved = CrawlFrontier.load(frontier_file) if journal.resumed else None
+    if saved:
+        articles = saved.items()
+        print(f"\n[1/3] 저장된 게시글 목록 사용 ({len(articles)}개, 목록 수집 생략)")
+    else:
+        print("\n[1/3] 블로그 목록 페이지 수집 중...")
+        soup = get_soup(BLOG_URL)
+        if not soup:
+            print("[WARNING] 블로그 목록 페이지를 가져올 수 없습니다. sitemap만 사용합니다.")
+        articles = discover_articles(soup)
     
     if not articles:
         print("[WARNING] 게시글을 찾을 수 없습니다. 사이트 구조가 변경되었을 수 있습니다.")
         return results
     
     print(f"[INFO] 총 {len(articles)}개 게시글 발견")
+    if not saved:
+        CrawlFrontier.of(articles, trailing_slash=False).save(frontier_file)
+    
+    existing = load_existing_articles() if incremental else []
+    targets = select_incremental_targets(articles, existing) if incremental else articles
+    
+    # 수집 대기열: 새 게시글을 재검증 대상보다 먼저, 같은 순위는 목록 순서대로
+    known_urls = {article["url"] for article in existing}
+    queue = CrawlFrontier(trailing_slash=False)
+    for article in targets:
+        if article["url"] not in journal:
+            queue.add(**article, priority=int(article["url"] in known_urls))
+    pending = queue.drain()
+    if len(pending) < len(targets):
+        print(f"[INFO] 이어서 수집: {len(targets) - len(pending)}개는 이미 기록되어 건너뜀")
     
     # 3. 각 게시글 상세 내용 수집
     print("[3/3] 게시글 상세 내용 수집 중...")
+    fetch_articles(pending, journal)
+    
+    if incremental:
+        return merge_articles(articles, existing, journal)
     
+    results.extend(article["url"] for article in articles if article["url"] in journal)
+    return results
+
+
+def discover_articles(first_soup: BeautifulSoup | None, fetch_page=None) -> list[dict]:
+    """
+    게시글 목록을 수집. 순서와 제목은 목록 페이지(페이지네이션 포함)를 그대로 따르고,
+    sitemap은 URL 집합과 lastmod에만 사용한다: 목록의 게시글에 sitemap의 lastmod를 붙이고,
+    목록에 없는 sitemap 게시글은 lastmod 최신순으로 뒤에 붙인다 (제목은 상세 페이지에서 읽음).
+    목록 페이지가 없으면 (first_soup이 None) sitemap 게시글만 lastmod 최신순으로 반환한다.
+    fetch_page는 collect_blog_list에 그대로 넘긴다.
+    """
+    listed = collect_blog_list(first_soup, fetch_page=fetch_page) if first_soup else []
+    mapped = discover_from_sitemap() if USE_SITEMAP else []
+    lastmods = {article["url"]: article["lastmod"] for article in mapped}
+    
+    found = CrawlFrontier(trailing_slash=False)
+    for article in listed:
+        found.add(**article, lastmod=lastmods.get(article["url"]))
+    extra = sum(found.add(**article) is not None for article in mapped)
+    if listed and extra:
+        print(f"[INFO] 목록 페이지에 없는 게시글 {extra}개를 sitemap에서 추가")
+    return found.items()
+
+
+def discover_from_sitemap() -> list[dict]:
+    """
+    sitemap.xml에서 게시글 목록을 lastmod 최신순으로 수집 (lastmod가 없는 게시글은 sitemap 순서대로 맨 뒤).
+    sitemap에는 제목이 없으므로 URL로 만든 임시 제목을 넣고, 상세 페이지에서 실제 제목으로 바꾼다.
+    lastmod는 증분 수집의 변경 감지에 사용한다. sitemap이 없으면 빈 리스트.
+    """
+    print("[2/3] sitemap.xml에서 게시글 lastmod 수집 중...")
+    entries = sitemap.discover(BASE_URL, prefix=f"{BLOG_URL}/", follow=SITEMAP_FOLLOW)
+    if not entries:
+        print("[INFO] sitemap을 사용할 수 없어 목록 페이지만 사용합니다.")
+        return []
+    
+    entries = sorted(entries, key=lambda entry: entry.lastmod or datetime.min, reverse=True)
+    found = CrawlFrontier(trailing_slash=False)
+    for entry in entries:
+        found.add(
+            entry.url, title=sitemap.title_from_url(entry.url), title_from_page=True,
+            lastmod=entry.lastmod.isoformat() if entry.lastmod else None,
+        )
+    return found.items()
+
+
+def fetch_articles(articles: list[dict], journal: CrawlJournal) -> int:
+    """
+    게시글 목록의 상세 페이지를 수집하여 성공한 레코드를 journal에 기록.
+    성공한 게시글 수를 반환한다.
+    """
+    if MAX_CONCURRENCY > 1:
+        print(f"[INFO] 비동기 수집 (동시 {MAX_CONCURRENCY}개, 호스트당 초당 {REQUESTS_PER_SECOND}회)")
+        return sum(asyncio.run(scrape_articles_async(articles, journal)))
+    
+    saved = 0
     for i, article in enumerate(articles, 1):
         print(f"  [{i}/{len(articles)}] {article['title'][:40]}...")
         
         # 차단 방지를 위한 랜덤 딜레이
         time.sleep(random.uniform(1, 3))
         
-        try:
-            detail_soup = get_soup(article["url"])
-            
-            if detail_soup:
-                content = extract_article_content(detail_soup)
-                summary = content[:SUMMARY_LENGTH] + "..." if len(content) > SUMMARY_LENGTH else content
-                
-                results.append({
-                    "title": article["title"],
-                    "url": article["url"],
-                    "summary": summary,
-                    "content": content,
-                    "scraped_at": datetime.now().isoformat()
-                })
-                print(f"        ✓ 수집 완료 ({len(content)}자)")
-            else:
-                print(f"        ✗ 상세 페이지 로드 실패")
-                
-        except Exception as e:
-            print(f"        ✗ 에러 발생: {type(e).__name__}: {e}")
+        saved += record_article(article, journal)
+    
+    return saved
+
+
+def load_existing_articles() -> list[dict]:
+    """기존 pangea_data.json의 게시글 목록을 반환 (없거나 읽을 수 없으면 빈 리스트)."""
+    if not OUTPUT_FILE.exists():
+        print(f"[INFO] 기존 데이터 없음: {OUTPUT_FILE} (전체 수집으로 진행)")
+        return []
+    
+    try:
+        with open(OUTPUT_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("articles", [])
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] 기존 데이터를 읽을 수 없습니다: {type(e).__name__}: {e}")
+        return []
+
+
+def is_modified_since(article: dict, old: dict) -> bool:
+    """sitemap lastmod가 기존 레코드의 수집 시각보다 나중이면 True."""
+    try:
+        return datetime.fromisoformat(article["lastmod"]) > datetime.fromisoformat(old["scraped_at"])
+    except (KeyError, TypeError, ValueError):
+        return True  # 수집 시각을 알 수 없으면 다시 수집
+
+
+def select_incremental_targets(articles: list[dict], existing: list[dict]) -> list[dict]:
+    """
+    목록 중 새 게시글과, 변경된 기존 게시글을 골라 반환 (목록 순서 유지).
+    sitemap lastmod가 있는 게시글은 lastmod로 변경 여부를 판단하고,
+    lastmod가 없는 게시글 중에서는 재검증할 샘플을 무작위로 고른다.
+    """
+    existing_by_url = {article["url"]: article for article in existing}
+    new_articles = [article for article in articles if article["url"] not in existing_by_url]
+    known_articles = [article for article in articles if article["url"] in existing_by_url]
+    
+    modified = [article for article in known_articles
+                if article.get("lastmod") and is_modified_since(article, existing_by_url[article["url"]])]
+    undated = [article for article in known_articles if not article.get("lastmod")]
+    sample = random.sample(undated, min(REVALIDATE_SAMPLE, len(undated)))
+    revalidate_urls = {article["url"] for article in modified + sample}
+    
+    print(f"[INFO] 증분 수집: 새 게시글 {len(new_articles)}개, lastmod 변경 {len(modified)}개, "
+          f"재검증 {len(sample)}개 (기존 {len(existing)}개)")
+    
+    return [article for article in articles
+            if article["url"] not in existing_by_url or article["url"] in revalidate_urls]
+
+
+def merge_articles(articles: list[dict], existing: list[dict],
+                   journal: CrawlJournal) -> list[str]:
+    """
+    journal에 기록된 새 레코드를 기존 데이터에 병합하여 결과 URL 목록을 반환.
+    새 게시글을 발견 순서대로 앞에 두고, 기존 게시글은 기존 순서를 그대로 유지한다
+    (목록에 없는 기존 게시글도 유지). 발견 경로(sitemap / 목록 페이지)에 따라 순서가 바뀌지 않도록 한다.
+    재검증한 게시글은 본문이 바뀐 경우에만 교체한다 (유지하는 기존 레코드도 journal에 기록).
+    제목은 비교하지 않는다: 목록 카드의 제목과 상세 페이지의 og:title은 표기가 다를 수 있다.
+    """
+    existing_by_url = {article["url"]: article for article in existing}
+    
+    merged = []
+    seen = set()
+    added = 0
+    updated = 0
+    
+    for article in articles:
+        url = article["url"]
+        if url in existing_by_url or url in seen:
             continue
+        seen.add(url)
+        if url in journal:
+            merged.append(url)
+            added += 1
+    
+    for old in existing:
+        url = old["url"]
+        if url in seen:
+            continue
+        seen.add(url)
+        new = journal.get(url)
+        if new and new["content"] != old["content"]:
+            updated += 1
+        else:
+            journal.append(old)
+        merged.append(url)
+    
+    print(f"[INFO] 병합 완료: 추가 {added}개, 변경 {updated}개, 전체 {len(merged)}개")
+    return merged
+
+
+def scrape_article(article: dict) -> dict | None:
+    """
+    게시글 하나의 상세 페이지를 수집하여 결과 레코드로 반환.
+    실패 시 None 반환.
+    """
+    try:
+        detail_soup = get_soup(article["url"])
+        
+        if detail_soup:
+            content = extract_article_content(detail_soup, article["url"])
+            summary = content[:SUMMARY_LENGTH] + "..." if len(content) > SUMMARY_LENGTH else content
+            
+            print(f"        ✓ 수집 완료 ({len(content)}자) - {article['title'][:40]}")
+            return {
+                "title": article_title(article, detail_soup),
+                "url": article["url"],
+                "summary": summary,
+                "content": content,
+                "scraped_at": datetime.now().isoformat()
+            }
+        else:
+            print(f"        ✗ 상세 페이지 로드 실패 - {article['title'][:40]}")
+            
+    except Exception as e:
+        print(f"        ✗ 에러 발생: {type(e).__name__}: {e}")
+    
+    return None
+
+
+def record_article(article: dict, journal: CrawlJournal) -> bool:
+    """게시글 하나를 수집하여 성공하면 journal에 기록. 성공 여부를 반환."""
+    record = scrape_article(article)
+    if record:
+        journal.append(record)
+    return record is not None
+
+
+async def run_concurrently(func, items: list, url_of) -> list:
+    """
+    items의 각 항목에 블로킹 함수 func를 동시에 적용.
+    동시 요청 수는 세마포어로, 호스트별 요청 속도는 토큰 버킷으로 제한한다.
+    반환 리스트는 입력 순서를 유지한다.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    
+    async def worker(item):
+        async with semaphore:
+            await rate_limiter.acquire_async(url_of(item))
+            # requests는 블로킹 호출이므로 스레드에서 실행
+            return await asyncio.to_thread(func, item)
+    
+    return await asyncio.gather(*(worker(item) for item in items))
+
+
+async def scrape_articles_async(articles: list[dict], journal: CrawlJournal) -> list[bool]:
+    """
+    게시글 상세 페이지를 동시에 수집하여 완료되는 대로 journal에 기록.
+    반환 리스트는 입력 순서대로의 성공 여부.
+    """
+    return await run_concurrently(
+        lambda article: record_article(article, journal), articles, lambda article: article["url"]
+    )
+
+
+def get_archived_soup(url: str) -> BeautifulSoup | None:
+    """보관소(page_archive)에 저장된 HTML을 BeautifulSoup 객체로 반환 (없으면 None)."""
+    html = page_archive.load(url)
+    if html is None:
+        print(f"[WARNING] 보관된 페이지 없음: {url}")
+        return None
+    return make_soup(html)
+
+
+def reextract_article(article: dict) -> dict | None:
+    """보관된 게시글 HTML에서 결과 레코드를 다시 추출 (작업 프로세스에서 실행)."""
+    soup = get_archived_soup(article["url"])
+    if not soup:
+        return None
     
+    content = extract_article_content(soup, article["url"])
+    summary = content[:SUMMARY_LENGTH] + "..." if len(content) > SUMMARY_LENGTH else content
+    
+    return {
+        "title": article_title(article, soup),
+        "url": article["url"],
+        "summary": summary,
+        "content": content,
+        "scraped_at": page_archive.entry(article["url"])["fetched_at"]
+    }
+
+
+def reextract_pangea_blog(journal: CrawlJournal) -> list[str]:
+    """
+    네트워크 요청 없이 보관소의 HTML만으로 게시글 데이터를 다시 추출.
+    목록은 보관된 목록 페이지에서 (없으면 sitemap으로 수집한 보관 게시글 전체),
+    상세 추출은 CPU 코어 수만큼의 프로세스로 병렬 처리한다.
+    scraped_at에는 해당 HTML을 수집한 시각을 넣는다.
+    레코드는 journal에 기록하고 결과 URL 목록을 반환한다.
+    """
+    print("=" * 60)
+    print("🦎 Pangea Reptile Blog 재추출 (--reextract)")
+    print(f"   보관소: {page_archive.ARCHIVE_DIR} ({page_archive.size()}개 URL)")
+    print("=" * 60)
+    
+    if page_archive.entry(BLOG_URL):
+        articles = collect_blog_list(get_archived_soup(BLOG_URL), fetch_page=get_archived_soup)
+    else:
+        articles = [
+            {"title": sitemap.title_from_url(url), "url": url, "title_from_page": True}
+            for url in page_archive.urls(prefix=f"{BLOG_URL}/")
+        ]
+    
+    if not articles:
+        print("[ERROR] 보관된 게시글이 없습니다. 먼저 일반 모드로 수집하세요.")
+        return []
+    pending = [article for article in articles if article["url"] not in journal]
+    
+    with ProcessPoolExecutor() as executor:
+        for record in executor.map(reextract_article, pending, chunksize=8):
+            if record:
+                journal.append(record)
+    
+    results = [article["url"] for article in articles if article["url"] in journal]
+    print(f"[INFO] {len(results)}/{len(articles)}개 게시글 재추출 완료")
     return results
 
 
-def save_to_json(data: list[dict]) -> bool:
+def save_to_json(journal: CrawlJournal, urls: list[str]) -> bool:
     """
-    수집된 데이터를 JSON 파일로 저장.
+    journal에 기록된 레코드를 urls 순서대로 JSON 파일로 저장 (한 건씩 읽어 기록).
     """
     try:
         # 출력 디렉토리 생성 (없으면)
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         
-        output_data = {
+        header = {
             "source": "Pangea Reptile Blog",
             "source_url": BLOG_URL,
             "scraped_at": datetime.now().isoformat(),
-            "total_articles": len(data),
-            "articles": data
         }
-        
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        write_json_stream(OUTPUT_FILE, header, "articles", (journal.get(url) for url in urls), len(urls))
         
         print(f"\n✅ 저장 완료: {OUTPUT_FILE}")
-        print(f"   총 {len(data)}개 게시글 저장됨")
+        print(f"   총 {len(urls)}개 게시글 저장됨")
         return True
         
     except Exception as e:
@@ -248,17 +678,61 @@ def save_to_json(data: list[dict]) -> bool:
         return False
 
 
+def parse_args() -> argparse.Namespace:
+    """명령행 인자 파싱."""
+    parser = argparse.ArgumentParser(description="Pangea Reptile Blog Scraper")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="기존 pangea_data.json에 없는 게시글과 일부 재검증 대상만 수집하여 병합",
+    )
+    parser.add_argument(
+        "--reextract",
+        action="store_true",
+        help="네트워크 요청 없이 보관된 HTML(.page_archive)로 pangea_data.json을 다시 생성",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="중단된 이전 실행의 기록(.journal)을 이어받아 이미 수집한 게시글은 건너뜀",
+    )
+    parser.add_argument(
+        "--base-url",
+        help=f"사이트 주소 대신 사용할 서버 (예: fixture_server.py의 http://127.0.0.1:8001, 기본: {BASE_URL})",
+    )
+    return parser.parse_args()
+
+
 def main():
     """메인 실행 함수."""
+    args = parse_args()
     start_time = time.time()
     
+    if args.base_url:
+        use_base_url(args.base_url)
+        print(f"[INFO] 대상 서버: {BASE_URL} (결과 저장: {OUTPUT_FILE})")
+    
+    # 레코드는 추출 즉시 journal에 기록되고, 마지막에 결과 파일로 정리된다
+    journal = CrawlJournal("pangea_data", resume=args.resume)
+    
     # 스크래핑 실행
-    data = scrape_pangea_blog()
+    if args.reextract:
+        urls = reextract_pangea_blog(journal)
+    else:
+        urls = scrape_pangea_blog(journal, incremental=args.incremental)
     
-    if data:
-        save_to_json(data)
+    if urls:
+        if save_to_json(journal, urls):
+            journal.remove()
     else:
         print("\n⚠️ 수집된 데이터가 없습니다.")
+    journal.close()
+    
+    selector_cache.save()
+    
+    http_client.stats.report()
+    response_cache.report()
+    selector_cache.report()
     
     elapsed = time.time() - start_time
     print(f"\n⏱️ 총 소요 시간: {elapsed:.1f}초")
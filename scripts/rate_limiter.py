@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rate Limiter - 호스트별 토큰 버킷 속도 제한기
+=============================================
+스크래퍼들이 고정 sleep 대신 공유하는 요청 속도 제한 유틸리티입니다.
+
+- TokenBucket: 초당 rate 개의 토큰을 채우고, 최대 burst 개까지 모아두는 버킷
+- HostRateLimiter: URL의 호스트별로 독립된 TokenBucket을 관리
+
+스레드(acquire)와 asyncio(acquire_async) 양쪽에서 사용할 수 있습니다.
+
+사용 예:
+--------
+    limiter = HostRateLimiter(rate=2.0, burst=2)
+    limiter.acquire("https://www.pangeareptile.com/blogs/blog")       # 스레드
+    await limiter.acquire_async("https://www.pangeareptile.com/...")  # asyncio
+"""
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """초당 rate 개의 토큰이 채워지는 스레드 안전 토큰 버킷."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        토큰 1개를 예약하고, 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환.
+        토큰이 부족하면 음수 잔고로 예약하여 대기 순서를 보장한다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """토큰을 얻을 때까지 현재 스레드를 대기."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """토큰을 얻을 때까지 현재 코루틴을 대기 (이벤트 루프는 막지 않음)."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HostRateLimiter:
+    """URL 호스트별로 TokenBucket을 따로 두는 속도 제한기."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """URL의 호스트에 해당하는 버킷을 반환 (없으면 생성)."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> None:
+        self.bucket_for(url).acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        await self.bucket_for(url).acquire_async()
@@ -1,14 +1,28 @@
+import argparse
 import time
 import random
-import json
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import Comment, NavigableString, Tag
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+import browser_service
+import crawl_journal
+import hybrid_fetcher
+import page_archive
+import sitemap
+from crawl_frontier import CrawlFrontier
+from crawl_journal import CrawlJournal, write_json_stream
+from browser_utils import block_heavy_resources, build_chrome_options, wait_for_stable_value
+from html_parser import make_soup
 
 # 저장 경로 설정
 OUTPUT_DIR = "../src/constants"
@@ -17,50 +31,120 @@ OUTPUT_FILE = os.path.join(OUTPUT_DIR, "reptifiles_data.json")
 # 타겟 URL
 MAIN_URL = "https://reptifiles.com/crested-gecko-care/"
 
+# --base-url로 다른 서버(fixture_server.py)를 대상으로 할 때의 결과 저장 위치
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".replay")
+
+# 챕터 목록과 순서·제목은 가이드 메인 페이지의 링크를 따르고,
+# 메인 페이지에서 링크를 찾지 못할 때만 sitemap.xml을 사용 (제목은 챕터 페이지에서 읽음)
+USE_SITEMAP = True
+
+# 이 길이 미만의 본문은 JavaScript 렌더링이 필요한 것으로 보고 브라우저로 다시 수집
+MIN_CONTENT_LENGTH = 50
+
+# 본문에서 제거할 광고/공유 위젯 요소
+AD_SELECTORS = ['.adthrive-ad', '.sharedaddy', '.jp-relatedposts',
+                'script', 'style', '.widget', '.advertisement']
+
+# 본문에서 광고 요소를 제거한 뒤 [태그명, 보이는 텍스트] 목록을 반환하는 스크립트
+# (본문 영역이 없으면 null, 화면에 표시되지 않는 요소는 빈 문자열 - Selenium의 .text와 동일)
+# 제거할 셀렉터는 인자(arguments[0])로 AD_SELECTORS를 그대로 받음
+EXTRACT_BLOCKS_SCRIPT = """
+    const root = document.querySelector('.entry-content');
+    if (!root) return null;
+    const selectors = arguments[0];
+    selectors.forEach(sel => {
+        document.querySelectorAll(sel).forEach(el => el.remove());
+    });
+    return Array.from(root.querySelectorAll('p, h2, h3, li')).map(el => [
+        el.tagName.toLowerCase(),
+        el.getClientRects().length ? el.innerText : ''
+    ]);
+"""
+
+# 본문 렌더링 완료 판단에 사용할 블록 수
+CHAPTER_BLOCK_COUNT_SCRIPT = "return document.querySelectorAll('.entry-content p, .entry-content h2, .entry-content h3, .entry-content li').length;"
+
+# 챕터 페이지의 제목 (h1, 없으면 og:title) - chapter_title()과 같은 규칙
+CHAPTER_TITLE_SCRIPT = """
+    const heading = document.querySelector('h1.entry-title') || document.querySelector('h1');
+    if (heading && heading.innerText.trim()) return heading.innerText.trim();
+    const meta = document.querySelector("meta[property='og:title']");
+    return meta && meta.content ? meta.content.trim() : null;
+"""
+
+def use_base_url(base_url):
+    """
+    대상 사이트 주소를 바꿈 (fixture_server.py로 녹화된 페이지를 재생할 때)
+    실제 데이터를 덮어쓰지 않도록 결과와 수집 기록은 REPLAY_DIR에 저장하고, 보관소에는 저장하지 않음
+    """
+    global MAIN_URL, OUTPUT_DIR, OUTPUT_FILE
+    MAIN_URL = base_url.rstrip("/") + "/crested-gecko-care/"
+    OUTPUT_DIR = REPLAY_DIR
+    OUTPUT_FILE = os.path.join(REPLAY_DIR, os.path.basename(OUTPUT_FILE))
+    crawl_journal.JOURNAL_DIR = Path(REPLAY_DIR) / ".journal"
+    page_archive.ARCHIVE_ENABLED = False
+
 def setup_driver():
-    """Selenium 드라이버 설정"""
-    options = Options()
-    options.add_argument("--headless=new")  # 백그라운드 실행
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    """Selenium 드라이버 설정 (이미지·폰트·광고를 차단한 경량 프로필)"""
+    options = build_chrome_options()  # 백그라운드 실행
     
     # WebDriver 자동 설치 및 서비스 생성
-    service = Service(ChromeDriverManager().install())
+    service = Service(browser_service.driver_path())  # 경로 캐시 (매번 설치 확인 안 함)
     driver = webdriver.Chrome(service=service, options=options)
+    block_heavy_resources(driver)
     
     return driver
 
-def get_chapter_links(driver):
-    """메인 페이지에서 챕터 링크 수집"""
+def get_chapter_links_from_sitemap():
+    """
+    sitemap.xml에서 MAIN_URL 하위 챕터 링크 수집 (없으면 빈 리스트)
+    sitemap에는 제목이 없으므로 URL로 만든 임시 제목을 넣고, 챕터 페이지를 수집할 때 실제 제목으로 바꿈
+    """
+    print("🗺️  sitemap.xml에서 챕터 URL 찾는 중...")
+    entries = sitemap.discover(MAIN_URL, prefix=MAIN_URL)
+    return filter_chapter_links(
+        ((entry.url, sitemap.title_from_url(entry.url)) for entry in entries), title_from_page=True
+    )
+
+def get_chapter_links(pool):
+    """
+    챕터 링크 수집 (메인 페이지를 HTTP로, 링크를 못 찾으면 브라우저)
+    메인 페이지에서 챕터를 찾지 못하면 sitemap.xml 사용
+    """
+    links = get_chapter_links_from_main(pool)
+    if links or not USE_SITEMAP:
+        return links
+    
+    print("   메인 페이지에서 챕터를 찾지 못해 sitemap.xml에서 수집합니다.")
+    links = get_chapter_links_from_sitemap()
+    if links:
+        print(f"✅ 총 {len(links)}개의 유효한 챕터를 찾았습니다. (sitemap)")
+    return links
+
+def get_chapter_links_from_main(pool):
+    """메인 페이지의 챕터 링크를 페이지 순서대로 수집 (실패하면 빈 리스트)"""
     print(f"🕵️  메인 페이지 분석 중... ({MAIN_URL})")
     
-    try:
-        driver.get(MAIN_URL)
-        time.sleep(3)  # 페이지 로딩 대기
-        
-        # 메인 콘텐츠 영역에서 링크 찾기
-        links = []
-        content_links = driver.find_elements(By.CSS_SELECTOR, ".entry-content a")
-        
-        for link in content_links:
-            href = link.get_attribute("href")
-            text = link.text.strip()
+    def links_from_browser(url):
+        with pool.lease() as driver:
+            driver.get(url)
+            # 본문 링크 수가 더 이상 변하지 않을 때까지 대기 (고정 3초 대기 대체)
+            wait_for_stable_value(driver, "return document.querySelectorAll('.entry-content a').length;")
+            page_archive.store(url, driver.page_source)
             
-            # 유효한 챕터 링크만 필터링
-            if (
-                href and
-                'reptifiles.com/crested-gecko-care/' in href and
-                href != MAIN_URL and
-                'share=' not in href and
-                'jpg' not in href and
-                '#' not in href and
-                len(text) > 3
-            ):
-                if href not in [x['url'] for x in links]:
-                    links.append({"title": text, "url": href})
+            # 메인 콘텐츠 영역에서 링크 찾기
+            content_links = driver.find_elements(By.CSS_SELECTOR, ".entry-content a")
+            return filter_chapter_links(
+                (link.get_attribute("href"), link.text.strip()) for link in content_links
+            )
+    
+    try:
+        links = hybrid_fetcher.fetch_with_fallback(
+            MAIN_URL,
+            http_extract=extract_chapter_links,
+            browser_extract=links_from_browser,
+            is_sufficient=bool,
+        )
         
         print(f"✅ 총 {len(links)}개의 유효한 챕터를 찾았습니다.")
         return links
@@ -69,85 +153,263 @@ def get_chapter_links(driver):
         print(f"❌ 메인 페이지 접속 실패: {e}")
         return []
 
-def get_chapter_content(driver, url):
-    """챕터 페이지에서 본문 콘텐츠 추출"""
+def extract_chapter_links(soup):
+    """메인 페이지 HTML에서 챕터 링크 추출"""
+    return filter_chapter_links(
+        (urljoin(MAIN_URL, link["href"]), visible_text(link))
+        for link in soup.select(".entry-content a[href]")
+    )
+
+def filter_chapter_links(raw_links, **data):
+    """
+    (href, 링크 텍스트) 목록에서 유효한 챕터 링크만 골라 URL 정규화 후 중복 없이 반환
+    data는 각 항목에 함께 기록 (예: title_from_page=True)
+    """
+    frontier = CrawlFrontier(trailing_slash=True)
+    main_url = frontier.canonical(MAIN_URL)
+    
+    for href, text in raw_links:
+        # 유효한 챕터 링크만 필터링
+        if (
+            href and
+            MAIN_URL.split("://", 1)[1] in href and  # reptifiles.com/crested-gecko-care/ 하위 페이지
+            'share=' not in href and
+            'jpg' not in href and
+            '#' not in href and
+            len(text) > 3 and
+            frontier.canonical(href) != main_url
+        ):
+            frontier.add(href, title=text, **data)
+    
+    return frontier.items()
+
+def visible_text(elem):
+    """
+    BeautifulSoup 요소의 텍스트를 브라우저의 innerText와 비슷하게 변환
+    (소스 줄바꿈·연속 공백은 공백 하나로, <br>은 줄바꿈으로)
+    """
+    parts = []
+    for node in elem.descendants:
+        if isinstance(node, Tag):
+            if node.name == "br":
+                parts.append("\n")
+        elif isinstance(node, NavigableString) and not isinstance(node, Comment):
+            parts.append(re.sub(r"\s+", " ", str(node)))
+    
+    lines = "".join(parts).split("\n")
+    return "\n".join(" ".join(line.split()) for line in lines).strip()
+
+def chapter_title(soup):
+    """챕터 페이지의 제목 (h1, 없으면 og:title, 둘 다 없으면 None)"""
+    heading = soup.select_one("h1.entry-title") or soup.find("h1")
+    if heading:
+        text = visible_text(heading)
+        if text:
+            return text
+    meta = soup.select_one("meta[property='og:title']")
+    return meta["content"].strip() if meta and meta.get("content") else None
+
+def blocks_from_soup(soup):
+    """HTTP로 받은 HTML에서 광고를 제거하고 (태그, 텍스트) 목록 추출 (본문 영역이 없으면 None)"""
+    root = soup.select_one(".entry-content")
+    if root is None:
+        return None
+    
+    for selector in AD_SELECTORS:
+        for elem in root.select(selector):
+            elem.decompose()
+    
+    return [(elem.name, visible_text(elem)) for elem in root.select("p, h2, h3, li")]
+
+def format_blocks(blocks):
+    """(태그, 텍스트) 목록을 마크다운 본문으로 변환 (비어 있으면 None)"""
+    if blocks is None:
+        return None
+    
+    # 텍스트 정리 (p, h2, h3, li 태그)
+    paragraphs = []
+    
+    for tag_name, text in blocks:
+        text = text.strip()
+        if len(text) > 1:
+            if tag_name in ['h2', 'h3']:
+                paragraphs.append(f"\n## {text}\n")
+            elif tag_name == 'li':
+                paragraphs.append(f"- {text}")
+            else:
+                paragraphs.append(text)
+    
+    content = "\n\n".join(paragraphs)
+    return content if content else None
+
+def get_chapter_content(pool, url):
+    """챕터 페이지에서 (본문, 제목) 추출 (HTTP 우선, 본문이 부족하면 브라우저)"""
+    
+    def content_from_soup(soup):
+        title = chapter_title(soup)  # 광고 제거 전에 읽음
+        return format_blocks(blocks_from_soup(soup)), title
+    
+    def content_from_browser(url):
+        with pool.lease() as driver:
+            driver.get(url)
+            # 본문 블록 수가 더 이상 변하지 않을 때까지 대기 (고정 2~4초 대기 대체)
+            wait_for_stable_value(driver, CHAPTER_BLOCK_COUNT_SCRIPT)
+            page_archive.store(url, driver.page_source)
+            
+            # 광고 제거 + (태그, 텍스트) 추출을 한 번의 execute_script로 처리
+            # (요소마다 .text / .tag_name을 호출하면 chromedriver 왕복이 수천 번 발생)
+            title = driver.execute_script(CHAPTER_TITLE_SCRIPT)
+            blocks = driver.execute_script(EXTRACT_BLOCKS_SCRIPT, AD_SELECTORS)
+        if blocks is None:
+            print("   ⚠️ 본문 영역을 찾을 수 없습니다.")
+        return format_blocks(blocks), title
+    
     try:
         print(f"   📖 Reading: {url[:60]}...")
-        driver.get(url)
-        time.sleep(random.uniform(2, 4))  # 랜덤 대기
-        
-        # 본문 영역 찾기
-        try:
-            content_div = driver.find_element(By.CSS_SELECTOR, ".entry-content")
-        except:
-            print("   ⚠️ 본문 영역을 찾을 수 없습니다.")
-            return None
-        
-        # JavaScript로 광고 요소 제거
-        driver.execute_script("""
-            const selectors = ['.adthrive-ad', '.sharedaddy', '.jp-relatedposts', 
-                               'script', 'style', '.widget', '.advertisement'];
-            selectors.forEach(sel => {
-                document.querySelectorAll(sel).forEach(el => el.remove());
-            });
-        """)
-        
-        # 텍스트 추출 (p, h2, h3, li 태그)
-        paragraphs = []
-        elements = content_div.find_elements(By.CSS_SELECTOR, "p, h2, h3, li")
-        
-        for elem in elements:
-            text = elem.text.strip()
-            if len(text) > 1:
-                tag_name = elem.tag_name.lower()
-                if tag_name in ['h2', 'h3']:
-                    paragraphs.append(f"\n## {text}\n")
-                elif tag_name == 'li':
-                    paragraphs.append(f"- {text}")
-                else:
-                    paragraphs.append(text)
-        
-        content = "\n\n".join(paragraphs)
-        return content if content else None
+        return hybrid_fetcher.fetch_with_fallback(
+            url,
+            http_extract=content_from_soup,
+            browser_extract=content_from_browser,
+            is_sufficient=lambda result: bool(result[0]) and len(result[0]) >= MIN_CONTENT_LENGTH,
+        )
         
     except Exception as e:
         print(f"   ❌ 에러 발생: {e}")
+        return None, None
+
+def chapter_record(item, content, title=None):
+    """챕터 레코드 (sitemap으로 찾은 챕터는 페이지에서 읽은 제목을 사용)"""
+    if item.get('title_from_page') and title:
+        return {"chapter": title, "url": item['url'], "content": content}
+    return {"chapter": item['title'], "url": item['url'], "content": content}
+
+def reextract_chapter(item):
+    """보관된 챕터 HTML에서 챕터 레코드를 다시 추출 (작업 프로세스에서 실행)"""
+    html = page_archive.load(item['url'])
+    if html is None:
         return None
+    soup = make_soup(html)
+    title = chapter_title(soup)
+    content = format_blocks(blocks_from_soup(soup))
+    return chapter_record(item, content, title) if content else None
+
+def reextract_chapters(journal):
+    """브라우저·네트워크 없이 보관소의 HTML만으로 챕터 데이터를 다시 추출 (CPU 코어 수만큼 병렬)"""
+    print(f"🗄️  보관소에서 재추출 중... ({page_archive.ARCHIVE_DIR}, {page_archive.size()}개 URL)")
+    
+    html = page_archive.load(MAIN_URL)
+    if html is not None:
+        links = extract_chapter_links(make_soup(html))
+    else:
+        # 메인 페이지 없이 sitemap으로 수집한 경우 보관된 챕터 URL을 사용 (제목은 챕터 페이지에서)
+        links = filter_chapter_links(
+            ((url, sitemap.title_from_url(url)) for url in page_archive.urls(prefix=MAIN_URL)),
+            title_from_page=True,
+        )
+    
+    if not links:
+        print("❌ 보관된 챕터가 없습니다. 먼저 일반 모드로 수집하세요.")
+        return []
+    pending = [item for item in links if item['url'] not in journal]
+    with ProcessPoolExecutor() as executor:
+        for record in executor.map(reextract_chapter, pending):
+            if record:
+                journal.append(record)
+    
+    print(f"✅ {sum(item['url'] in journal for item in links)}/{len(links)}개 챕터 재추출 완료")
+    return links
+
+def save_chapters(journal, links):
+    """journal에 기록된 챕터를 링크 순서대로 JSON 파일로 저장 (한 건씩 읽어 기록)"""
+    urls = [item['url'] for item in links if item['url'] in journal]
+    header = {"source": "ReptiFiles", "source_url": MAIN_URL}
+    write_json_stream(OUTPUT_FILE, header, "chapters", (journal.get(url) for url in urls), len(urls))
+    journal.remove()
+    
+    print(f"\n{'=' * 60}")
+    print(f"🎉 완료! {len(urls)}개의 챕터가 저장되었습니다.")
+    print(f"📁 파일 위치: {OUTPUT_FILE}")
+    print("=" * 60)
 
 def main():
+    parser = argparse.ArgumentParser(description="ReptiFiles Crested Gecko Care Guide Scraper")
+    parser.add_argument(
+        "--reextract",
+        action="store_true",
+        help="브라우저·네트워크 없이 보관된 HTML(.page_archive)로 reptifiles_data.json을 다시 생성",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="중단된 이전 실행의 기록(.journal)을 이어받아 이미 수집한 챕터는 건너뜀",
+    )
+    parser.add_argument(
+        "--base-url",
+        help="사이트 주소 대신 사용할 서버 (예: fixture_server.py의 http://127.0.0.1:8003)",
+    )
+    parser.add_argument(
+        "--browser-service",
+        nargs="?",
+        const=browser_service.DEFAULT_ADDRESS,
+        metavar="HOST:PORT",
+        help=f"browser_service.py로 띄워 둔 Chrome의 탭을 사용 (주소 생략 시 {browser_service.DEFAULT_ADDRESS})",
+    )
+    args = parser.parse_args()
+    
+    if args.base_url:
+        use_base_url(args.base_url)
+        print(f"[INFO] 대상 서버: {MAIN_URL} (결과 저장: {OUTPUT_FILE})")
+    
     # 저장 폴더 확인
     if not os.path.exists(OUTPUT_DIR):
         os.makedirs(OUTPUT_DIR)
     
+    # 챕터는 수집 즉시 journal에 기록되고, 마지막에 결과 파일로 정리된다
+    journal = CrawlJournal("reptifiles_data", resume=args.resume)
+    
+    if args.reextract:
+        links = reextract_chapters(journal)
+        if links:
+            save_chapters(journal, links)
+        journal.close()
+        return
+    
     print("=" * 60)
     print("🦎 ReptiFiles Crested Gecko Care Guide Scraper (Selenium)")
     print("=" * 60)
     
-    # Selenium 드라이버 시작
-    print("\n🚀 Chrome 드라이버 초기화 중...")
-    driver = setup_driver()
+    # Selenium 드라이버는 HTTP로 본문을 얻지 못한 페이지가 있을 때만 시작
+    # (--browser-service면 상주 Chrome의 탭을 빌림)
+    pool = browser_service.service_pool(setup_driver, 1, args.browser_service)
     
     try:
-        # 챕터 링크 수집
-        links = get_chapter_links(driver)
+        # 챕터 링크 수집 (--resume이면 저장해 둔 목록 사용)
+        frontier_file = journal.companion("frontier")
+        saved = CrawlFrontier.load(frontier_file) if journal.resumed else None
+        if saved:
+            links = saved.items()
+            print(f"📋 저장된 챕터 목록 사용 ({len(links)}개, 링크 수집 생략)")
+        else:
+            links = get_chapter_links(pool)
         if not links:
             print("수집할 링크가 없어 종료합니다.")
             return
+        if not saved:
+            CrawlFrontier.of(links, trailing_slash=True).save(frontier_file)
         
-        collected_data = []
         print("\n📚 상세 내용 수집 시작...")
         
         for idx, item in enumerate(links):
+            if item['url'] in journal:
+                print(f"\n[{idx+1}/{len(links)}] {item['title']} - 이미 수집됨 (건너뜀)")
+                continue
+            
             print(f"\n[{idx+1}/{len(links)}] {item['title']} 수집 중")
             
-            content = get_chapter_content(driver, item['url'])
+            content, title = get_chapter_content(pool, item['url'])
             
             if content:
-                collected_data.append({
-                    "chapter": item['title'],
-                    "url": item['url'],
-                    "content": content
-                })
+                journal.append(chapter_record(item, content, title))
                 print(f"   ✨ 수집 성공 ({len(content):,}자)")
             else:
                 print("   🧨 수집 실패")
@@ -157,23 +419,12 @@ def main():
             time.sleep(delay)
         
         # JSON 저장
-        output_data = {
-            "source": "ReptiFiles",
-            "source_url": MAIN_URL,
-            "total_chapters": len(collected_data),
-            "chapters": collected_data
-        }
-        
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"\n{'=' * 60}")
-        print(f"🎉 완료! {len(collected_data)}개의 챕터가 저장되었습니다.")
-        print(f"📁 파일 위치: {OUTPUT_FILE}")
-        print("=" * 60)
+        save_chapters(journal, links)
         
     finally:
-        driver.quit()
+        journal.close()
+        pool.close()
+        hybrid_fetcher.report()
         print("🔒 브라우저 종료")
 
 if __name__ == "__main__":
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Selector Cache - 셀렉터 캐스케이드 학습 캐시
+===========================================
+스크래퍼들은 사이트 구조 변화에 대비해 여러 셀렉터를 순서대로 시도합니다
+(content_selectors, desc_selectors, type_selectors 등).
+같은 사이트의 같은 페이지 템플릿에서는 보통 같은 셀렉터가 성공하므로,
+마지막으로 성공한 셀렉터를 기억해 두었다가 먼저 시도합니다.
+그 셀렉터가 더 이상 맞지 않으면 원래 순서의 전체 캐스케이드로 돌아갑니다.
+학습된 셀렉터는 힌트일 뿐이며, 원래 순서에서 더 앞선 셀렉터가 맞으면 항상 그쪽이 이깁니다
+(예: 한 번 일반적인 "article"이 이겼다고 해서 ".rte"가 있는 페이지에서 "article"을 쓰지 않음).
+
+- 키: 캐스케이드 이름 + 도메인 + 페이지 템플릿 (경로의 마지막 부분을 *로 치환)
+- 저장 위치: scripts/.selector_stats.json (실행 간 유지)
+
+사용 예:
+--------
+    selector, elem = selector_cache.run_cascade(
+        "pangea:content", content_selectors,
+        lambda selector: soup.select_one(selector), url=url,
+    )
+    ...
+    selector_cache.save()
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlparse
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+STATS_FILE = SCRIPT_DIR / ".selector_stats.json"
+
+_stats: dict | None = None
+_lock = threading.Lock()
+_run_counts = {"cascades": 0, "first_try_hits": 0, "evaluations": 0}
+
+
+def _load() -> dict:
+    """저장된 통계를 읽음 (최초 1회)."""
+    global _stats
+    if _stats is None:
+        try:
+            with open(STATS_FILE, "r", encoding="utf-8") as f:
+                _stats = json.load(f)
+        except (OSError, ValueError):
+            _stats = {}
+    return _stats
+
+
+def template_key(name: str, url: str | None) -> str:
+    """
+    캐스케이드 이름과 URL로 통계 키를 생성.
+    예: ("pangea:content", "https://www.pangeareptile.com/blogs/blog/post-1")
+        -> "pangea:content@www.pangeareptile.com/blogs/blog/*"
+    """
+    if not url:
+        return name
+    parsed = urlparse(url)
+    segments = [segment for segment in parsed.path.split("/") if segment]
+    if len(segments) > 1:
+        segments[-1] = "*"
+    return f"{name}@{parsed.netloc.lower()}/{'/'.join(segments)}"
+
+
+def ordered_selectors(key: str, selectors: list[str]) -> list[str]:
+    """학습된 셀렉터를 맨 앞에 두고 나머지는 원래 순서대로 반환 (시도 순서일 뿐, 우선순위는 바뀌지 않음)."""
+    with _lock:
+        winner = _load().get(key, {}).get("winner")
+    if winner in selectors:
+        return [winner] + [selector for selector in selectors if selector != winner]
+    return list(selectors)
+
+
+def record_hit(key: str, selector: str) -> None:
+    """selector가 유효한 결과를 만들었음을 기록 (다음부터 먼저 시도)."""
+    with _lock:
+        entry = _load().setdefault(key, {"winner": None, "hits": {}})
+        entry["winner"] = selector
+        entry["hits"][selector] = entry["hits"].get(selector, 0) + 1
+
+
+def run_cascade(name: str, selectors: list[str], try_selector: Callable,
+                url: str | None = None):
+    """
+    학습된 순서로 셀렉터를 시도하여 (성공한 셀렉터, 결과)를 반환.
+    try_selector(selector)가 None이 아닌 값을 반환하면 성공으로 본다.
+    학습된 셀렉터가 성공해도 원래 순서에서 그보다 앞선 셀렉터가 성공하면 그쪽을 사용하므로,
+    결과는 원래 순서의 캐스케이드와 같다 (수집 순서나 이전 실행에 따라 달라지지 않음).
+    모두 실패하면 (None, None).
+    """
+    key = template_key(name, url)
+    order = ordered_selectors(key, selectors)
+    tried: set[str] = set()
+    found = None
+
+    for selector in order:
+        tried.add(selector)
+        result = try_selector(selector)
+        if result is not None:
+            found = (selector, result)
+            break
+
+    if found is not None:
+        # 앞당겨 시도한 학습 셀렉터가 성공한 경우, 원래 순서상 앞선 셀렉터를 확인
+        for selector in selectors[:selectors.index(found[0])]:
+            if selector in tried:
+                continue
+            tried.add(selector)
+            result = try_selector(selector)
+            if result is not None:
+                found = (selector, result)
+                break
+        record_hit(key, found[0])
+
+    with _lock:
+        _run_counts["cascades"] += 1
+        _run_counts["evaluations"] += len(tried)
+        _run_counts["first_try_hits"] += found is not None and found[0] == order[0]
+    return found or (None, None)
+
+
+def save() -> None:
+    """학습된 셀렉터 통계를 파일에 저장."""
+    with _lock:
+        if not _stats:
+            return
+        try:
+            with open(STATS_FILE, "w", encoding="utf-8") as f:
+                json.dump(_stats, f, ensure_ascii=False, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"[WARNING] 셀렉터 통계 저장 실패: {type(e).__name__}: {e}")
+
+
+def report() -> None:
+    """이번 실행의 셀렉터 캐스케이드 통계를 출력."""
+    with _lock:
+        cascades = _run_counts["cascades"]
+        if not cascades:
+            return
+        print(f"\n🎯 셀렉터 캐스케이드: {cascades}회 실행, 셀렉터 평가 {_run_counts['evaluations']}회, "
+              f"첫 시도 적중 {_run_counts['first_try_hits']}회")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sitemap - sitemap.xml 기반 URL 발견
+===================================
+목록 페이지를 렌더링하거나 링크를 긁는 대신, 사이트가 공개한 sitemap.xml에서
+수집 대상 URL과 lastmod(최종 수정 시각)를 읽습니다.
+
+- robots.txt의 "Sitemap:" 항목을 먼저 찾고, 없으면 /sitemap.xml을 사용
+- sitemap 색인(<sitemapindex>)은 하위 sitemap을 따라감 (follow로 이름 필터 가능)
+- XML은 iterparse로 스트리밍 처리하여 큰 sitemap도 메모리에 다 올리지 않음 (.gz 지원)
+- prefix로 시작하는 URL만 반환 (중복 제거, sitemap 순서 유지)
+
+읽은 robots.txt와 sitemap은 page_archive에 보관되어 fixture_server가 그대로 재생할 수 있습니다.
+
+sitemap을 찾지 못하거나 읽을 수 없으면 빈 목록을 반환하므로, 스크래퍼는
+기존 링크 수집 방식으로 돌아가면 됩니다.
+
+사용 예:
+--------
+    entries = sitemap.discover("https://www.pangeareptile.com",
+                               prefix="https://www.pangeareptile.com/blogs/blog/",
+                               follow="sitemap_blogs")
+    for entry in entries:
+        entry.url, entry.lastmod   # lastmod: datetime (로컬 시각, 없으면 None)
+"""
+
+import gzip
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+import http_client
+import page_archive
+
+MAX_SITEMAPS = 50  # 따라갈 최대 sitemap 파일 수 (색인 순환 방지)
+
+
+@dataclass
+class SitemapEntry:
+    url: str
+    lastmod: datetime | None = None
+
+
+class _RecordingReader:
+    """파서가 읽은 바이트를 함께 모아 두는 파일 래퍼 (스트리밍 파싱한 sitemap을 보관하기 위함)."""
+
+    def __init__(self, source):
+        self.source = source
+        self.chunks: list[bytes] = []
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.source.read(size)
+        self.chunks.append(data)
+        return data
+
+    def text(self) -> str:
+        return b"".join(self.chunks).decode("utf-8", errors="replace")
+
+
+def _local_name(tag: str) -> str:
+    """'{http://www.sitemaps.org/schemas/sitemap/0.9}loc' -> 'loc'"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_lastmod(value: str | None) -> datetime | None:
+    """W3C 날짜/시각 문자열을 로컬 시각 기준 datetime(시간대 정보 없음)으로 변환."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def title_from_url(url: str) -> str:
+    """URL 마지막 경로로 임시 제목 생성 (예: .../crested-gecko-diet/ -> 'Crested Gecko Diet')."""
+    slug = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+    return re.sub(r"[-_]+", " ", slug).strip().title() or url
+
+
+def sitemap_urls(site_url: str) -> list[str]:
+    """robots.txt에 등록된 sitemap 주소 목록 (없으면 /sitemap.xml)."""
+    robots_url = urljoin(site_url, "/robots.txt")
+    try:
+        robots = http_client.get_text(robots_url)
+        page_archive.store(robots_url, robots)
+    except requests.RequestException:
+        robots = ""
+
+    urls = []
+    for line in robots.splitlines():
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "sitemap" and value.strip():
+            urls.append(urljoin(site_url, value.strip()))
+    return urls or [urljoin(site_url, "/sitemap.xml")]
+
+
+def _iter_elements(url: str) -> Iterator[tuple[str, str | None, str | None]]:
+    """
+    sitemap 하나를 스트리밍 파싱하여 (요소 종류, loc, lastmod)를 차례로 반환.
+    요소 종류는 "url"(페이지) 또는 "sitemap"(색인의 하위 sitemap).
+    """
+    response = http_client.get(url, stream=True)
+    try:
+        response.raw.decode_content = True  # Content-Encoding: gzip 해제
+        source = response.raw
+        if url.endswith(".gz") or response.headers.get("Content-Type", "").endswith("gzip"):
+            source = gzip.GzipFile(fileobj=response.raw)
+        recorder = _RecordingReader(source) if page_archive.ARCHIVE_ENABLED else None
+
+        root = None
+        fields: dict[str, str] = {}
+        for event, elem in ET.iterparse(recorder or source, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event != "end":
+                continue
+            name = _local_name(elem.tag)
+            if name in ("loc", "lastmod"):
+                fields.setdefault(name, (elem.text or "").strip())  # <image:loc> 등 하위 요소는 무시
+            elif name in ("url", "sitemap"):
+                yield name, fields.get("loc"), fields.get("lastmod")
+                fields = {}
+                root.clear()  # 처리한 항목을 트리에서 제거하여 메모리 일정 유지
+        if recorder:
+            page_archive.store(url, recorder.text())  # 압축을 푼 XML로 보관
+    finally:
+        response.close()
+
+
+def iter_entries(sitemap_url: str, prefix: str | None = None,
+                 follow: str | None = None) -> Iterator[SitemapEntry]:
+    """
+    sitemap(또는 sitemap 색인)을 따라가며 prefix로 시작하는 페이지 항목을 반환.
+    follow가 주어지면 이름에 follow가 들어간 하위 sitemap만 따라간다
+    (해당하는 하위 sitemap이 하나도 없으면 전부 따라감).
+    """
+    pending = [sitemap_url]
+    visited = set()
+
+    while pending and len(visited) < MAX_SITEMAPS:
+        url = pending.pop(0)
+        if url in visited:
+            continue
+        visited.add(url)
+
+        children = []
+        try:
+            for kind, loc, lastmod in _iter_elements(url):
+                if not loc:
+                    continue
+                if kind == "sitemap":
+                    children.append(loc)
+                elif prefix is None or loc.startswith(prefix):
+                    yield SitemapEntry(loc, parse_lastmod(lastmod))
+        except (requests.RequestException, ET.ParseError) as e:
+            # 하위 sitemap 하나가 실패해도 나머지는 계속 읽음
+            print(f"[SITEMAP] 읽기 실패: {url} ({type(e).__name__}: {e})")
+
+        if follow:
+            children = [child for child in children if follow in child] or children
+        pending.extend(children)
+
+
+def discover(site_url: str, prefix: str | None = None, follow: str | None = None) -> list[SitemapEntry]:
+    """
+    사이트의 sitemap에서 prefix로 시작하는 URL 항목을 중복 없이 반환.
+    sitemap이 없거나 읽을 수 없으면 빈 목록 (호출 측에서 링크 수집으로 대체).
+    """
+    entries = []
+    seen = set()
+    for sitemap_url in sitemap_urls(site_url):
+        for entry in iter_entries(sitemap_url, prefix, follow):
+            if entry.url not in seen:
+                seen.add(entry.url)
+                entries.append(entry)
+
+    if entries:
+        dated = sum(entry.lastmod is not None for entry in entries)
+        print(f"[SITEMAP] {len(entries)}개 URL 발견 (lastmod {dated}개)")
+    return entries
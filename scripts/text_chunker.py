@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Text Chunker - 문단을 보존하는 번역 요청 분할기
+===============================================
+긴 텍스트를 번역 API의 요청당 글자 수 제한(max_length) 안에서 최대한 꽉 채운 청크로 나눕니다.
+
+- 문단(줄바꿈) 단위로 먼저 채우고, 한 문단이 max_length를 넘을 때만 문장 단위로,
+  문장도 넘으면 공백(없으면 글자 수) 기준으로 나눔
+- [NEWLINE] 같은 표시를 끼워 넣지 않음: 줄바꿈은 청크 안에 그대로 두고,
+  청크 경계에 있던 원래 구분자("\\n", " " 등)는 따로 돌려주어 번역 후 그대로 이어 붙임
+- iter_sentences(): 청크로 채우지 않고 문장 단위 조각을 그대로 반환 (문장별 재사용 등)
+- 청크는 제너레이터로 하나씩 만들어짐 (전체 목록을 미리 만들지 않음).
+  단, ThreadPoolExecutor.map에 넘기면 map이 모든 청크를 한 번에 제출하므로
+  그 경우에는 청크 수만큼의 작업(future)이 동시에 존재함
+
+사용 예:
+--------
+    translated, separators = [], []
+    for chunk, separator in iter_chunks(text, 4500):  # (청크, 뒤 구분자)를 하나씩
+        translated.append(translate(chunk))
+        separators.append(separator)
+    result = join_chunks(translated, separators)
+"""
+
+import re
+from typing import Iterable, Iterator
+
+PARAGRAPH_SPLIT = re.compile(r"(\s*\n\s*)")
+# 문장 끝(. ! ?, 닫는 따옴표·괄호 포함) 뒤의 공백
+SENTENCE_END = re.compile(r"[.!?][\"'”’)\]]*(\s+)")
+
+
+def split_paragraphs(text: str) -> Iterator[tuple[str, str]]:
+    """(문단, 뒤 구분자) 순서대로 반환. 구분자는 줄바꿈을 포함한 원래 공백 그대로."""
+    parts = PARAGRAPH_SPLIT.split(text)
+    for index in range(0, len(parts), 2):
+        separator = parts[index + 1] if index + 1 < len(parts) else ""
+        if parts[index] or separator:
+            yield parts[index], separator
+
+
+def split_sentences(paragraph: str) -> Iterator[tuple[str, str]]:
+    """(문장, 뒤 공백) 순서대로 반환."""
+    start = 0
+    for match in SENTENCE_END.finditer(paragraph):
+        yield paragraph[start:match.start(1)], match.group(1)
+        start = match.end(1)
+    if start < len(paragraph):
+        yield paragraph[start:], ""
+
+
+def split_words(sentence: str, max_length: int) -> Iterator[tuple[str, str]]:
+    """max_length를 넘는 문장을 마지막 공백 기준으로 (없으면 글자 수로) 나눔."""
+    while len(sentence) > max_length:
+        cut = sentence.rfind(" ", 0, max_length + 1)
+        if cut <= 0:
+            yield sentence[:max_length], ""
+            sentence = sentence[max_length:]
+        else:
+            yield sentence[:cut], " "
+            sentence = sentence[cut + 1:]
+    yield sentence, ""
+
+
+def iter_segments(text: str, max_length: int) -> Iterator[tuple[str, str]]:
+    """max_length 이하의 (조각, 뒤 구분자)를 순서대로 반환. 가능한 한 큰 단위(문단)를 유지."""
+    for paragraph, paragraph_sep in split_paragraphs(text):
+        if len(paragraph) <= max_length:
+            yield paragraph, paragraph_sep
+        else:
+            yield from _sentence_pieces(paragraph, paragraph_sep, max_length)
+
+
+def iter_sentences(text: str, max_length: int) -> Iterator[tuple[str, str]]:
+    """
+    문단 길이와 관계없이 문장 단위 (조각, 뒤 구분자)를 순서대로 반환
+    (max_length를 넘는 문장만 단어 단위로 나눔). 이어 붙이면 원문과 같다.
+    """
+    for paragraph, paragraph_sep in split_paragraphs(text):
+        yield from _sentence_pieces(paragraph, paragraph_sep, max_length)
+
+
+def _sentence_pieces(paragraph: str, paragraph_sep: str, max_length: int) -> list[tuple[str, str]]:
+    """문단을 max_length 이하의 문장 조각으로 나누고, 마지막 조각 뒤에 문단 구분자를 붙임."""
+    pieces = [
+        (piece, piece_sep)
+        for sentence, sentence_sep in split_sentences(paragraph)
+        for piece, piece_sep in _with_last(split_words(sentence, max_length), sentence_sep)
+    ]
+    if not pieces:
+        return [(paragraph, paragraph_sep)]
+    # 문단 끝 공백(마지막 문장 뒤 구분자)을 덮어쓰지 않도록 문단 구분자를 뒤에 이어 붙임
+    last_piece, last_sep = pieces[-1]
+    pieces[-1] = (last_piece, last_sep + paragraph_sep)
+    return pieces
+
+
+def _with_last(pairs: Iterable[tuple[str, str]], separator: str) -> Iterator[tuple[str, str]]:
+    """마지막 (조각, 구분자)의 구분자를 separator로 바꿔서 반환."""
+    previous = None
+    for pair in pairs:
+        if previous is not None:
+            yield previous
+        previous = pair
+    if previous is not None:
+        yield previous[0], separator
+
+
+def iter_chunks(text: str, max_length: int) -> Iterator[tuple[str, str]]:
+    """
+    text를 max_length 이하의 청크로 채워 (청크, 뒤 구분자)를 하나씩 반환.
+    청크 안의 문단 / 문장 구분자는 원래대로 유지되며,
+    모든 청크와 구분자를 이어 붙이면 원문과 같다.
+    """
+    parts: list[str] = []
+    size = 0
+    pending_sep = ""
+    for piece, separator in iter_segments(text, max_length):
+        if parts and size + len(pending_sep) + len(piece) > max_length:
+            yield "".join(parts), pending_sep
+            parts, size, pending_sep = [], 0, ""
+        if parts:
+            parts.append(pending_sep)
+            size += len(pending_sep)
+        parts.append(piece)
+        size += len(piece)
+        pending_sep = separator
+    if parts:
+        yield "".join(parts), pending_sep
+
+
+def join_chunks(translated: Iterable[str], separators: Iterable[str]) -> str:
+    """번역된 청크를 원래 경계 구분자로 이어 붙임."""
+    return "".join(chunk.strip() + separator for chunk, separator in zip(translated, separators))
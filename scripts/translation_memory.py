@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Translation Memory - 번역 결과 SQLite 캐시
+=========================================
+korean_patch가 같은 영어 원문을 실행할 때마다 다시 번역하지 않도록,
+번역 결과를 (원문, 원본 언어, 대상 언어, 용어 사전 버전)의 해시로 저장합니다.
+
+- 캐시에 있으면 번역 API를 전혀 호출하지 않음
+- 용어 사전(REPTILE_GLOSSARY)이 바뀌면 버전이 달라져 자동으로 다시 번역됨
+- 조회/저장 횟수 통계 (report)
+- evict(): 마지막 사용 후 max_age_days가 지난 항목 삭제 (원문이 바뀌어 더 이상 쓰이지 않는 번역)
+- 스레드 안전 (연결 하나를 잠금으로 보호)
+
+사용 예:
+--------
+    tm = TranslationMemory(glossary_version=glossary_version(REPTILE_GLOSSARY))
+    cached = tm.get(text, "en", "ko")
+    if cached is None:
+        cached = translate(text)
+        tm.put(text, cached, "en", "ko")
+    tm.evict()
+    tm.report()
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+TM_FILE = SCRIPT_DIR / ".translation_memory.sqlite3"
+TM_MAX_AGE_DAYS = 90  # 이 기간 동안 한 번도 쓰이지 않은 번역은 삭제
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key        TEXT PRIMARY KEY,
+    source     TEXT NOT NULL,
+    target     TEXT NOT NULL,
+    glossary   TEXT NOT NULL,
+    text       TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used);
+"""
+
+
+def glossary_version(glossary: dict) -> str:
+    """용어 사전 내용의 해시 (항목이 바뀌면 달라짐)."""
+    payload = json.dumps(glossary, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+class TranslationMemory:
+    """(원문, 언어 쌍, 용어 사전 버전) -> 번역 결과를 저장하는 SQLite 캐시."""
+
+    def __init__(self, path: Path | None = None, glossary_version: str = ""):
+        self.path = Path(path or TM_FILE)
+        self.glossary_version = glossary_version
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.saved_chars = 0  # 캐시 적중으로 번역하지 않은 원문 글자 수
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def key(self, text: str, source: str, target: str) -> str:
+        payload = "\0".join((source, target, self.glossary_version, text)).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, text: str, source: str, target: str) -> str | None:
+        """저장된 번역 (없으면 None). 적중한 항목은 마지막 사용 시각을 갱신."""
+        key = self.key(text, source, target)
+        with self._lock:
+            row = self._conn.execute("SELECT translated FROM translations WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE translations SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.hits += 1
+            self.saved_chars += len(text)
+            return row[0]
+
+    def put(self, text: str, translated: str, source: str, target: str) -> None:
+        """번역 결과 저장 (같은 키가 있으면 교체)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.key(text, source, target), source, target, self.glossary_version,
+                 text, translated, now, now),
+            )
+            self._conn.commit()
+            self.stored += 1
+
+    def evict(self, max_age_days: float = TM_MAX_AGE_DAYS) -> int:
+        """마지막 사용 후 max_age_days가 지난 항목을 삭제하고 삭제한 수를 반환."""
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM translations WHERE last_used < ?", (cutoff,)).rowcount
+            self._conn.commit()
+        if deleted:
+            print(f"[TM] 오래 사용하지 않은 번역 {deleted}개 삭제 ({max_age_days:g}일 기준)")
+        return deleted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def report(self) -> None:
+        """조회 통계 출력."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return
+        print(f"📊 번역 메모리: 적중 {self.hits}/{lookups}회 ({self.hits / lookups:.0%}), "
+              f"신규 저장 {self.stored}개, 번역 생략 {self.saved_chars:,}자, 전체 {len(self)}개 항목")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()